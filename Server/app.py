@@ -1,20 +1,54 @@
-from flask import Flask, request, jsonify, send_file, render_template
+import os
+
+# Opt-in report of what the worker spends its startup time and memory importing
+if os.environ.get('IMPORT_REPORT') == '1':
+    import import_report
+    import_report.install()
+
+from flask import Flask, request, jsonify, send_file, render_template, Response, stream_with_context, g, has_request_context
 from flask_cors import CORS
 from flask_sqlalchemy import SQLAlchemy
-from datetime import datetime
-import os
+from datetime import datetime, timedelta, timezone
 from werkzeug.exceptions import BadRequest
 import logging
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+import base64
+import csv
+import hashlib
+import html
 import io
+import json
+import math
+import re
+import tempfile
+import time
+from sqlalchemy import event, inspect as sqlalchemy_inspect
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects import mysql as mysql_dialect
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+from urllib.parse import urlencode
+from sqlalchemy.pool import QueuePool
+from export_cache import SnapshotCache, make_etag
+from compression import SUFFIXES, compress, compress_stream, negotiate_encoding
+from local_store import LocalStore, default_store_path
+from metrics import Metrics
+from excel_regenerator import ExcelRegenerator
+from group_commit import GroupCommitter
+from rate_limit import TokenBucketLimiter
+from json_provider import FastJSONProvider
+from validation import Choice, Derived, Email, Rating, Text, compile_validator
+from operator import attrgetter
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Caches, counters and metrics shared by all workers on this host
+local_store = LocalStore(default_store_path())
+metrics = Metrics(local_store, flush_interval=float(os.environ.get('METRICS_FLUSH_INTERVAL', '5')))
+
 app = Flask(__name__)
+app.json = FastJSONProvider(app)
 
 # CORS configuration
 cors_origins = [
@@ -31,7 +65,7 @@ if os.environ.get('CORS_ORIGINS'):
     production_origins = os.environ.get('CORS_ORIGINS').split(',')
     cors_origins.extend([origin.strip() for origin in production_origins])
 
-CORS(app, origins=cors_origins)
+CORS(app, origins=cors_origins, expose_headers=['X-Export-Watermark'])
 
 # Database configuration
 DATABASE_URL = os.environ.get('DATABASE_URL')
@@ -62,13 +96,46 @@ else:
     app.config['SQLALCHEMY_DATABASE_URI'] = mysql_url
     logger.info(f'Using local MySQL database: {DB_HOST}:{DB_PORT}/{DB_NAME}')
 
+def derive_pool_limits():
+    """Size the per-worker connection pool from the gunicorn worker/thread counts.
+
+    Each request thread needs at most one connection, plus one each for the
+    background Excel regenerator and group commit threads. DB_MAX_CONNECTIONS
+    caps the total across all workers (e.g. the plan limit of a hosted MySQL).
+    """
+    workers = int(os.environ.get('WEB_CONCURRENCY', '1'))
+    threads = int(os.environ.get('GUNICORN_THREADS', '1'))
+
+    pool_size = int(os.environ.get('DB_POOL_SIZE', threads + 2))
+    max_overflow = int(os.environ.get('DB_MAX_OVERFLOW', threads))
+
+    if os.environ.get('DB_MAX_CONNECTIONS'):
+        per_worker = max(int(os.environ['DB_MAX_CONNECTIONS']) // workers, 1)
+        pool_size = min(pool_size, per_worker)
+        max_overflow = max(min(max_overflow, per_worker - pool_size), 0)
+
+    return pool_size, max_overflow
+
+pool_size, max_overflow = derive_pool_limits()
+
+class InstrumentedQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited for a connection"""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            metrics.observe('db_pool_checkout_wait_seconds', time.perf_counter() - started)
+
 # MySQL-specific configuration
 engine_options = {
     'pool_pre_ping': True,
     'pool_recycle': 300,
     'pool_timeout': 20,
-    'pool_size': 5,
-    'max_overflow': 10,
+    'pool_size': pool_size,
+    'max_overflow': max_overflow,
+    'poolclass': InstrumentedQueuePool,
 }
 
 # Add SSL configuration for production (Aiven)
@@ -81,22 +148,90 @@ app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
 db = SQLAlchemy(app)
 
+# Metrics
+metrics.histogram('http_request_duration_seconds', 'Time to produce a response, by route.')
+metrics.histogram('db_request_query_seconds', 'Total SQL execution time per request, by route.')
+metrics.histogram(
+    'db_request_queries', 'SQL statements executed per request, by route.',
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 50, 100)
+)
+metrics.histogram('db_query_duration_seconds', 'Duration of individual SQL statements.')
+metrics.histogram('db_pool_checkout_wait_seconds', 'Time spent waiting for a pooled connection.')
+
+def pool_gauges(attribute):
+    """Gauge callback reading a pool statistic of this worker's engine"""
+    def read():
+        with app.app_context():
+            return [({}, getattr(db.engine.pool, attribute)())]
+    return read
+
+metrics.gauge('db_pool_checked_out', 'Connections currently checked out of the pool.', pool_gauges('checkedout'))
+metrics.gauge('db_pool_size', 'Configured pool size, summed over workers.', pool_gauges('size'))
+metrics.gauge('db_pool_overflow', 'Overflow connections currently open.', pool_gauges('overflow'))
+
+@event.listens_for(Engine, 'before_cursor_execute')
+def start_query_timer(conn, cursor, statement, parameters, context, executemany):
+    if context is not None:
+        context.query_started = time.perf_counter()
+
+@event.listens_for(Engine, 'after_cursor_execute')
+def stop_query_timer(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, 'query_started', None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    metrics.observe('db_query_duration_seconds', elapsed)
+    if has_request_context() and 'query_count' in g:
+        g.query_count += 1
+        g.query_seconds += elapsed
+
+@app.before_request
+def start_request_timer():
+    g.request_started = time.perf_counter()
+    g.query_count = 0
+    g.query_seconds = 0.0
+
+@app.after_request
+def record_request_metrics(response):
+    if 'request_started' in g:
+        route = request.url_rule.rule if request.url_rule else 'unmatched'
+        labels = {'route': route, 'method': request.method, 'status': str(response.status_code)}
+        metrics.observe('http_request_duration_seconds', time.perf_counter() - g.request_started, labels)
+        metrics.observe('db_request_queries', g.query_count, {'route': route})
+        metrics.observe('db_request_query_seconds', g.query_seconds, {'route': route})
+        try:
+            metrics.flush()
+        except Exception as e:
+            logger.warning(f'Could not publish metrics: {str(e)}')
+    return response
+
 # Database Models
 class UserRegistration(db.Model):
     __tablename__ = 'user_registrations'
+    __table_args__ = (
+        # Backs keyset pagination over (submitted_at, id)
+        db.Index('ix_user_registrations_submitted_at_id', 'submitted_at', 'id'),
+        # One registration per person; see normalize_email()
+        db.Index('uq_user_registrations_email_normalized', 'email_normalized', unique=True),
+        # Back the list filters (registration_filters), newest first
+        db.Index('ix_user_registrations_user_type_submitted_at', 'user_type', 'submitted_at', 'id'),
+        db.Index('ix_user_registrations_profession_submitted_at', 'profession', 'submitted_at', 'id'),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
     name = db.Column(db.String(255), nullable=False, index=True)
     email = db.Column(db.String(255), nullable=False, index=True)
+    # NULL only for rows that predate the column, until dedupe_registrations.py has run
+    email_normalized = db.Column(db.String(255), nullable=True)
     phone = db.Column(db.String(20), nullable=False)
     gender = db.Column(db.String(50), nullable=True)
     profession = db.Column(db.String(255), nullable=True)
     user_type = db.Column(db.String(20), nullable=False, index=True)  # 'USER' or 'Creator'
 
-    # Metadata
-    submitted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    # Metadata; Text columns are deferred (group 'text') and loaded only when asked for
+    submitted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     ip_address = db.Column(db.String(45), nullable=True)  # Support IPv4 and IPv6
-    user_agent = db.Column(db.Text, nullable=True)
+    user_agent = db.deferred(db.Column(db.Text, nullable=True), group='text')
 
     def to_dict(self):
         return {
@@ -113,6 +248,13 @@ class UserRegistration(db.Model):
         }
 class Feedback(db.Model):
     __tablename__ = 'feedback'
+    __table_args__ = (
+        # Backs keyset pagination over (submitted_at, id)
+        db.Index('ix_feedback_submitted_at_id', 'submitted_at', 'id'),
+        # Backs the contact_willing list filter, newest first. Rating filters are
+        # ranges and walk (submitted_at, id) instead; see feedback_filters()
+        db.Index('ix_feedback_contact_willing_submitted_at', 'contact_willing', 'submitted_at', 'id'),
+    )
     
     id = db.Column(db.Integer, primary_key=True)
     
@@ -124,29 +266,29 @@ class Feedback(db.Model):
     ease_of_tasks = db.Column(db.Integer, nullable=True)
     quality_of_services = db.Column(db.Integer, nullable=True)
     
-    # Conditional fields for low ratings
-    visual_design_issue = db.Column(db.Text, nullable=True)
-    ease_of_navigation_issue = db.Column(db.Text, nullable=True)
-    mobile_responsiveness_issue = db.Column(db.Text, nullable=True)
-    overall_satisfaction_issue = db.Column(db.Text, nullable=True)
-    ease_of_tasks_issue = db.Column(db.Text, nullable=True)
-    quality_of_services_issue = db.Column(db.Text, nullable=True)
+    # Conditional fields for low ratings (Text columns are deferred, group 'text')
+    visual_design_issue = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    ease_of_navigation_issue = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    mobile_responsiveness_issue = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    overall_satisfaction_issue = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    ease_of_tasks_issue = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    quality_of_services_issue = db.deferred(db.Column(db.Text, nullable=True), group='text')
     
     # Text area questions
-    like_most = db.Column(db.Text, nullable=True)
-    improvements = db.Column(db.Text, nullable=True)
-    features = db.Column(db.Text, nullable=True)
-    legal_challenges = db.Column(db.Text, nullable=True)
-    additional_comments = db.Column(db.Text, nullable=True)
+    like_most = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    improvements = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    features = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    legal_challenges = db.deferred(db.Column(db.Text, nullable=True), group='text')
+    additional_comments = db.deferred(db.Column(db.Text, nullable=True), group='text')
     
     # Follow-up questions
     contact_willing = db.Column(db.String(10), nullable=True)  # 'yes' or 'no'
     contact_email = db.Column(db.String(255), nullable=True)
     
     # Metadata
-    submitted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False, index=True)
+    submitted_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
     ip_address = db.Column(db.String(45), nullable=True)  # Support IPv6
-    user_agent = db.Column(db.Text, nullable=True)
+    user_agent = db.deferred(db.Column(db.Text, nullable=True), group='text')
     
     def to_dict(self):
         return {
@@ -175,178 +317,1397 @@ class Feedback(db.Model):
             'user_agent': self.user_agent
         }
 
-def validate_feedback_data(data):
-    """Validate feedback form data"""
-    errors = []
-    
-    # Validate rating fields (should be 1-5 if provided)
-    rating_fields = [
-        'visualDesign', 'easeOfNavigation', 'mobileResponsiveness',
-        'overallSatisfaction', 'easeOfTasks', 'qualityOfServices'
-    ]
-    
-    for field in rating_fields:
-        if field in data and data[field]:
-            try:
-                rating = int(data[field])
-                if rating < 1 or rating > 5:
-                    errors.append(f'{field} must be between 1 and 5')
-            except (ValueError, TypeError):
-                errors.append(f'{field} must be a valid number')
-    
-    # Validate conditional fields for low ratings
-    conditional_mapping = {
-        'visualDesign': 'visualDesignIssue',
-        'easeOfNavigation': 'easeOfNavigationIssue',
-        'mobileResponsiveness': 'mobileResponsivenessIssue',
-        'overallSatisfaction': 'overallSatisfactionIssue',
-        'easeOfTasks': 'easeOfTasksIssue',
-        'qualityOfServices': 'qualityOfServicesIssue'
+def archive_table(model):
+    """Archive copy of `model`'s table for rows moved out by archive_submissions.py.
+
+    Same columns plus archived_at, but only the primary key and
+    (submitted_at, id) are indexed and nothing is unique, so an archived
+    registration no longer holds its email. MySQL stores the table with
+    ROW_FORMAT=COMPRESSED.
+    """
+    name = f'{model.__tablename__}_archive'
+    return db.Table(
+        name,
+        *[
+            db.Column(column.name, column.type, primary_key=column.primary_key,
+                      autoincrement=False, nullable=column.nullable)
+            for column in model.__table__.columns
+        ],
+        db.Column('archived_at', db.DateTime, nullable=False),
+        db.Index(f'ix_{name}_submitted_at_id', 'submitted_at', 'id'),
+        mysql_row_format='COMPRESSED'
+    )
+
+registration_archive = archive_table(UserRegistration)
+feedback_archive = archive_table(Feedback)
+
+# Live table -> archive table; live endpoints only ever read the live tables
+ARCHIVE_TABLES = {
+    UserRegistration: registration_archive,
+    Feedback: feedback_archive
+}
+
+# The six 1-5 rating questions on the feedback form
+RATING_DIMENSIONS = [
+    'visual_design', 'ease_of_navigation', 'mobile_responsiveness',
+    'overall_satisfaction', 'ease_of_tasks', 'quality_of_services'
+]
+
+class RatingDailyRollup(db.Model):
+    """Per-day count, sum and 1-5 histogram of one rating question"""
+    __tablename__ = 'feedback_rating_rollups'
+
+    day = db.Column(db.Date, primary_key=True)
+    dimension = db.Column(db.String(32), primary_key=True)
+    responses = db.Column(db.Integer, nullable=False, default=0)
+    rating_sum = db.Column(db.Integer, nullable=False, default=0)
+    rating_1 = db.Column(db.Integer, nullable=False, default=0)
+    rating_2 = db.Column(db.Integer, nullable=False, default=0)
+    rating_3 = db.Column(db.Integer, nullable=False, default=0)
+    rating_4 = db.Column(db.Integer, nullable=False, default=0)
+    rating_5 = db.Column(db.Integer, nullable=False, default=0)
+
+class SubmissionDailyRollup(db.Model):
+    """Per-day submission counts: feedback, and registrations by user_type"""
+    __tablename__ = 'submission_daily_rollups'
+
+    day = db.Column(db.Date, primary_key=True)
+    source = db.Column(db.String(20), primary_key=True)  # 'feedback' or 'registrations'
+    segment = db.Column(db.String(20), primary_key=True)  # user_type for registrations, '' for feedback
+    submissions = db.Column(db.Integer, nullable=False, default=0)
+
+# Multi-row INSERT statements by (table, row count, suffix), built once
+insert_statements = {}
+
+def multi_row_insert(table, columns, count, suffix=''):
+    """INSERT of `count` rows into `table`, with parameters named <column>_<row>.
+
+    A text statement, so its compiled form is cached: Core's insert().values()
+    with a list of rows is compiled again on every execution. `suffix` is
+    appended as is, e.g. an ON DUPLICATE KEY UPDATE clause.
+    """
+    key = (table.name, count, suffix)
+    if key not in insert_statements:
+        rows = ', '.join('(' + ', '.join(f':{column}_{i}' for column in columns) + ')' for i in range(count))
+        insert_statements[key] = db.text(
+            f'INSERT INTO {table.name} ({", ".join(columns)}) VALUES {rows}{suffix}'
+        ).bindparams(*[
+            db.bindparam(f'{column}_{i}', type_=table.c[column].type)
+            for i in range(count) for column in columns
+        ])
+    return insert_statements[key]
+
+def upsert_rollups(connection, table, keys, rows):
+    """Add the counts in `rows` to the rollup rows they identify, creating any that are missing.
+
+    Each row holds the `keys` columns plus the counts to add. All rows go in
+    one multi-row upsert, sorted by key so concurrent transactions lock the
+    rollup rows in the same order.
+    """
+    rows = sorted(rows, key=lambda row: tuple(row[key] for key in keys))
+    increments = [column for column in rows[0] if column not in keys]
+    if connection.dialect.name == 'mysql':
+        suffix = ' ON DUPLICATE KEY UPDATE ' + ', '.join(
+            f'{column} = {column} + VALUES({column})' for column in increments
+        )
+    else:
+        suffix = f' ON CONFLICT ({", ".join(keys)}) DO UPDATE SET ' + ', '.join(
+            f'{column} = {column} + excluded.{column}' for column in increments
+        )
+    columns = list(keys) + increments
+    connection.execute(
+        multi_row_insert(table, columns, len(rows), suffix),
+        {f'{column}_{i}': row[column] for i, row in enumerate(rows) for column in columns}
+    )
+
+def fold_into_rollups(connection, records):
+    """Add new Feedback and UserRegistration `records` to the daily rollups.
+
+    Sends at most one statement per rollup table, however many records there are.
+    """
+    ratings = {}
+    submissions = {}
+    for record in records:
+        if isinstance(record, Feedback):
+            day = record.submitted_at.date()
+            key = (day, 'feedback', '')
+            submissions[key] = submissions.get(key, 0) + 1
+            for dimension in RATING_DIMENSIONS:
+                rating = getattr(record, dimension)
+                if rating is None:
+                    continue
+                counts = ratings.setdefault((day, dimension), {
+                    'responses': 0, 'rating_sum': 0,
+                    'rating_1': 0, 'rating_2': 0, 'rating_3': 0, 'rating_4': 0, 'rating_5': 0
+                })
+                counts['responses'] += 1
+                counts['rating_sum'] += rating
+                if 1 <= rating <= 5:
+                    counts[f'rating_{rating}'] += 1
+        elif isinstance(record, UserRegistration):
+            key = (record.submitted_at.date(), 'registrations', record.user_type)
+            submissions[key] = submissions.get(key, 0) + 1
+
+    if ratings:
+        upsert_rollups(connection, RatingDailyRollup.__table__, ('day', 'dimension'), [
+            {'day': day, 'dimension': dimension, **counts}
+            for (day, dimension), counts in ratings.items()
+        ])
+    if submissions:
+        upsert_rollups(connection, SubmissionDailyRollup.__table__, ('day', 'source', 'segment'), [
+            {'day': day, 'source': source, 'segment': segment, 'submissions': count}
+            for (day, source, segment), count in submissions.items()
+        ])
+
+@event.listens_for(Session, 'after_flush')
+def update_rollups(session, flush_context):
+    """Fold newly inserted feedback and registrations into the daily rollups.
+
+    Runs inside the insert transaction, so rollups commit or roll back together
+    with the rows they summarise.
+    """
+    records = [instance for instance in session.new if isinstance(instance, (Feedback, UserRegistration))]
+    if records:
+        fold_into_rollups(session.connection(), records)
+
+def encode_cursor(submitted_at, row_id):
+    """Encode a (submitted_at, id) position as an opaque `after` token"""
+    payload = json.dumps([submitted_at.isoformat(), row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+# Largest id a cursor may carry: ids are signed 64-bit integers in the database
+MAX_CURSOR_ID = 2 ** 63 - 1
+
+def decode_cursor(token):
+    """Decode an `after` token; raises ValueError if it is malformed or tampered with"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        submitted_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        submitted_at, row_id = datetime.fromisoformat(submitted_at), int(row_id)
+    except Exception:
+        raise ValueError('Invalid after cursor')
+    # Stored times are naive UTC, and an out-of-range id cannot be bound to the query
+    if submitted_at.tzinfo is not None or not 0 <= row_id <= MAX_CURSOR_ID:
+        raise ValueError('Invalid after cursor')
+    return submitted_at, row_id
+
+def list_query(model, filters=(), options=()):
+    """Newest-first query behind the list endpoints.
+
+    `filters` are SQL conditions such as those from feedback_filters();
+    `options` are loader options such as list_load_options().
+    """
+    return model.query.options(*options).filter(*filters).order_by(model.submitted_at.desc(), model.id.desc())
+
+def keyset_page(model, after, per_page, options=(), filters=()):
+    """Fetch one page newest-first, starting after the position encoded in `after`.
+
+    Seeks on the (submitted_at, id) index instead of using OFFSET, so every page
+    costs the same no matter how deep it is. Returns the rows and the token for
+    the next page (None on the last page).
+    """
+    per_page = max(per_page, 1)
+    query = list_query(model, filters, options)
+    if after:
+        submitted_at, row_id = decode_cursor(after)
+        query = query.filter(db.tuple_(model.submitted_at, model.id) < (submitted_at, row_id))
+
+    # One extra row tells us whether another page exists without a COUNT(*)
+    rows = query.limit(per_page + 1).all()
+    next_after = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_after = encode_cursor(rows[-1].submitted_at, rows[-1].id)
+    return rows, next_after
+
+# Negotiated gzip / brotli compression for API and export responses. Bodies
+# below the threshold are sent as they are; streamed bodies are always compressed.
+COMPRESSION_MIN_SIZE = int(os.environ.get('COMPRESSION_MIN_SIZE', '1024'))
+COMPRESSION_LEVELS = {
+    'gzip': int(os.environ.get('GZIP_LEVEL', '6')),
+    'br': int(os.environ.get('BROTLI_QUALITY', '5'))
+}
+COMPRESSIBLE_MIMETYPES = {'application/json', 'application/x-ndjson', 'text/csv', 'text/plain'}
+
+metrics.counter('compressed_responses_total', 'Responses sent with a Content-Encoding, by encoding and source.')
+
+def response_encoding(size=None):
+    """Encoding for a body of `size` bytes (None if streamed) in this request, or None"""
+    if size is not None and size < COMPRESSION_MIN_SIZE:
+        return None
+    return negotiate_encoding(request.accept_encodings)
+
+def set_content_encoding(response, encoding, source):
+    """Mark `response` as encoded; source is 'live' or 'cache' (precompressed)"""
+    response.headers['Content-Encoding'] = encoding
+    response.vary.add('Accept-Encoding')
+    metrics.inc('compressed_responses_total', {'encoding': encoding, 'source': source})
+
+@app.after_request
+def compress_response(response):
+    if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+        return response
+    response.vary.add('Accept-Encoding')
+    if (response.status_code < 200 or response.status_code in (204, 304)
+            or response.direct_passthrough or 'Content-Encoding' in response.headers):
+        return response
+
+    if response.is_streamed:
+        encoding = response_encoding()
+        if encoding is None:
+            return response
+        response.response = compress_stream(response.response, encoding, COMPRESSION_LEVELS[encoding])
+        response.headers.pop('Content-Length', None)
+    else:
+        body = response.get_data()
+        encoding = response_encoding(len(body))
+        if encoding is None:
+            return response
+        response.set_data(compress(body, encoding, COMPRESSION_LEVELS[encoding]))
+
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        # One entity tag now covers several encodings of the body
+        response.set_etag(etag, weak=True)
+    set_content_encoding(response, encoding, 'live')
+    return response
+
+# Per-table generation counters, bumped whenever a commit inserts rows. List
+# responses are cached under the current generation, so a new submission
+# makes every cached page of that table unreachable at once.
+RESPONSE_CACHE_TTL = int(os.environ.get('RESPONSE_CACHE_TTL', '300'))
+
+metrics.counter('response_cache_requests_total', 'List responses served from cache or rebuilt, by table.')
+
+def table_generation(table):
+    """Current generation of `table` in the shared store"""
+    return int(local_store.get(f'generation:{table}', 0))
+
+def bump_generation(table):
+    """Invalidate cached responses for `table` across all workers"""
+    local_store.incr(f'generation:{table}')
+
+@event.listens_for(Session, 'after_flush')
+def track_inserted_tables(session, flush_context):
+    tables = session.info.setdefault('inserted_tables', set())
+    # Updates too, e.g. dedupe_registrations.py keying existing registrations
+    for instance in list(session.new) + list(session.dirty):
+        tables.add(instance.__tablename__)
+
+@event.listens_for(Session, 'after_commit')
+def bump_inserted_tables(session):
+    for table in session.info.pop('inserted_tables', ()):
+        try:
+            bump_generation(table)
+        except Exception as e:
+            logger.warning(f'Could not bump cache generation for {table}: {str(e)}')
+
+@event.listens_for(Session, 'after_rollback')
+def forget_inserted_tables(session):
+    session.info.pop('inserted_tables', None)
+
+def lookup_list_cache(table):
+    """Find a cached list response for the current request.
+
+    Returns (cache_key, etag, response); response is None on a miss. A key of
+    None means the cache is unavailable and the response should not be stored.
+    """
+    try:
+        generation = table_generation(table)
+    except Exception as e:
+        logger.warning(f'Response cache unavailable: {str(e)}')
+        return None, None, None
+
+    query = urlencode(sorted(request.args.items(multi=True)))
+    cache_key = f'response:{request.path}:{generation}:{query}'
+    etag = hashlib.sha1(cache_key.encode('utf-8')).hexdigest()
+
+    if request.if_none_match.contains_weak(etag):
+        metrics.inc('response_cache_requests_total', {'table': table, 'result': 'not_modified'})
+        response = app.response_class(status=304)
+        response.set_etag(etag, weak=True)
+        response.vary.add('Accept-Encoding')
+        return cache_key, etag, response
+
+    body = local_store.get(cache_key)
+    if body is None:
+        metrics.inc('response_cache_requests_total', {'table': table, 'result': 'miss'})
+        return cache_key, etag, None
+
+    metrics.inc('response_cache_requests_total', {'table': table, 'result': 'hit'})
+    response = app.response_class(mimetype='application/json')
+    try:
+        body, encoding = encode_cached_body(cache_key, body)
+    except Exception as e:
+        logger.warning(f'Could not cache compressed response: {str(e)}')
+        encoding = None
+    response.set_data(body)
+    if encoding is not None:
+        set_content_encoding(response, encoding, 'cache')
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.headers['X-Cache'] = 'HIT'
+    return cache_key, etag, response
+
+def encode_cached_body(cache_key, body):
+    """Compress a cached list body for the current request, once per encoding.
+
+    Returns (body, encoding). The compressed copy is stored next to the cached
+    body and expires with it, so repeat requests cost no compression.
+    """
+    encoding = response_encoding(len(body))
+    if encoding is None:
+        return body, None
+
+    encoded_key = f'{cache_key}:{encoding}'
+    encoded = local_store.get(encoded_key)
+    if encoded is None:
+        encoded = compress(body, encoding, COMPRESSION_LEVELS[encoding])
+        local_store.set(encoded_key, encoded, ttl=RESPONSE_CACHE_TTL)
+    return encoded, encoding
+
+def cache_list_response(cache_key, etag, result):
+    """Serialize `result`, store it under `cache_key` and return the response"""
+    response = jsonify(result)
+    if cache_key is None:
+        return response
+
+    try:
+        body = response.get_data()
+        local_store.set(cache_key, body, ttl=RESPONSE_CACHE_TTL)
+        body, encoding = encode_cached_body(cache_key, body)
+        if encoding is not None:
+            response.set_data(body)
+            set_content_encoding(response, encoding, 'live')
+    except Exception as e:
+        logger.warning(f'Could not cache response: {str(e)}')
+    response.set_etag(etag, weak=True)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    response.headers['X-Cache'] = 'MISS'
+    return response
+
+# Dashboard stats are recomputed at most once per TTL across all workers
+STATS_CACHE_TTL = int(os.environ.get('STATS_CACHE_TTL', '30'))
+
+def compute_stats():
+    """Aggregate dashboard numbers from the daily submission rollups.
+
+    Reads SubmissionDailyRollup (a row per day and segment) instead of the
+    submission tables, so the cost does not grow with the number of rows;
+    the latest submission times come from the (submitted_at, id) indexes.
+    Like /api/analytics, the counts include archived rows.
+    """
+    now = datetime.utcnow()
+    today = now.date()
+    week_start = today - timedelta(days=today.weekday())
+
+    rollup = SubmissionDailyRollup
+    counts = {}
+    for source, segment, total, this_week, today_count in db.session.execute(
+        db.select(
+            rollup.source,
+            rollup.segment,
+            db.func.sum(rollup.submissions),
+            db.func.sum(db.case((rollup.day >= week_start, rollup.submissions), else_=0)),
+            db.func.sum(db.case((rollup.day == today, rollup.submissions), else_=0))
+        ).group_by(rollup.source, rollup.segment)
+    ):
+        counts.setdefault(source, {})[segment] = (int(total), int(this_week), int(today_count))
+
+    def submission_stats(model, source):
+        segments = counts.get(source, {}).values()
+        latest = db.session.execute(db.select(db.func.max(model.submitted_at))).scalar()
+        return {
+            'total': sum(total for total, _, _ in segments),
+            'today': sum(today_count for _, _, today_count in segments),
+            'this_week': sum(this_week for _, this_week, _ in segments),
+            'latest_submitted_at': latest.isoformat() if latest else None
+        }
+
+    return {
+        'registrations': {
+            'by_user_type': {segment: total for segment, (total, _, _) in counts.get('registrations', {}).items()},
+            **submission_stats(UserRegistration, 'registrations')
+        },
+        'feedback': submission_stats(Feedback, 'feedback'),
+        'generated_at': now.isoformat()
     }
-    
-    for rating_field, issue_field in conditional_mapping.items():
-        if rating_field in data and data[rating_field]:
-            try:
-                rating = int(data[rating_field])
-                if rating < 3 and (issue_field not in data or not data[issue_field].strip()):
-                    errors.append(f'Please explain what you didn\'t like for {rating_field} (rating below 3)')
-            except (ValueError, TypeError):
-                pass  # Already handled above
-    
-    # Validate email if contact willing is yes
-    if data.get('contactWilling') == 'yes':
-        email = data.get('contactEmail', '').strip()
-        if not email:
-            errors.append('Email is required when willing to be contacted')
-        elif '@' not in email or '.' not in email:
-            errors.append('Please provide a valid email address')
-    
-    return errors
 
-def generate_excel_report():
-    """Generate Excel file with user registrations and feedback data"""
+def get_cached_stats():
+    """Return dashboard stats from the shared cache, recomputing when it expires"""
     try:
-        # Create a new workbook
-        wb = Workbook()
-
-        # Remove default sheet
-        wb.remove(wb.active)
-
-        # Create User Registrations sheet
-        ws1 = wb.create_sheet("User Registrations")
-
-        # Headers for User Registrations
-        headers1 = ['ID', 'Name', 'Email', 'Phone', 'Gender', 'Profession', 'User Type', 'Submitted At', 'IP Address']
-        ws1.append(headers1)
-
-        # Style headers
-        header_font = Font(bold=True, color="FFFFFF")
-        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-
-        for cell in ws1[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
-
-        # Get user registration data
-        registrations = UserRegistration.query.order_by(UserRegistration.submitted_at.desc()).all()
-        for reg in registrations:
-            ws1.append([
-                reg.id,
-                reg.name,
-                reg.email,
-                reg.phone,
-                reg.gender or '',
-                reg.profession or '',
-                reg.user_type,
-                reg.submitted_at.strftime('%Y-%m-%d %H:%M:%S') if reg.submitted_at else '',
-                reg.ip_address or ''
-            ])
-
-        # Auto-adjust column widths
-        for column in ws1.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws1.column_dimensions[column_letter].width = adjusted_width
-
-        # Create Feedback Submissions sheet
-        ws2 = wb.create_sheet("Feedback Submissions")
-
-        # Headers for Feedback
-        headers2 = [
-            'ID', 'Visual Design', 'Visual Design Issue', 'Ease of Navigation', 'Navigation Issue',
-            'Mobile Responsiveness', 'Mobile Issue', 'Overall Satisfaction', 'Satisfaction Issue',
-            'Ease of Tasks', 'Tasks Issue', 'Quality of Services', 'Services Issue',
-            'Like Most', 'Improvements', 'Features', 'Legal Challenges', 'Additional Comments',
-            'Contact Willing', 'Contact Email', 'Submitted At', 'IP Address'
+        cached = local_store.get('stats')
+        if cached is not None:
+            return json.loads(cached)
+    except Exception as e:
+        logger.warning(f'Stats cache unavailable: {str(e)}')
+
+    stats = compute_stats()
+    try:
+        local_store.set('stats', json.dumps(stats), ttl=STATS_CACHE_TTL)
+    except Exception as e:
+        logger.warning(f'Could not cache stats: {str(e)}')
+    return stats
+
+# Longest date range /api/analytics will answer in one request
+ANALYTICS_MAX_DAYS = int(os.environ.get('ANALYTICS_MAX_DAYS', '3660'))
+
+def parse_day(value, default):
+    """Parse a YYYY-MM-DD query parameter; raises ValueError if malformed"""
+    if not value:
+        return default
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise ValueError(f'Invalid date: {value} (expected YYYY-MM-DD)')
+
+def period_start(day, interval):
+    """First day of the trend bucket `day` falls into"""
+    if interval == 'week':
+        return day - timedelta(days=day.weekday())
+    if interval == 'month':
+        return day.replace(day=1)
+    return day
+
+def compute_analytics(start, end, interval):
+    """Rating distributions and submission trends from the daily rollups.
+
+    Reads at most one rollup row per day and dimension, so the cost depends on
+    the date range, not on how many feedback rows exist.
+    """
+    rating_rows = db.session.execute(
+        db.select(RatingDailyRollup).where(RatingDailyRollup.day.between(start, end))
+    ).scalars().all()
+    submission_rows = db.session.execute(
+        db.select(SubmissionDailyRollup).where(SubmissionDailyRollup.day.between(start, end))
+    ).scalars().all()
+
+    ratings = {
+        dimension: {'responses': 0, 'rating_sum': 0, 'distribution': {str(r): 0 for r in range(1, 6)}}
+        for dimension in RATING_DIMENSIONS
+    }
+    trend = {}
+
+    def bucket(day):
+        key = period_start(day, interval)
+        return trend.setdefault(key, {
+            'feedback_submissions': 0,
+            'registrations': 0,
+            'ratings': {dimension: [0, 0] for dimension in RATING_DIMENSIONS}
+        })
+
+    for row in rating_rows:
+        if row.dimension not in ratings:
+            continue
+        summary = ratings[row.dimension]
+        summary['responses'] += row.responses
+        summary['rating_sum'] += row.rating_sum
+        for r in range(1, 6):
+            summary['distribution'][str(r)] += getattr(row, f'rating_{r}')
+        period = bucket(row.day)['ratings'][row.dimension]
+        period[0] += row.responses
+        period[1] += row.rating_sum
+
+    feedback_total = 0
+    registrations_by_type = {}
+    for row in submission_rows:
+        period = bucket(row.day)
+        if row.source == 'feedback':
+            feedback_total += row.submissions
+            period['feedback_submissions'] += row.submissions
+        else:
+            registrations_by_type[row.segment] = registrations_by_type.get(row.segment, 0) + row.submissions
+            period['registrations'] += row.submissions
+
+    def average(responses, total):
+        return round(total / responses, 3) if responses else None
+
+    return {
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'interval': interval,
+        'ratings': {
+            dimension: {
+                'responses': summary['responses'],
+                'average': average(summary['responses'], summary['rating_sum']),
+                'distribution': summary['distribution']
+            }
+            for dimension, summary in ratings.items()
+        },
+        'feedback_submissions': feedback_total,
+        'registrations': {
+            'total': sum(registrations_by_type.values()),
+            'by_user_type': registrations_by_type
+        },
+        'trend': [
+            {
+                'period': key.isoformat(),
+                'feedback_submissions': period['feedback_submissions'],
+                'registrations': period['registrations'],
+                'average_ratings': {
+                    dimension: average(responses, total)
+                    for dimension, (responses, total) in period['ratings'].items()
+                }
+            }
+            for key, period in sorted(trend.items())
         ]
-        ws2.append(headers2)
-
-        # Style headers
-        for cell in ws2[1]:
-            cell.font = header_font
-            cell.fill = header_fill
-            cell.alignment = Alignment(horizontal="center")
-
-        # Get feedback data
-        feedback_list = Feedback.query.order_by(Feedback.submitted_at.desc()).all()
-        for feedback in feedback_list:
-            ws2.append([
-                feedback.id,
-                feedback.visual_design or '',
-                feedback.visual_design_issue or '',
-                feedback.ease_of_navigation or '',
-                feedback.ease_of_navigation_issue or '',
-                feedback.mobile_responsiveness or '',
-                feedback.mobile_responsiveness_issue or '',
-                feedback.overall_satisfaction or '',
-                feedback.overall_satisfaction_issue or '',
-                feedback.ease_of_tasks or '',
-                feedback.ease_of_tasks_issue or '',
-                feedback.quality_of_services or '',
-                feedback.quality_of_services_issue or '',
-                feedback.like_most or '',
-                feedback.improvements or '',
-                feedback.features or '',
-                feedback.legal_challenges or '',
-                feedback.additional_comments or '',
-                feedback.contact_willing or '',
-                feedback.contact_email or '',
-                feedback.submitted_at.strftime('%Y-%m-%d %H:%M:%S') if feedback.submitted_at else '',
-                feedback.ip_address or ''
-            ])
-
-        # Auto-adjust column widths
-        for column in ws2.columns:
-            max_length = 0
-            column_letter = column[0].column_letter
-            for cell in column:
-                try:
-                    if len(str(cell.value)) > max_length:
-                        max_length = len(str(cell.value))
-                except:
-                    pass
-            adjusted_width = min(max_length + 2, 50)
-            ws2.column_dimensions[column_letter].width = adjusted_width
+    }
+
+# Free-text feedback columns covered by the full-text search index
+SEARCH_COLUMNS = [
+    'like_most', 'improvements', 'features', 'legal_challenges', 'additional_comments',
+    'visual_design_issue', 'ease_of_navigation_issue', 'mobile_responsiveness_issue',
+    'overall_satisfaction_issue', 'ease_of_tasks_issue', 'quality_of_services_issue'
+]
+SEARCH_MAX_TERMS = 10
+SEARCH_SNIPPET_CHARS = int(os.environ.get('SEARCH_SNIPPET_CHARS', '160'))
+
+def ensure_search_index(connection):
+    """Create the full-text index over SEARCH_COLUMNS if it does not exist yet.
+
+    MySQL gets a FULLTEXT index on the feedback table itself. SQLite gets an
+    external-content FTS5 table kept in sync by triggers, filled from the
+    existing feedback rows when it is first created.
+    """
+    columns = ', '.join(SEARCH_COLUMNS)
+    dialect = connection.dialect.name
+    if dialect == 'mysql':
+        exists = connection.execute(db.text(
+            "SELECT 1 FROM information_schema.statistics WHERE table_schema = DATABASE() "
+            "AND table_name = 'feedback' AND index_name = 'ft_feedback_text' LIMIT 1"
+        )).first()
+        if not exists:
+            connection.execute(db.text(f'ALTER TABLE feedback ADD FULLTEXT INDEX ft_feedback_text ({columns})'))
+            logger.info('Created FULLTEXT index ft_feedback_text')
+    elif dialect == 'sqlite':
+        # Dropping the feedback table drops the triggers but not the FTS table
+        exists = connection.execute(db.text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'feedback_fts_insert'"
+        )).first()
+        if not exists:
+            connection.execute(db.text('DROP TABLE IF EXISTS feedback_fts'))
+            new_values = ', '.join(f'new.{column}' for column in SEARCH_COLUMNS)
+            old_values = ', '.join(f'old.{column}' for column in SEARCH_COLUMNS)
+            remove_old = (
+                f"INSERT INTO feedback_fts(feedback_fts, rowid, {columns}) VALUES ('delete', old.id, {old_values});"
+            )
+            add_new = f'INSERT INTO feedback_fts(rowid, {columns}) VALUES (new.id, {new_values});'
+            for statement in (
+                f"CREATE VIRTUAL TABLE feedback_fts USING fts5({columns}, content='feedback', content_rowid='id')",
+                f'CREATE TRIGGER feedback_fts_insert AFTER INSERT ON feedback BEGIN {add_new} END',
+                f'CREATE TRIGGER feedback_fts_delete AFTER DELETE ON feedback BEGIN {remove_old} END',
+                f'CREATE TRIGGER feedback_fts_update AFTER UPDATE ON feedback BEGIN {remove_old} {add_new} END',
+                "INSERT INTO feedback_fts(feedback_fts) VALUES ('rebuild')"
+            ):
+                connection.execute(db.text(statement))
+            logger.info('Created FTS5 table feedback_fts')
+    else:
+        logger.warning(f'Full-text search is not available on {dialect}')
+
+def parse_search_query(value):
+    """Split a search string into terms; raises ValueError if nothing is searchable.
+
+    Bare words must all match, "quoted phrases" match as a phrase and a
+    trailing * makes a word a prefix. Each term is (words, is_prefix); all
+    other punctuation is dropped, so user input never reaches the engine's
+    query syntax.
+    """
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"?|(\S+)', value or ''):
+        if phrase:
+            words = tuple(re.findall(r'\w+', phrase))
+            if words:
+                terms.append((words, False))
+            continue
+        words = re.findall(r'\w+', word)
+        for index, part in enumerate(words):
+            is_last = index == len(words) - 1
+            terms.append(((part,), is_last and word.endswith('*')))
+
+    if not terms:
+        raise ValueError('Search query q is required')
+    if len(terms) > SEARCH_MAX_TERMS:
+        raise ValueError(f'Search query can have at most {SEARCH_MAX_TERMS} terms')
+    return terms
+
+def encode_search_cursor(score, row_id):
+    """Encode a (score, id) position in a ranked result list as an `after` token"""
+    payload = json.dumps([score, row_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(payload.encode('utf-8')).decode('ascii').rstrip('=')
+
+def decode_search_cursor(token):
+    """Decode a search `after` token; raises ValueError if it is malformed"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        score, row_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        score, row_id = float(score), int(row_id)
+    except Exception:
+        raise ValueError('Invalid after cursor')
+    if not math.isfinite(score) or not 0 <= row_id <= MAX_CURSOR_ID:
+        raise ValueError('Invalid after cursor')
+    return score, row_id
+
+def search_snippets(row, terms):
+    """Fields of `row` that mention a search term, each with a highlighted excerpt.
+
+    The excerpt is HTML-escaped with the matches wrapped in <mark>, so it can
+    be inserted into a page as-is.
+    """
+    patterns = []
+    for words, is_prefix in terms:
+        pattern = r'\W+'.join(re.escape(word) for word in words)
+        patterns.append(rf'\b{pattern}\w*' if is_prefix else rf'\b{pattern}\b')
+    matcher = re.compile('|'.join(patterns), re.IGNORECASE)
+
+    matches = []
+    for column in SEARCH_COLUMNS:
+        text = getattr(row, column)
+        first = matcher.search(text) if text else None
+        if not first:
+            continue
+
+        start = max(first.start() - SEARCH_SNIPPET_CHARS // 3, 0)
+        end = min(start + SEARCH_SNIPPET_CHARS, len(text))
+        start = max(min(start, end - SEARCH_SNIPPET_CHARS), 0)
+        excerpt = text[start:end]
+
+        parts = []
+        position = 0
+        for match in matcher.finditer(excerpt):
+            parts.append(html.escape(excerpt[position:match.start()]))
+            parts.append(f'<mark>{html.escape(match.group())}</mark>')
+            position = match.end()
+        parts.append(html.escape(excerpt[position:]))
+        snippet = ''.join(parts)
+        if start > 0:
+            snippet = '\u2026' + snippet
+        if end < len(text):
+            snippet += '\u2026'
+        matches.append({'field': column, 'snippet': snippet})
+    return matches
+
+def search_feedback(terms, after, per_page):
+    """Rank feedback rows matching all `terms` through the full-text index.
+
+    Results are ordered by relevance (higher score first), then newest id, and
+    paged with a (score, id) keyset cursor. Returns (rows, next_after) where
+    rows are (Feedback, score) pairs.
+    """
+    per_page = max(per_page, 1)
+    dialect = db.engine.dialect.name
+    if dialect == 'mysql':
+        expression = ' '.join(
+            '+"' + ' '.join(words) + '"' if len(words) > 1 else f'+{words[0]}' + ('*' if is_prefix else '')
+            for words, is_prefix in terms
+        )
+        score = mysql_dialect.match(
+            *[getattr(Feedback, column) for column in SEARCH_COLUMNS], against=expression
+        ).in_boolean_mode()
+        query = db.select(Feedback, score.label('score')).where(score > 0)
+    elif dialect == 'sqlite':
+        expression = ' AND '.join(
+            '"' + ' '.join(words) + '"' + ('*' if is_prefix else '') for words, is_prefix in terms
+        )
+        fts = db.literal_column('feedback_fts')
+        # bm25() is lower for better matches; negate it so both engines rank high-to-low
+        score = -db.func.bm25(fts)
+        query = (
+            db.select(Feedback, score.label('score'))
+            .join(db.table('feedback_fts', db.column('rowid')), db.literal_column('feedback_fts.rowid') == Feedback.id)
+            .where(fts.op('MATCH')(expression))
+        )
+    else:
+        raise RuntimeError(f'Full-text search is not available on {dialect}')
+
+    if after:
+        after_score, after_id = decode_search_cursor(after)
+        query = query.where(db.or_(score < after_score, db.and_(score == after_score, Feedback.id < after_id)))
+
+    # Results carry the whole record and snippets from the Text columns
+    query = query.options(db.undefer_group('text'))
+    rows = db.session.execute(query.order_by(score.desc(), Feedback.id.desc()).limit(per_page + 1)).all()
+    next_after = None
+    if len(rows) > per_page:
+        rows = rows[:per_page]
+        next_after = encode_search_cursor(float(rows[-1][1]), rows[-1][0].id)
+    return rows, next_after
+
+# Generated export files are cached on local disk, shared by all workers
+EXPORT_CACHE_DIR = os.environ.get(
+    'EXPORT_CACHE_DIR', os.path.join(tempfile.gettempdir(), 'lawvriksh_export_cache')
+)
+export_snapshots = SnapshotCache(EXPORT_CACHE_DIR)
+
+# Rows fetched per round trip when streaming exports off a server-side cursor
+EXPORT_CHUNK_SIZE = int(os.environ.get('EXPORT_CHUNK_SIZE', '1000'))
+
+# Seconds an insert may take to commit. Export watermarks stop at rows
+# submitted at least this long ago; see settled_export_id()
+EXPORT_COMMIT_LAG = int(os.environ.get('EXPORT_COMMIT_LAG', '30'))
+
+# Fields of the list endpoints, in to_dict() order; email_normalized is internal
+REGISTRATION_LIST_COLUMNS = [
+    column.name for column in UserRegistration.__table__.columns if column.name != 'email_normalized'
+]
+FEEDBACK_LIST_COLUMNS = [column.name for column in Feedback.__table__.columns]
 
-        # Save to BytesIO
-        excel_buffer = io.BytesIO()
-        wb.save(excel_buffer)
-        excel_buffer.seek(0)
+# Columns of the CSV and NDJSON exports: every column except the internal email_normalized
+TEXT_EXPORT_COLUMNS = {
+    model: tuple(column.name for column in model.__table__.columns if column.name != 'email_normalized')
+    for model in (UserRegistration, Feedback)
+}
+LIST_FORMATS = ('json', 'columnar')
 
-        return excel_buffer
+def parse_fields(value, columns):
+    """Columns named by ?fields=, in request order (None when absent); raises ValueError"""
+    if value is None:
+        return None
+    fields = list(dict.fromkeys(field.strip() for field in value.split(',') if field.strip()))
+    if not fields:
+        raise ValueError('fields must name at least one column')
+    unknown = [field for field in fields if field not in columns]
+    if unknown:
+        raise ValueError(f'Unknown fields: {", ".join(unknown)}')
+    return fields
+
+def list_load_options(model, fields):
+    """Loader options for a list page: only `fields` (plus the id and submitted_at
+    the pagination needs), or every column including the deferred Text ones.
+    """
+    if fields is None:
+        return [db.undefer_group('text')]
+    return [db.load_only(*[getattr(model, field) for field in fields], model.submitted_at)]
+
+def parse_rating(name, value):
+    """Parse a rating threshold parameter; raises ValueError"""
+    try:
+        rating = int(value)
+    except (TypeError, ValueError):
+        rating = None
+    if rating is None or rating < 1 or rating > 5:
+        raise ValueError(f'{name} must be a number between 1 and 5')
+    return rating
+
+def submitted_filters(model, args):
+    """Conditions for the `start` / `end` date range (inclusive UTC days); raises ValueError"""
+    conditions = []
+    start = parse_day(args.get('start'), None)
+    end = parse_day(args.get('end'), None)
+    if start and end and start > end:
+        raise ValueError('start must not be after end')
+    if start:
+        conditions.append(model.submitted_at >= datetime.combine(start, datetime.min.time()))
+    if end:
+        conditions.append(model.submitted_at < datetime.combine(end + timedelta(days=1), datetime.min.time()))
+    return conditions
+
+def registration_filters(args):
+    """SQL conditions for the registration list filters; raises ValueError.
+
+    Each filter has an index leading with its column and ending in
+    (submitted_at, id), see check_query_plans.py.
+    """
+    conditions = submitted_filters(UserRegistration, args)
+    user_type = args.get('user_type')
+    if user_type:
+        if user_type not in ['USER', 'Creator']:
+            raise ValueError('user_type must be USER or Creator')
+        conditions.append(UserRegistration.user_type == user_type)
+    profession = args.get('profession')
+    if profession:
+        conditions.append(UserRegistration.profession == profession)
+    return conditions
+
+def feedback_filters(args):
+    """SQL conditions for the feedback list filters; raises ValueError.
+
+    Ratings take `min_<rating>` / `max_<rating>` thresholds, e.g.
+    max_overall_satisfaction=2. contact_willing has an index leading with its
+    column; a rating range cannot keep submitted_at order, so those filters
+    walk (submitted_at, id) newest first. See check_query_plans.py.
+    """
+    conditions = submitted_filters(Feedback, args)
+    for dimension in RATING_DIMENSIONS:
+        column = getattr(Feedback, dimension)
+        minimum = args.get(f'min_{dimension}')
+        if minimum:
+            conditions.append(column >= parse_rating(f'min_{dimension}', minimum))
+        maximum = args.get(f'max_{dimension}')
+        if maximum:
+            conditions.append(column <= parse_rating(f'max_{dimension}', maximum))
+    contact_willing = args.get('contact_willing')
+    if contact_willing:
+        if contact_willing not in ['yes', 'no']:
+            raise ValueError('contact_willing must be yes or no')
+        conditions.append(Feedback.contact_willing == contact_willing)
+    return conditions
+
+def serialize_rows(rows, columns, list_format):
+    """Rows for a list response, reading only `columns`: one object per row (as
+    to_dict() would give), or for ?format=columnar the column names once plus
+    one array of values per row.
+    """
+    get_values = attrgetter(*columns) if len(columns) > 1 else (lambda row: (getattr(row, columns[0]),))
+    timestamp = columns.index('submitted_at') if 'submitted_at' in columns else None
+    values = []
+    for row in rows:
+        row_values = list(get_values(row))
+        if timestamp is not None and row_values[timestamp] is not None:
+            row_values[timestamp] = row_values[timestamp].isoformat()
+        values.append(row_values)
+
+    if list_format == 'columnar':
+        return {'columns': columns, 'rows': values}
+    return [dict(zip(columns, row_values)) for row_values in values]
+
+REGISTRATION_EXPORT_COLUMNS = [
+    ('ID', UserRegistration.id),
+    ('Name', UserRegistration.name),
+    ('Email', UserRegistration.email),
+    ('Phone', UserRegistration.phone),
+    ('Gender', UserRegistration.gender),
+    ('Profession', UserRegistration.profession),
+    ('User Type', UserRegistration.user_type),
+    ('Submitted At', UserRegistration.submitted_at),
+    ('IP Address', UserRegistration.ip_address),
+]
+
+FEEDBACK_EXPORT_COLUMNS = [
+    ('ID', Feedback.id),
+    ('Visual Design', Feedback.visual_design),
+    ('Visual Design Issue', Feedback.visual_design_issue),
+    ('Ease of Navigation', Feedback.ease_of_navigation),
+    ('Navigation Issue', Feedback.ease_of_navigation_issue),
+    ('Mobile Responsiveness', Feedback.mobile_responsiveness),
+    ('Mobile Issue', Feedback.mobile_responsiveness_issue),
+    ('Overall Satisfaction', Feedback.overall_satisfaction),
+    ('Satisfaction Issue', Feedback.overall_satisfaction_issue),
+    ('Ease of Tasks', Feedback.ease_of_tasks),
+    ('Tasks Issue', Feedback.ease_of_tasks_issue),
+    ('Quality of Services', Feedback.quality_of_services),
+    ('Services Issue', Feedback.quality_of_services_issue),
+    ('Like Most', Feedback.like_most),
+    ('Improvements', Feedback.improvements),
+    ('Features', Feedback.features),
+    ('Legal Challenges', Feedback.legal_challenges),
+    ('Additional Comments', Feedback.additional_comments),
+    ('Contact Willing', Feedback.contact_willing),
+    ('Contact Email', Feedback.contact_email),
+    ('Submitted At', Feedback.submitted_at),
+    ('IP Address', Feedback.ip_address),
+]
+
+def export_value(value):
+    """Convert a database value into the form written to export files"""
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M:%S')
+    return value
+
+def stream_export_rows(model, export_columns, include_archived=False):
+    """Yield formatted export rows, newest first, from a server-side cursor.
+
+    With include_archived the archived rows follow the live ones; they are all
+    older, so the order holds across both tables.
+    """
+    for table in export_sources(model, include_archived):
+        statement = (
+            db.select(*[table.c[column.key] for _, column in export_columns])
+            .order_by(table.c.submitted_at.desc())
+        )
+        result = db.session.execute(statement.execution_options(yield_per=EXPORT_CHUNK_SIZE))
+        try:
+            for row in result:
+                yield [export_value(value) for value in row]
+        finally:
+            result.close()
+
+# Providers that ignore dots in the local part
+DOTLESS_EMAIL_DOMAINS = {'gmail.com': 'gmail.com', 'googlemail.com': 'gmail.com'}
+
+def normalize_email(email):
+    """Key that identifies a mailbox: lowercased, without +tags (and dots for Gmail)"""
+    local, _, domain = email.strip().lower().rpartition('@')
+    if not local:
+        return email.strip().lower()
+    local = local.split('+', 1)[0] or local
+    if domain in DOTLESS_EMAIL_DOMAINS:
+        domain = DOTLESS_EMAIL_DOMAINS[domain]
+        local = local.replace('.', '')
+    return f'{local}@{domain}'
+
+def ensure_registration_email_key(connection):
+    """Add the email_normalized column to older local databases (ensure_indexes() adds its index).
+
+    MySQL databases get it from migrations/0006_registration_email_key.sql.
+    """
+    columns = {column['name'] for column in sqlalchemy_inspect(connection).get_columns('user_registrations')}
+    if 'email_normalized' not in columns:
+        connection.execute(db.text('ALTER TABLE user_registrations ADD COLUMN email_normalized VARCHAR(255) NULL'))
+        logger.info('Added user_registrations.email_normalized; run dedupe_registrations.py to fill it')
+
+# Indexes dropped from the models: (submitted_at, id) covers submitted_at alone,
+# and the rating filters never used their (rating, submitted_at, id) indexes
+OBSOLETE_INDEXES = {
+    'user_registrations': ['ix_user_registrations_submitted_at'],
+    'feedback': ['ix_feedback_submitted_at'] + [f'ix_feedback_{dimension}_submitted_at' for dimension in RATING_DIMENSIONS]
+}
+
+def ensure_indexes(connection):
+    """Create model indexes missing from tables that already existed (create_all skips those)"""
+    for model in (UserRegistration, Feedback):
+        existing = {index['name'] for index in sqlalchemy_inspect(connection).get_indexes(model.__tablename__)}
+        for index in model.__table__.indexes:
+            if index.name not in existing:
+                index.create(connection)
+                logger.info(f'Created index {index.name}')
+        for name in OBSOLETE_INDEXES[model.__tablename__]:
+            if name in existing:
+                db.Index(name, model.__table__.c.submitted_at).drop(connection)
+                logger.info(f'Dropped index {name}')
+
+def stage_records(records):
+    """Fold repeat registrations in `records` into existing rows.
+
+    Registrations are matched on email_normalized with a single indexed query
+    for the whole list, which also catches repeats within the list itself.
+    A match is returned unchanged instead of inserted. Returns
+    (record, created) pairs in order; the caller inserts the created ones.
+    """
+    keys = {record.email_normalized for record in records if isinstance(record, UserRegistration)}
+    existing = {}
+    if keys:
+        existing = {
+            row.email_normalized: row
+            for row in db.session.execute(
+                db.select(UserRegistration).where(UserRegistration.email_normalized.in_(keys))
+            ).scalars()
+        }
+
+    staged = []
+    for record in records:
+        if isinstance(record, UserRegistration):
+            match = existing.get(record.email_normalized)
+            if match is not None:
+                staged.append((match, False))
+                continue
+            existing[record.email_normalized] = record
+        staged.append((record, True))
+    return staged
+
+# Rows per INSERT statement, to stay well below MySQL's max_allowed_packet
+INSERT_CHUNK_SIZE = 100
+
+# MySQL's @@auto_increment_increment and @@innodb_autoinc_lock_mode, read once
+mysql_auto_increment = {}
+
+def mysql_id_settings(session):
+    """(auto_increment_increment, innodb_autoinc_lock_mode) of the MySQL server"""
+    if not mysql_auto_increment:
+        increment, lock_mode = session.execute(
+            db.text('SELECT @@auto_increment_increment, @@innodb_autoinc_lock_mode')
+        ).one()
+        mysql_auto_increment.update(increment=int(increment), lock_mode=int(lock_mode))
+        if mysql_auto_increment['lock_mode'] > 1:
+            logger.warning(
+                f'innodb_autoinc_lock_mode is {lock_mode}: batches are inserted one row per statement; '
+                'set it to 1 for multi-row inserts'
+            )
+    return mysql_auto_increment['increment'], mysql_auto_increment['lock_mode']
+
+def insert_chunk(session, table, columns, chunk):
+    """Insert `chunk` (new records for `table`) with one INSERT statement and set their ids.
+
+    MySQL has no RETURNING. LAST_INSERT_ID() is the id of the statement's
+    first row, and with innodb_autoinc_lock_mode 0 or 1 InnoDB gives the rows
+    of a multi-row INSERT consecutive ids, auto_increment_increment apart.
+    With lock mode 2 (interleaved) that is not guaranteed, so insert_rows()
+    only sends one-row chunks there. SQLite returns the ids with RETURNING, in
+    no particular order; rowids grow in VALUES order, so sorting them
+    restores it.
+    """
+    params = {f'{column}_{i}': getattr(record, column) for i, record in enumerate(chunk) for column in columns}
+    if session.get_bind().dialect.name == 'mysql':
+        first_id = session.execute(multi_row_insert(table, columns, len(chunk)), params).lastrowid
+        increment, _ = mysql_id_settings(session)
+        ids = [first_id + i * increment for i in range(len(chunk))]
+    else:
+        ids = sorted(session.execute(
+            multi_row_insert(table, columns, len(chunk), ' RETURNING id'), params
+        ).scalars())
+    for record, record_id in zip(chunk, ids):
+        record.id = record_id
+
+def insert_rows(records):
+    """Insert new `records` with multi-row INSERT statements and set their ids.
+
+    An ORM flush sends one INSERT per row on MySQL, which has no RETURNING;
+    here each model gets one statement per INSERT_CHUNK_SIZE rows (see
+    insert_chunk() for how the ids are found). The ORM flush hooks do not see
+    these rows, so rollups and cache generations are updated here.
+    """
+    session = db.session
+    chunk_size = INSERT_CHUNK_SIZE
+    if session.get_bind().dialect.name == 'mysql' and mysql_id_settings(session)[1] > 1:
+        chunk_size = 1
+    for model in (UserRegistration, Feedback):
+        pending = [record for record in records if isinstance(record, model)]
+        if not pending:
+            continue
+        table = model.__table__
+        columns = [column.key for column in table.columns if column.key != 'id']
+        for record in pending:
+            if record.submitted_at is None:
+                record.submitted_at = datetime.utcnow()
+        for start in range(0, len(pending), chunk_size):
+            insert_chunk(session, table, columns, pending[start:start + chunk_size])
+        session.info.setdefault('inserted_tables', set()).add(table.name)
+    fold_into_rollups(session.connection(), records)
+
+def insert_records(records):
+    """Insert `records` in a single transaction, with multi-row INSERTs (see insert_rows()).
+
+    Returns (id, submitted_at, created) for each, in order; `created` is False
+    when a registration matched an existing one. If a concurrent transaction
+    registers the same email first, the unique index rejects the insert and
+    the whole group is retried once, when the lookup will find that row.
+    """
+    for attempt in range(2):
+        try:
+            staged = stage_records(records)
+            insert_rows([record for record, created in staged if created])
+            results = [(record.id, record.submitted_at, created) for record, created in staged]
+            db.session.commit()
+            return results
+        except IntegrityError:
+            db.session.rollback()
+            if attempt:
+                raise
+            # Rolled-back rows keep the ids the failed insert gave them
+            for record in records:
+                record.id = None
+        except Exception:
+            db.session.rollback()
+            raise
+
+# Payload schemas of the submission endpoints, compiled once into validators
+# that check, normalize and map a payload to column values in one pass
+REGISTRATION_SCHEMA = [
+    Text('name', 'name', required=True),
+    Email('email', 'email', required=True),
+    Derived('email_normalized', 'email', normalize_email),
+    Text('phone', 'phone', required=True),
+    Text('gender', 'gender'),
+    Text('profession', 'profession'),
+    Choice('userType', 'user_type', ['USER', 'Creator'], 'User type must be USER or Creator'),
+]
+
+FEEDBACK_SCHEMA = [
+    Rating('visualDesign', 'visual_design', explain='visualDesignIssue'),
+    Rating('easeOfNavigation', 'ease_of_navigation', explain='easeOfNavigationIssue'),
+    Rating('mobileResponsiveness', 'mobile_responsiveness', explain='mobileResponsivenessIssue'),
+    Rating('overallSatisfaction', 'overall_satisfaction', explain='overallSatisfactionIssue'),
+    Rating('easeOfTasks', 'ease_of_tasks', explain='easeOfTasksIssue'),
+    Rating('qualityOfServices', 'quality_of_services', explain='qualityOfServicesIssue'),
+
+    Text('visualDesignIssue', 'visual_design_issue'),
+    Text('easeOfNavigationIssue', 'ease_of_navigation_issue'),
+    Text('mobileResponsivenessIssue', 'mobile_responsiveness_issue'),
+    Text('overallSatisfactionIssue', 'overall_satisfaction_issue'),
+    Text('easeOfTasksIssue', 'ease_of_tasks_issue'),
+    Text('qualityOfServicesIssue', 'quality_of_services_issue'),
+
+    Text('likeMost', 'like_most'),
+    Text('improvements', 'improvements'),
+    Text('features', 'features'),
+    Text('legalChallenges', 'legal_challenges'),
+    Text('additionalComments', 'additional_comments'),
+
+    Text('contactWilling', 'contact_willing'),
+    Email('contactEmail', 'contact_email', required_when=('contactWilling', 'yes')),
+]
+
+validate_registration = compile_validator(REGISTRATION_SCHEMA, first_error_only=True, name='validate_registration')
+validate_feedback = compile_validator(FEEDBACK_SCHEMA, name='validate_feedback')
+
+def parse_registration(data):
+    """Validate registration form data; returns (error payload or None, column values)"""
+    errors, values = validate_registration(data)
+    return ({'error': errors[0]} if errors else None), values
+
+def parse_feedback(data):
+    """Validate feedback form data; returns (error payload or None, column values)"""
+    errors, values = validate_feedback(data)
+    return ({'error': 'Validation failed', 'details': errors} if errors else None), values
+
+def client_ip():
+    """Client address, preferring the proxy's X-Forwarded-For header"""
+    return request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr)
+
+def export_sources(model, include_archived=False):
+    """Tables an export of `model` reads: the live table, and its archive on request"""
+    if include_archived:
+        return [model.__table__, ARCHIVE_TABLES[model]]
+    return [model.__table__]
+
+def export_watermark(include_archived=False):
+    """Cheap change marker for exports: max id and row count of each table"""
+    watermark = {}
+    for model in (UserRegistration, Feedback):
+        for table in export_sources(model, include_archived):
+            watermark[table.name] = list(db.session.execute(
+                db.select(db.func.max(table.c.id), db.func.count()).select_from(table)
+            ).one())
+    return watermark
+
+def generate_excel_report(include_archived=False):
+    """Generate Excel file with user registrations and feedback data.
+
+    Returns a temporary file positioned at the start of the workbook, or None
+    on failure. The caller is responsible for closing it.
+    """
+    try:
+        # openpyxl is only loaded by the workers that actually build a workbook
+        from excel_export import build_workbook
+
+        return build_workbook([
+            (
+                "User Registrations",
+                [header for header, _ in REGISTRATION_EXPORT_COLUMNS],
+                stream_export_rows(UserRegistration, REGISTRATION_EXPORT_COLUMNS, include_archived)
+            ),
+            (
+                "Feedback Submissions",
+                [header for header, _ in FEEDBACK_EXPORT_COLUMNS],
+                stream_export_rows(Feedback, FEEDBACK_EXPORT_COLUMNS, include_archived)
+            ),
+        ])
 
     except Exception as e:
         logger.error(f'Error generating Excel report: {str(e)}')
         return None
 
+# Tables available through the streaming CSV / NDJSON export endpoints
+EXPORT_TABLES = {
+    'registrations': UserRegistration,
+    'feedback': Feedback
+}
+
+EXPORT_FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson'
+}
+
+def iter_table_chunks(model, include_archived=False, after_id=0, upto_id=None):
+    """Yield rows of `model`'s table in primary-key order, one keyset chunk at a time.
+
+    Only the TEXT_EXPORT_COLUMNS of rows with after_id < id <= upto_id are read.
+    With include_archived the archive comes first: its rows are the oldest.
+    """
+    names = TEXT_EXPORT_COLUMNS[model]
+    for table in reversed(export_sources(model, include_archived)):
+        columns = [table.c[name] for name in names]
+        upper = [] if upto_id is None else [table.c.id <= upto_id]
+        last_id = after_id
+        while True:
+            rows = db.session.execute(
+                db.select(*columns)
+                .where(table.c.id > last_id, *upper)
+                .order_by(table.c.id)
+                .limit(EXPORT_CHUNK_SIZE)
+            ).all()
+            if not rows:
+                break
+            yield rows
+            if len(rows) < EXPORT_CHUNK_SIZE:
+                break
+            last_id = rows[-1].id
+
+def text_export_value(value):
+    """Convert a database value for CSV / NDJSON output"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def generate_csv_export(model, include_archived=False, after_id=0, upto_id=None):
+    """Stream `model`'s table as CSV, one chunk of rows per yielded string"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(TEXT_EXPORT_COLUMNS[model])
+    yield buffer.getvalue()
+
+    for rows in iter_table_chunks(model, include_archived, after_id, upto_id):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([text_export_value(value) for value in row] for row in rows)
+        yield buffer.getvalue()
+
+def generate_ndjson_export(model, include_archived=False, after_id=0, upto_id=None):
+    """Stream `model`'s table as newline-delimited JSON, one object per row"""
+    names = TEXT_EXPORT_COLUMNS[model]
+    for rows in iter_table_chunks(model, include_archived, after_id, upto_id):
+        yield ''.join(
+            json.dumps(dict(zip(names, map(text_export_value, row))), ensure_ascii=False) + '\n'
+            for row in rows
+        )
+
+def parse_since_id(value):
+    """Parse a since_id query parameter; raises ValueError if malformed"""
+    if not value.isdigit():
+        raise ValueError(f'Invalid since_id: {value} (expected a non-negative integer)')
+    return int(value)
+
+def parse_since(value):
+    """Parse a since query parameter as a naive UTC datetime; raises ValueError if malformed"""
+    try:
+        moment = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'Invalid since: {value} (expected an ISO 8601 timestamp)')
+    if moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc).replace(tzinfo=None)
+    return moment
+
+def settled_export_id(model, include_archived=False):
+    """Highest id an export of `model` can include without skipping a row later.
+
+    Ids are assigned at insert but transactions can commit out of order, so a
+    lower id may still appear after a higher one has committed. The watermark
+    is therefore the newest row submitted more than EXPORT_COMMIT_LAG seconds
+    ago (read from the (submitted_at, id) index); delta exports leave newer
+    rows for a later call.
+    """
+    cutoff = datetime.utcnow() - timedelta(seconds=EXPORT_COMMIT_LAG)
+    return max(
+        db.session.execute(
+            db.select(table.c.id)
+            .where(table.c.submitted_at <= cutoff)
+            .order_by(table.c.submitted_at.desc(), table.c.id.desc())
+            .limit(1)
+        ).scalar() or 0
+        for table in export_sources(model, include_archived)
+    )
+
+def first_id_since(model, since, include_archived=False, default=0):
+    """Id to export after so that a delta starts at the first row submitted after `since`.
+
+    Read from the (submitted_at, id) indexes; returns `default` when nothing
+    was submitted since.
+    """
+    first = [
+        db.session.execute(db.select(db.func.min(table.c.id)).where(table.c.submitted_at > since)).scalar()
+        for table in export_sources(model, include_archived)
+    ]
+    first = [row_id for row_id in first if row_id is not None]
+    return min(first) - 1 if first else default
+
+def open_excel_snapshot(etag, include_archived=False):
+    """Open the cached workbook for `etag`, building it first if needed"""
+    name = 'lawvriksh_data_all' if include_archived else 'lawvriksh_data'
+    for _ in range(2):
+        path = export_snapshots.get(name, etag, '.xlsx')
+        if path is None:
+            # Only one worker builds a given snapshot; the others wait and reuse it
+            with export_snapshots.lock(name):
+                path = export_snapshots.get(name, etag, '.xlsx')
+                if path is None:
+                    excel_file = generate_excel_report(include_archived)
+                    if not excel_file:
+                        return None
+                    with excel_file:
+                        path = export_snapshots.put(name, etag, excel_file, '.xlsx')
+        try:
+            return open(path, 'rb')
+        except FileNotFoundError:
+            # Pruned by a worker that built a newer snapshot; look again
+            continue
+    return None
+
+def build_excel_report_in_context():
+    """Generate the Excel report from a background thread"""
+    with app.app_context():
+        return generate_excel_report()
+
+# Keep a local Excel file up to date in development, or when EXCEL_AUTOSAVE=1
+# (e.g. staging). Rebuilds are debounced and run off the request path.
+excel_regenerator = None
+if os.environ.get('FLASK_ENV') == 'development' or os.environ.get('EXCEL_AUTOSAVE') == '1':
+    excel_regenerator = ExcelRegenerator(
+        build_excel_report_in_context,
+        os.environ.get('EXCEL_AUTOSAVE_PATH', 'lawvriksh_data.xlsx'),
+        debounce=float(os.environ.get('EXCEL_AUTOSAVE_DEBOUNCE', '2')),
+        max_delay=float(os.environ.get('EXCEL_AUTOSAVE_MAX_DELAY', '30'))
+    )
+
+def commit_record_group(factories):
+    """Insert one record per factory in a single transaction (group commit thread)"""
+    with app.app_context():
+        return insert_records([factory() for factory in factories])
+
+# Optional group commit: concurrent submissions in a worker share one transaction.
+# Only useful with a threaded worker class, where requests actually overlap.
+group_committer = None
+if os.environ.get('GROUP_COMMIT') == '1':
+    metrics.histogram(
+        'group_commit_batch_size', 'Rows committed per group commit transaction.',
+        buckets=(1, 2, 4, 8, 16, 32, 64, 128)
+    )
+    metrics.histogram('group_commit_wait_seconds', 'Time a submission waited for its group commit.')
+
+    def observe_group_commit(batch_size, waits):
+        metrics.observe('group_commit_batch_size', batch_size)
+        for wait in waits:
+            metrics.observe('group_commit_wait_seconds', wait)
+
+    group_committer = GroupCommitter(
+        commit_record_group,
+        observer=observe_group_commit,
+        window=float(os.environ.get('GROUP_COMMIT_WINDOW_MS', '5')) / 1000,
+        max_batch=int(os.environ.get('GROUP_COMMIT_MAX_BATCH', '100'))
+    )
+
+def save_record(factory):
+    """Insert the record built by `factory()` and return (id, submitted_at, created) after commit"""
+    if group_committer:
+        return group_committer.submit(factory)
+
+    return insert_records([factory()])[0]
+
+# Per-client rate limit on the public submission endpoints, shared by all
+# workers through the local store. RATE_LIMIT_PER_MINUTE=0 turns it off.
+RATE_LIMITED_ENDPOINTS = {'register_user', 'submit_feedback', 'register_batch', 'submit_feedback_batch'}
+RATE_LIMIT_PER_MINUTE = float(os.environ.get('RATE_LIMIT_PER_MINUTE', '30'))
+RATE_LIMIT_BURST = float(os.environ.get('RATE_LIMIT_BURST', '10'))
+
+rate_limiter = None
+if RATE_LIMIT_PER_MINUTE > 0:
+    rate_limiter = TokenBucketLimiter(local_store, RATE_LIMIT_PER_MINUTE / 60, RATE_LIMIT_BURST)
+
+metrics.counter('rate_limited_requests_total', 'Submissions rejected by the per-client rate limit, by route.')
+
+@app.before_request
+def enforce_rate_limit():
+    """Reject over-limit submissions with 429 before any database work"""
+    if rate_limiter is None or request.endpoint not in RATE_LIMITED_ENDPOINTS:
+        return None
+
+    try:
+        retry_after = rate_limiter.consume(client_ip() or 'unknown')
+    except Exception as e:
+        # Fail open: a broken store must not take the forms down
+        logger.warning(f'Rate limiter unavailable: {str(e)}')
+        return None
+
+    if not retry_after:
+        return None
+
+    metrics.inc('rate_limited_requests_total', {'route': request.url_rule.rule})
+    logger.warning(f'Rate limit exceeded for {client_ip()} on {request.path}')
+    response = jsonify({'error': 'Too many requests, please try again later'})
+    response.status_code = 429
+    response.headers['Retry-After'] = str(max(int(math.ceil(retry_after)), 1))
+    return response
+
 # API Routes
 @app.route('/')
 def home():
@@ -367,6 +1728,21 @@ def admin_dashboard():
     """Admin dashboard for managing data and downloading Excel files"""
     return render_template('admin.html')
 
+@app.route('/metrics', methods=['GET'])
+def prometheus_metrics():
+    """Prometheus metrics aggregated across all workers (admin only)"""
+    try:
+        # Check authentication
+        api_key = request.headers.get('X-API-Key')
+        if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
+
+    except Exception as e:
+        logger.error(f'Error rendering metrics: {str(e)}')
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -381,56 +1757,36 @@ def register_user():
         if not data:
             return jsonify({'error': 'No data provided'}), 400
 
-        # Validate required fields
-        required_fields = ['name', 'email', 'phone', 'userType']
-        for field in required_fields:
-            if not data.get(field):
-                return jsonify({'error': f'{field} is required'}), 400
-
-        # Validate email format
-        email = data.get('email', '').strip()
-        if '@' not in email or '.' not in email:
-            return jsonify({'error': 'Please provide a valid email address'}), 400
-
-        # Validate user type
-        user_type = data.get('userType')
-        if user_type not in ['USER', 'Creator']:
-            return jsonify({'error': 'User type must be USER or Creator'}), 400
+        validation_error, values = parse_registration(data)
+        if validation_error:
+            return jsonify(validation_error), 400
 
         # Create user registration record
-        registration = UserRegistration(
-            name=data.get('name', '').strip(),
-            email=email,
-            phone=data.get('phone', '').strip(),
-            gender=data.get('gender', '').strip() or None,
-            profession=data.get('profession', '').strip() or None,
-            user_type=user_type,
-            ip_address=request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr),
-            user_agent=request.headers.get('User-Agent')
+        ip_address = client_ip()
+        user_agent = request.headers.get('User-Agent')
+        registration_id, submitted_at, created = save_record(
+            lambda: UserRegistration(**values, ip_address=ip_address, user_agent=user_agent)
         )
 
-        db.session.add(registration)
-        db.session.commit()
+        # Queue a background refresh of the local Excel file (development/staging only)
+        if excel_regenerator and created:
+            excel_regenerator.request()
 
-        # Generate updated Excel file (only save locally in development)
-        if os.environ.get('FLASK_ENV') == 'development':
-            excel_buffer = generate_excel_report()
-            if excel_buffer:
-                # Save Excel file to disk with error handling (development only)
-                try:
-                    with open('lawvriksh_data.xlsx', 'wb') as f:
-                        f.write(excel_buffer.getvalue())
-                except PermissionError:
-                    logger.warning('Could not update Excel file - file may be open in another program')
-                except Exception as e:
-                    logger.error(f'Error saving Excel file: {str(e)}')
+        if not created:
+            logger.info(f'Duplicate registration matched existing ID: {registration_id}')
+            return jsonify({
+                'message': 'Registration already exists',
+                'id': registration_id,
+                'submitted_at': submitted_at.isoformat(),
+                'duplicate': True
+            }), 200
 
-        logger.info(f'User registration submitted successfully with ID: {registration.id}')
+        logger.info(f'User registration submitted successfully with ID: {registration_id}')
 
         return jsonify({
             'message': 'Registration submitted successfully',
-            'id': registration.id,
-            'submitted_at': registration.submitted_at.isoformat()
+            'id': registration_id,
+            'submitted_at': submitted_at.isoformat()
         }), 201
 
     except Exception as e:
@@ -448,61 +1804,27 @@ def submit_feedback():
             return jsonify({'error': 'No data provided'}), 400
         
         # Validate data
-        validation_errors = validate_feedback_data(data)
-        if validation_errors:
-            return jsonify({'error': 'Validation failed', 'details': validation_errors}), 400
+        validation_error, values = parse_feedback(data)
+        if validation_error:
+            return jsonify(validation_error), 400
         
         # Create feedback record
-        feedback = Feedback(
-            visual_design=int(data.get('visualDesign')) if data.get('visualDesign') else None,
-            ease_of_navigation=int(data.get('easeOfNavigation')) if data.get('easeOfNavigation') else None,
-            mobile_responsiveness=int(data.get('mobileResponsiveness')) if data.get('mobileResponsiveness') else None,
-            overall_satisfaction=int(data.get('overallSatisfaction')) if data.get('overallSatisfaction') else None,
-            ease_of_tasks=int(data.get('easeOfTasks')) if data.get('easeOfTasks') else None,
-            quality_of_services=int(data.get('qualityOfServices')) if data.get('qualityOfServices') else None,
-            
-            visual_design_issue=data.get('visualDesignIssue', '').strip() or None,
-            ease_of_navigation_issue=data.get('easeOfNavigationIssue', '').strip() or None,
-            mobile_responsiveness_issue=data.get('mobileResponsivenessIssue', '').strip() or None,
-            overall_satisfaction_issue=data.get('overallSatisfactionIssue', '').strip() or None,
-            ease_of_tasks_issue=data.get('easeOfTasksIssue', '').strip() or None,
-            quality_of_services_issue=data.get('qualityOfServicesIssue', '').strip() or None,
-            
-            like_most=data.get('likeMost', '').strip() or None,
-            improvements=data.get('improvements', '').strip() or None,
-            features=data.get('features', '').strip() or None,
-            legal_challenges=data.get('legalChallenges', '').strip() or None,
-            additional_comments=data.get('additionalComments', '').strip() or None,
-            
-            contact_willing=data.get('contactWilling', '').strip() or None,
-            contact_email=data.get('contactEmail', '').strip() or None,
-            
-            ip_address=request.environ.get('HTTP_X_FORWARDED_FOR', request.remote_addr),
-            user_agent=request.headers.get('User-Agent')
+        ip_address = client_ip()
+        user_agent = request.headers.get('User-Agent')
+        feedback_id, submitted_at, _ = save_record(
+            lambda: Feedback(**values, ip_address=ip_address, user_agent=user_agent)
         )
-        
-        db.session.add(feedback)
-        db.session.commit()
-
-        # Generate updated Excel file (only save locally in development)
-        if os.environ.get('FLASK_ENV') == 'development':
-            excel_buffer = generate_excel_report()
-            if excel_buffer:
-                # Save Excel file to disk with error handling (development only)
-                try:
-                    with open('lawvriksh_data.xlsx', 'wb') as f:
-                        f.write(excel_buffer.getvalue())
-                except PermissionError:
-                    logger.warning('Could not update Excel file - file may be open in another program')
-                except Exception as e:
-                    logger.error(f'Error saving Excel file: {str(e)}')
 
-        logger.info(f'Feedback submitted successfully with ID: {feedback.id}')
+        # Queue a background refresh of the local Excel file (development/staging only)
+        if excel_regenerator:
+            excel_regenerator.request()
+
+        logger.info(f'Feedback submitted successfully with ID: {feedback_id}')
 
         return jsonify({
             'message': 'Feedback submitted successfully',
-            'id': feedback.id,
-            'submitted_at': feedback.submitted_at.isoformat()
+            'id': feedback_id,
+            'submitted_at': submitted_at.isoformat()
         }), 201
         
     except Exception as e:
@@ -510,6 +1832,101 @@ def submit_feedback():
         logger.error(f'Error submitting feedback: {str(e)}')
         return jsonify({'error': 'Internal server error'}), 500
 
+# Largest array accepted by the batch ingestion endpoints
+BATCH_MAX_ITEMS = int(os.environ.get('BATCH_MAX_ITEMS', '500'))
+
+def ingest_batch(label, parse, model):
+    """Validate a JSON array of submissions and insert the valid ones in one transaction.
+
+    Returns a response with one result per item, in request order: the new id
+    (or the existing one for a repeat registration), or the validation errors
+    for that item.
+    """
+    items = request.get_json()
+
+    if not items:
+        return jsonify({'error': 'No data provided'}), 400
+    if not isinstance(items, list):
+        return jsonify({'error': 'Request body must be a JSON array'}), 400
+    if len(items) > BATCH_MAX_ITEMS:
+        return jsonify({'error': f'At most {BATCH_MAX_ITEMS} items are allowed per batch'}), 400
+
+    ip_address = client_ip()
+    user_agent = request.headers.get('User-Agent')
+    results = []
+    valid = []
+    for index, item in enumerate(items):
+        try:
+            if not isinstance(item, dict):
+                error = {'error': 'Each item must be a JSON object'}
+            elif not item:
+                error = {'error': 'No data provided'}
+            else:
+                error, values = parse(item)
+            if error is None:
+                valid.append((index, model(**values, ip_address=ip_address, user_agent=user_agent)))
+        except (AttributeError, TypeError, ValueError):
+            error = {'error': 'Invalid item'}
+        results.append({'index': index, **error} if error else None)
+
+    created = 0
+    if valid:
+        saved = insert_records([record for _, record in valid])
+
+        for (index, _), (record_id, submitted_at, is_new) in zip(valid, saved):
+            results[index] = {
+                'index': index,
+                'id': record_id,
+                'submitted_at': submitted_at.isoformat()
+            }
+            if is_new:
+                created += 1
+            else:
+                results[index]['duplicate'] = True
+
+        if excel_regenerator and created:
+            excel_regenerator.request()
+
+    failed = len(items) - len(valid)
+    duplicates = len(valid) - created
+    logger.info(f'{label} batch processed: {created} created, {duplicates} duplicates, {failed} failed')
+
+    if not valid:
+        status = 400
+    elif failed:
+        status = 207
+    else:
+        status = 201
+
+    return jsonify({
+        'created': created,
+        'duplicates': duplicates,
+        'failed': failed,
+        'results': results
+    }), status
+
+@app.route('/api/register/batch', methods=['POST'])
+def register_batch():
+    """Register many users (USER or Creator) in one request"""
+    try:
+        return ingest_batch('Registration', parse_registration, UserRegistration)
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f'Error submitting registration batch: {str(e)}')
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/feedback/batch', methods=['POST'])
+def submit_feedback_batch():
+    """Submit many feedback forms in one request"""
+    try:
+        return ingest_batch('Feedback', parse_feedback, Feedback)
+
+    except Exception as e:
+        db.session.rollback()
+        logger.error(f'Error submitting feedback batch: {str(e)}')
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/api/feedback', methods=['GET'])
 def get_feedback():
     """Get all feedback (admin only - add authentication in production)"""
@@ -520,19 +1937,52 @@ def get_feedback():
         if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
             return jsonify({'error': 'Unauthorized'}), 401
         
+        list_format = request.args.get('format', 'json')
+        if list_format not in LIST_FORMATS:
+            return jsonify({'error': 'format must be json or columnar'}), 400
+        try:
+            fields = parse_fields(request.args.get('fields'), FEEDBACK_LIST_COLUMNS)
+            filters = feedback_filters(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        cache_key, etag, cached = lookup_list_cache('feedback')
+        if cached is not None:
+            return cached
+
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
         
         if per_page > 100:
             per_page = 100
         
-        feedback_query = Feedback.query.order_by(Feedback.submitted_at.desc())
+        # Cursor mode: ?after=<token> (empty for the first page), total only on request
+        if 'after' in request.args:
+            try:
+                rows, next_after = keyset_page(
+                    Feedback, request.args['after'], per_page, list_load_options(Feedback, fields), filters
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
+            result = {
+                'feedback': serialize_rows(rows, fields or FEEDBACK_LIST_COLUMNS, list_format),
+                'next_after': next_after,
+                'per_page': per_page
+            }
+            if request.args.get('include_total') == '1':
+                result['total'] = db.session.execute(
+                    db.select(db.func.count()).select_from(Feedback).where(*filters)
+                ).scalar()
+            return cache_list_response(cache_key, etag, result)
+
+        feedback_query = list_query(Feedback, filters, list_load_options(Feedback, fields))
         feedback_paginated = feedback_query.paginate(
             page=page, per_page=per_page, error_out=False
         )
         
-        return jsonify({
-            'feedback': [f.to_dict() for f in feedback_paginated.items],
+        return cache_list_response(cache_key, etag, {
+            'feedback': serialize_rows(feedback_paginated.items, fields or FEEDBACK_LIST_COLUMNS, list_format),
             'total': feedback_paginated.total,
             'pages': feedback_paginated.pages,
             'current_page': page,
@@ -543,6 +1993,112 @@ def get_feedback():
         logger.error(f'Error retrieving feedback: {str(e)}')
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/feedback/search', methods=['GET'])
+def search_feedback_route():
+    """Full-text search over the free-text feedback answers (admin only)"""
+    try:
+        # Check authentication
+        api_key = request.headers.get('X-API-Key')
+        if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        try:
+            terms = parse_search_query(request.args.get('q'))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        cache_key, etag, cached = lookup_list_cache('feedback')
+        if cached is not None:
+            return cached
+
+        per_page = min(request.args.get('per_page', 20, type=int), 100)
+        try:
+            rows, next_after = search_feedback(terms, request.args.get('after'), per_page)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        return cache_list_response(cache_key, etag, {
+            'results': [
+                {
+                    'score': round(float(score), 6),
+                    'matches': search_snippets(row, terms),
+                    'feedback': row.to_dict()
+                }
+                for row, score in rows
+            ],
+            'next_after': next_after,
+            'per_page': per_page
+        })
+
+    except Exception as e:
+        logger.error(f'Error searching feedback: {str(e)}')
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/stats', methods=['GET'])
+def get_stats():
+    """Headline numbers for the admin dashboard (admin only)"""
+    try:
+        # Check authentication
+        api_key = request.headers.get('X-API-Key')
+        if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        return jsonify(get_cached_stats())
+
+    except Exception as e:
+        logger.error(f'Error retrieving stats: {str(e)}')
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/admin/status', methods=['GET'])
+def admin_status():
+    """State of background workers in this process (admin only)"""
+    try:
+        # Check authentication
+        api_key = request.headers.get('X-API-Key')
+        if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        return jsonify({
+            'pid': os.getpid(),
+            'excel_regenerator': excel_regenerator.state() if excel_regenerator else None,
+            'group_commit': group_committer.stats() if group_committer else None
+        })
+
+    except Exception as e:
+        logger.error(f'Error retrieving status: {str(e)}')
+        return jsonify({'error': 'Internal server error'}), 500
+
+@app.route('/api/analytics', methods=['GET'])
+def get_analytics():
+    """Rating distributions and submission trends over a date range (admin only)"""
+    try:
+        # Check authentication
+        api_key = request.headers.get('X-API-Key')
+        if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        today = datetime.utcnow().date()
+        try:
+            end = parse_day(request.args.get('end'), today)
+            start = parse_day(request.args.get('start'), end - timedelta(days=29))
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        if start > end:
+            return jsonify({'error': 'start must not be after end'}), 400
+        if (end - start).days >= ANALYTICS_MAX_DAYS:
+            return jsonify({'error': f'Date range must be at most {ANALYTICS_MAX_DAYS} days'}), 400
+
+        interval = request.args.get('interval', 'day')
+        if interval not in ('day', 'week', 'month'):
+            return jsonify({'error': 'interval must be day, week or month'}), 400
+
+        return jsonify(compute_analytics(start, end, interval))
+
+    except Exception as e:
+        logger.error(f'Error retrieving analytics: {str(e)}')
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/api/download-excel', methods=['GET'])
 def download_excel():
     """Download Excel file with all data (admin only)"""
@@ -552,23 +2108,137 @@ def download_excel():
         if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
             return jsonify({'error': 'Unauthorized'}), 401
 
-        # Generate Excel file
-        excel_buffer = generate_excel_report()
-        if not excel_buffer:
+        # Archived rows are only included on request (?include_archived=1)
+        include_archived = request.args.get('include_archived') == '1'
+
+        # Reuse the cached snapshot unless new rows were submitted since it was built
+        etag = make_etag(
+            'lawvriksh_data_all.xlsx' if include_archived else 'lawvriksh_data.xlsx',
+            export_watermark(include_archived)
+        )
+        if etag in request.if_none_match:
+            response = app.response_class(status=304)
+            response.set_etag(etag)
+            return response
+
+        excel_file = open_excel_snapshot(etag, include_archived)
+        if not excel_file:
             return jsonify({'error': 'Failed to generate Excel file'}), 500
 
-        # Return file as download
-        return send_file(
-            excel_buffer,
+        # Stream the file as a download; it is closed once the response is sent
+        response = send_file(
+            excel_file,
             as_attachment=True,
             download_name=f'lawvriksh_data_{datetime.now().strftime("%Y%m%d_%H%M%S")}.xlsx',
-            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+            mimetype='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet',
+            etag=etag
         )
+        response.headers['Cache-Control'] = 'private, no-cache'
+        return response
 
     except Exception as e:
         logger.error(f'Error downloading Excel file: {str(e)}')
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/export/<table>', methods=['GET'])
+def export_table(table):
+    """Stream registrations or feedback as CSV or NDJSON (admin only)"""
+    try:
+        # Check authentication
+        api_key = request.headers.get('X-API-Key')
+        if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
+            return jsonify({'error': 'Unauthorized'}), 401
+
+        model = EXPORT_TABLES.get(table)
+        if model is None:
+            return jsonify({'error': 'Endpoint not found'}), 404
+
+        export_format = request.args.get('format', 'csv')
+        if export_format not in EXPORT_FORMATS:
+            return jsonify({'error': 'format must be csv or ndjson'}), 400
+
+        # Archived rows are only included on request (?include_archived=1)
+        include_archived = request.args.get('include_archived') == '1'
+        variant = f'{table}_all' if include_archived else table
+
+        # Delta exports: only the rows added after ?since_id=<id> or ?since=<timestamp>
+        since_id = request.args.get('since_id')
+        since = request.args.get('since')
+        try:
+            if since_id is not None and since is not None:
+                raise ValueError('Use either since_id or since, not both')
+            after_id = parse_since_id(since_id) if since_id is not None else None
+            since = parse_since(since) if since is not None else None
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+        delta = after_id is not None or since is not None
+
+        encoding = response_encoding()
+        snapshot = None
+        # The next call passes X-Export-Watermark back as since_id
+        watermark_id = settled_export_id(model, include_archived)
+        if delta:
+            # Rows past the watermark are left for the next call
+            if since is not None:
+                after_id = first_id_since(model, since, include_archived, default=watermark_id)
+            upto_id = watermark_id = max(watermark_id, after_id)
+        else:
+            # Every committed row; the next delta may repeat the newest ones.
+            # The same export is served until a row is added, removed or archived
+            watermark = export_watermark(include_archived)
+            after_id = 0
+            upto_id = None
+            etag = make_etag(f'{variant}.{export_format}', [watermark, TEXT_EXPORT_COLUMNS[model]])
+            if request.if_none_match.contains_weak(etag):
+                response = app.response_class(status=304)
+                response.set_etag(etag, weak=True)
+                response.vary.add('Accept-Encoding')
+                response.headers['X-Export-Watermark'] = str(watermark_id)
+                return response
+
+            snapshot_name = f'{variant}_{export_format}_{encoding}'
+            snapshot_suffix = f'.{export_format}{SUFFIXES.get(encoding, "")}'
+            if encoding is not None:
+                path = export_snapshots.get(snapshot_name, etag, snapshot_suffix)
+                try:
+                    snapshot = open(path, 'rb') if path else None
+                except FileNotFoundError:
+                    # Pruned by a worker that stored a newer export; build it again
+                    snapshot = None
+
+        if snapshot is not None:
+            # Precompressed on an earlier download: send the file as it is
+            response = send_file(snapshot, mimetype=EXPORT_FORMATS[export_format], etag=False)
+            set_content_encoding(response, encoding, 'cache')
+        else:
+            if export_format == 'csv':
+                body = generate_csv_export(model, include_archived, after_id, upto_id)
+            else:
+                body = generate_ndjson_export(model, include_archived, after_id, upto_id)
+
+            if encoding is not None:
+                body = compress_stream(body, encoding, COMPRESSION_LEVELS[encoding])
+                if not delta:
+                    # Keep the compressed full export for the next download
+                    body = export_snapshots.put_stream(snapshot_name, etag, body, snapshot_suffix)
+            response = Response(stream_with_context(body), mimetype=EXPORT_FORMATS[export_format])
+            if encoding is not None:
+                set_content_encoding(response, encoding, 'live')
+
+        if not delta:
+            response.set_etag(etag, weak=True)
+        response.headers['X-Export-Watermark'] = str(watermark_id)
+        response.vary.add('Accept-Encoding')
+        response.headers['Cache-Control'] = 'private, no-cache'
+        response.headers['Content-Disposition'] = (
+            f'attachment; filename={table}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.{export_format}'
+        )
+        return response
+
+    except Exception as e:
+        logger.error(f'Error exporting {table}: {str(e)}')
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/api/registrations', methods=['GET'])
 def get_registrations():
     """Get all user registrations (admin only)"""
@@ -578,19 +2248,53 @@ def get_registrations():
         if api_key != os.environ.get('ADMIN_API_KEY', 'admin-key-123'):
             return jsonify({'error': 'Unauthorized'}), 401
 
+        list_format = request.args.get('format', 'json')
+        if list_format not in LIST_FORMATS:
+            return jsonify({'error': 'format must be json or columnar'}), 400
+        try:
+            fields = parse_fields(request.args.get('fields'), REGISTRATION_LIST_COLUMNS)
+            filters = registration_filters(request.args)
+        except ValueError as e:
+            return jsonify({'error': str(e)}), 400
+
+        cache_key, etag, cached = lookup_list_cache('user_registrations')
+        if cached is not None:
+            return cached
+
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 50, type=int)
 
         if per_page > 100:
             per_page = 100
 
-        registrations_query = UserRegistration.query.order_by(UserRegistration.submitted_at.desc())
+        # Cursor mode: ?after=<token> (empty for the first page), total only on request
+        if 'after' in request.args:
+            try:
+                rows, next_after = keyset_page(
+                    UserRegistration, request.args['after'], per_page,
+                    list_load_options(UserRegistration, fields), filters
+                )
+            except ValueError as e:
+                return jsonify({'error': str(e)}), 400
+
+            result = {
+                'registrations': serialize_rows(rows, fields or REGISTRATION_LIST_COLUMNS, list_format),
+                'next_after': next_after,
+                'per_page': per_page
+            }
+            if request.args.get('include_total') == '1':
+                result['total'] = db.session.execute(
+                    db.select(db.func.count()).select_from(UserRegistration).where(*filters)
+                ).scalar()
+            return cache_list_response(cache_key, etag, result)
+
+        registrations_query = list_query(UserRegistration, filters, list_load_options(UserRegistration, fields))
         registrations_paginated = registrations_query.paginate(
             page=page, per_page=per_page, error_out=False
         )
 
-        return jsonify({
-            'registrations': [r.to_dict() for r in registrations_paginated.items],
+        return cache_list_response(cache_key, etag, {
+            'registrations': serialize_rows(registrations_paginated.items, fields or REGISTRATION_LIST_COLUMNS, list_format),
             'total': registrations_paginated.total,
             'pages': registrations_paginated.pages,
             'current_page': page,
@@ -617,6 +2321,10 @@ def create_tables():
         with app.app_context():
             # Create all tables
             db.create_all()
+            with db.engine.begin() as connection:
+                ensure_search_index(connection)
+                ensure_registration_email_key(connection)
+                ensure_indexes(connection)
             logger.info('Database tables created successfully using MySQL')
             logger.info('Tables created: user_registrations, feedback')
 
@@ -625,6 +2333,9 @@ def create_tables():
         # Re-raise the exception so the app doesn't start with a broken database
         raise
 
+if os.environ.get('IMPORT_REPORT') == '1':
+    import_report.log_report(logger, top=int(os.environ.get('IMPORT_REPORT_TOP', '15')))
+
 if __name__ == '__main__':
     create_tables()
     port = int(os.environ.get('PORT', 3000))
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Move old registrations and feedback out of the live tables into the archive
+tables (user_registrations_archive, feedback_archive).
+
+Rows submitted more than --older-than days ago are moved oldest first, a
+chunk per transaction: the chunk's ids are read from the (submitted_at, id)
+index, copied with INSERT ... SELECT and deleted by primary key, so each
+transaction only locks the rows it moves and submissions keep flowing while
+a large backlog is archived. Live endpoints only read the live tables;
+exports include the archive with ?include_archived=1. The analytics rollups
+are not touched, and backfill_rollups.py counts archived rows as well.
+
+The row with the highest id always stays live, however old it is. SQLite
+(without AUTOINCREMENT) and MySQL before 8.0 (on restart) hand out new ids
+from the table's current max id, so archiving the newest row would let a new
+submission reuse an archived id; that would collide in the archive table and
+move export watermarks (since_id) backwards.
+
+Usage:
+    python archive_submissions.py [--older-than 365] [--table feedback] [--chunk-size 1000] [--pause 0.1] [--dry-run]
+"""
+
+import argparse
+import os
+import sys
+import time
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, bump_generation, ARCHIVE_TABLES, Feedback, UserRegistration
+from migrate import MigrationError, check_migrated
+
+TABLES = {
+    'registrations': UserRegistration,
+    'feedback': Feedback
+}
+
+
+def archive_rows(model, cutoff, chunk_size, pause, dry_run):
+    """Move rows of `model` submitted before `cutoff`; returns how many were (or would be) moved"""
+    live = model.__table__
+    archive = ARCHIVE_TABLES[model]
+    names = [column.name for column in live.columns]
+    # Keep the newest row live so its id stays the table's max id
+    newest = db.session.execute(db.select(db.func.max(live.c.id))).scalar()
+    older = db.and_(live.c.submitted_at < cutoff, live.c.id < (newest or 0))
+
+    if dry_run:
+        return db.session.execute(db.select(db.func.count()).select_from(live).where(older)).scalar()
+
+    moved = 0
+    while True:
+        ids = db.session.execute(
+            db.select(live.c.id).where(older)
+            .order_by(live.c.submitted_at, live.c.id)
+            .limit(chunk_size)
+        ).scalars().all()
+        if not ids:
+            break
+
+        archived_at = datetime.utcnow()
+        db.session.execute(archive.insert().from_select(
+            names + ['archived_at'],
+            db.select(*live.columns, db.literal(archived_at, db.DateTime)).where(live.c.id.in_(ids))
+        ))
+        db.session.execute(live.delete().where(live.c.id.in_(ids)))
+        db.session.commit()
+
+        moved += len(ids)
+        print(f"- {live.name}: {moved} rows moved")
+        if len(ids) < chunk_size:
+            break
+        if pause:
+            # Give replicas and queued writes room between chunks
+            time.sleep(pause)
+
+    if moved:
+        bump_generation(live.name)
+    return moved
+
+
+def archive_submissions(tables, older_than, chunk_size, pause, dry_run):
+    """Archive every row of `tables` older than `older_than` days"""
+    cutoff = datetime.utcnow() - timedelta(days=older_than)
+    print(f"Archiving rows submitted before {cutoff:%Y-%m-%d %H:%M} UTC{' (dry run)' if dry_run else ''}...")
+
+    with app.app_context():
+        for name in tables:
+            moved = archive_rows(TABLES[name], cutoff, chunk_size, pause, dry_run)
+            print(f"✅ {name}: {moved} rows {'to archive' if dry_run else 'archived'}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument(
+        '--older-than', type=int, default=int(os.environ.get('ARCHIVE_AFTER_DAYS', '365')),
+        help='archive rows submitted more than this many days ago (default: ARCHIVE_AFTER_DAYS or 365)'
+    )
+    parser.add_argument('--table', choices=sorted(TABLES), action='append', help='only archive this table (repeatable)')
+    parser.add_argument('--chunk-size', type=int, default=1000, help='rows per transaction')
+    parser.add_argument('--pause', type=float, default=0, help='seconds to sleep between chunks')
+    parser.add_argument('--dry-run', action='store_true', help='count the rows that would be archived')
+    args = parser.parse_args()
+
+    if args.older_than < 1:
+        parser.error('--older-than must be at least 1 day')
+
+    # The schema comes from migrate.py (or init_db.py locally); never change it here
+    try:
+        with app.app_context():
+            check_migrated(db.engine, db.metadata.sorted_tables)
+    except MigrationError as e:
+        print(f'❌ {e}')
+        sys.exit(1)
+
+    archive_submissions(args.table or list(TABLES), args.older_than, args.chunk_size, args.pause, args.dry_run)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+"""
+Rebuild the analytics rollup tables from the raw feedback and registration rows.
+
+New submissions keep the rollups up to date as they are inserted; run this
+once after deploying the rollup tables (or to repair them) so history that
+predates them is included. Archived rows are counted along with live ones.
+Run it while submissions are paused, since rows inserted during the rebuild
+may be counted twice.
+"""
+
+import os
+import sys
+from datetime import date
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import (
+    app, db, Feedback, UserRegistration, ARCHIVE_TABLES,
+    RatingDailyRollup, SubmissionDailyRollup, RATING_DIMENSIONS
+)
+from migrate import MigrationError, check_migrated
+
+
+def as_date(value):
+    # SQLite's date() returns a string, MySQL's DATE() a date
+    if isinstance(value, str):
+        return date.fromisoformat(value)
+    return value
+
+
+def live_and_archived(model, names):
+    """Subquery over `names` columns of `model`'s live table and its archive"""
+    return db.union_all(*[
+        db.select(*[table.c[name] for name in names])
+        for table in (model.__table__, ARCHIVE_TABLES[model])
+    ]).subquery()
+
+
+def rebuild_rollups():
+    """Recompute every rollup row with GROUP BY queries over the raw tables"""
+    print("Rebuilding analytics rollups...")
+
+    with app.app_context():
+        db.session.execute(db.delete(RatingDailyRollup))
+        db.session.execute(db.delete(SubmissionDailyRollup))
+
+        feedback = live_and_archived(Feedback, ['submitted_at', *RATING_DIMENSIONS])
+        feedback_day = db.func.date(feedback.c.submitted_at)
+        for dimension in RATING_DIMENSIONS:
+            column = feedback.c[dimension]
+            rows = db.session.execute(
+                db.select(
+                    feedback_day,
+                    db.func.count(column),
+                    db.func.coalesce(db.func.sum(column), 0),
+                    *[db.func.sum(db.case((column == r, 1), else_=0)) for r in range(1, 6)]
+                ).where(column.isnot(None)).group_by(feedback_day)
+            ).all()
+            if rows:
+                db.session.execute(db.insert(RatingDailyRollup), [
+                    {
+                        'day': as_date(day), 'dimension': dimension,
+                        'responses': responses, 'rating_sum': int(total),
+                        **{f'rating_{r}': int(count or 0) for r, count in enumerate(histogram, start=1)}
+                    }
+                    for day, responses, total, *histogram in rows
+                ])
+            print(f"- {dimension}: {len(rows)} days")
+
+        rows = db.session.execute(
+            db.select(feedback_day, db.func.count()).group_by(feedback_day)
+        ).all()
+        submission_rows = [
+            {'day': as_date(day), 'source': 'feedback', 'segment': '', 'submissions': count}
+            for day, count in rows
+        ]
+
+        registrations = live_and_archived(UserRegistration, ['submitted_at', 'user_type'])
+        registration_day = db.func.date(registrations.c.submitted_at)
+        rows = db.session.execute(
+            db.select(registration_day, registrations.c.user_type, db.func.count())
+            .group_by(registration_day, registrations.c.user_type)
+        ).all()
+        submission_rows += [
+            {'day': as_date(day), 'source': 'registrations', 'segment': user_type, 'submissions': count}
+            for day, user_type, count in rows
+        ]
+
+        if submission_rows:
+            db.session.execute(db.insert(SubmissionDailyRollup), submission_rows)
+        db.session.commit()
+        print(f"- submissions: {len(submission_rows)} day/segment rows")
+
+    print("✅ Rollups rebuilt successfully!")
+
+
+if __name__ == '__main__':
+    # The schema comes from migrate.py (or init_db.py locally); never change it here
+    try:
+        with app.app_context():
+            check_migrated(db.engine, db.metadata.sorted_tables)
+    except MigrationError as e:
+        print(f'❌ {e}')
+        sys.exit(1)
+
+    rebuild_rollups()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Compare single-row submissions with the batch ingestion endpoints.
+
+Posts the same number of registrations and feedback forms one at a time and
+then through /api/register/batch and /api/feedback/batch, and prints rows per
+second for each. Runs in-process against a throwaway SQLite database unless
+DATABASE_URL is set.
+
+Usage:
+    python benchmarks/bench_batch_ingest.py [--rows 2000] [--batch-size 200]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def registration_payload(i):
+    return {
+        'name': f'Bench User {i}',
+        'email': f'bench{i}@example.com',
+        'phone': '9999999999',
+        'userType': 'USER' if i % 2 else 'Creator',
+        'profession': 'Advocate'
+    }
+
+
+def feedback_payload(i):
+    return {
+        'visualDesign': str(i % 3 + 3),
+        'easeOfNavigation': '4',
+        'overallSatisfaction': '5',
+        'likeMost': 'Drafting tools and court date reminders',
+        'contactWilling': 'no'
+    }
+
+
+def time_single(client, endpoint, payload, rows):
+    started = time.perf_counter()
+    for i in range(rows):
+        response = client.post(endpoint, json=payload(i))
+        assert response.status_code == 201, response.get_json()
+    return time.perf_counter() - started
+
+
+def time_batch(client, endpoint, payload, rows, batch_size):
+    started = time.perf_counter()
+    for offset in range(0, rows, batch_size):
+        # Numbered after the single-row pass so registrations are not duplicates
+        items = [payload(rows + i) for i in range(offset, min(offset + batch_size, rows))]
+        response = client.post(endpoint, json=items)
+        assert response.status_code == 201, response.get_json()
+    return time.perf_counter() - started
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=2000)
+    parser.add_argument('--batch-size', type=int, default=200)
+    args = parser.parse_args()
+
+    if not os.environ.get('DATABASE_URL'):
+        db_path = os.path.join(tempfile.mkdtemp(prefix='lawvriksh_bench_'), 'bench.db')
+        os.environ['DATABASE_URL'] = f'sqlite:///{db_path}'
+
+    os.environ.setdefault('RATE_LIMIT_PER_MINUTE', '0')
+    sys.path.insert(0, SERVER_DIR)
+    import logging
+    logging.disable(logging.INFO)
+    from app import app, create_tables
+
+    create_tables()
+    client = app.test_client()
+
+    print(f'{"endpoint":<22}{"mode":<8}{"rows":>8}{"seconds":>10}{"rows/s":>12}')
+    for name, endpoint, payload in [
+        ('registrations', '/api/register', registration_payload),
+        ('feedback', '/api/feedback', feedback_payload),
+    ]:
+        single = time_single(client, endpoint, payload, args.rows)
+        batch = time_batch(client, f'{endpoint}/batch', payload, args.rows, args.batch_size)
+        print(f'{name:<22}{"single":<8}{args.rows:>8}{single:>10.2f}{args.rows / single:>12.0f}')
+        print(f'{name:<22}{"batch":<8}{args.rows:>8}{batch:>10.2f}{args.rows / batch:>12.0f}')
+        print(f'{"":<22}speedup x{single / batch:.1f}')
+
+
+if __name__ == '__main__':
+    main()
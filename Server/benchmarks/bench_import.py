@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Measure worker cold start: the time to import app.py in a fresh interpreter
+and the peak RSS afterwards, as the median of several runs.
+
+Usage:
+    python benchmarks/bench_import.py [--runs 7]
+
+For a per-module breakdown, start the app with IMPORT_REPORT=1.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEASURE = (
+    'import logging, resource, time; logging.disable(logging.INFO); '
+    'started = time.perf_counter(); import app; '
+    'print(time.perf_counter() - started, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)'
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--runs', type=int, default=7)
+    args = parser.parse_args()
+
+    env = dict(os.environ)
+    env.setdefault('DATABASE_URL', f'sqlite:///{os.path.join(tempfile.gettempdir(), "lawvriksh_import_bench.db")}')
+
+    seconds = []
+    rss_kib = []
+    for _ in range(args.runs):
+        output = subprocess.run(
+            [sys.executable, '-c', MEASURE], cwd=SERVER_DIR, env=env,
+            capture_output=True, text=True, check=True
+        ).stdout.split()
+        seconds.append(float(output[0]))
+        rss_kib.append(int(output[1]))
+
+    print(f'import app: median {statistics.median(seconds) * 1000:.0f} ms, '
+          f'median peak RSS {statistics.median(rss_kib) / 1024:.1f} MiB over {args.runs} runs')
+
+
+if __name__ == '__main__':
+    main()
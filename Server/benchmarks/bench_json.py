@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Compare list response encodings: the row-object format against ?format=columnar,
+each through Flask's default JSON provider and through FastJSONProvider.
+
+Times building the payload from ORM rows and encoding the response body
+(medians over several runs) and reports the body size, raw and gzipped.
+
+Usage:
+    python benchmarks/bench_json.py [--rows 100] [--runs 200]
+"""
+
+import argparse
+import gzip
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=100, help='rows per page')
+    parser.add_argument('--runs', type=int, default=200)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DATABASE_URL', f'sqlite:///{os.path.join(tempfile.mkdtemp(), "bench_json.db")}')
+    import logging
+    logging.disable(logging.INFO)
+    from flask.json.provider import DefaultJSONProvider
+    from app import app, Feedback, FEEDBACK_LIST_COLUMNS, serialize_rows
+    from benchmarks.seed import feedback_row
+    from json_provider import FastJSONProvider
+
+    now = datetime.utcnow()
+    rows = [Feedback(id=i + 1, **feedback_row(i, now)) for i in range(args.rows)]
+    providers = [('default', DefaultJSONProvider(app)), ('fast', FastJSONProvider(app))]
+    print(f'fast provider backend: {providers[1][1].backend}')
+
+    print(f'{"format":<10}{"provider":<10}{"bytes":>10}{"gzip":>10}{"build us":>10}{"encode us":>11}{"total us":>10}')
+    baseline = None
+    with app.app_context():
+        for list_format in ('json', 'columnar'):
+            for name, provider in providers:
+                build_timings = []
+                encode_timings = []
+                for _ in range(args.runs):
+                    started = time.perf_counter()
+                    payload = {
+                        'feedback': serialize_rows(rows, FEEDBACK_LIST_COLUMNS, list_format),
+                        'total': args.rows, 'pages': 1, 'current_page': 1, 'per_page': args.rows
+                    }
+                    built = time.perf_counter()
+                    body = provider.response(payload).get_data()
+                    build_timings.append(built - started)
+                    encode_timings.append(time.perf_counter() - built)
+
+                build = statistics.median(build_timings)
+                encode = statistics.median(encode_timings)
+                baseline = baseline or build + encode
+                print(
+                    f'{list_format:<10}{name:<10}{len(body):>10}{len(gzip.compress(body)):>10}'
+                    f'{build * 1e6:>10.0f}{encode * 1e6:>11.0f}{(build + encode) * 1e6:>10.0f}'
+                    f'  x{baseline / (build + encode):.1f}'
+                )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of the submission validators.
+
+Compares the compiled schema validators (validate_registration,
+validate_feedback) with the hand-written checks and record building they
+replaced, kept below as the reference. Before timing, every generated payload
+(valid, invalid and malformed) is run through both to confirm they return the
+same error messages in the same order, the same column values, or raise the
+same exception type.
+
+Usage:
+    python benchmarks/bench_validation.py [--payloads 2000] [--runs 20] [--odd-rate 0.03]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# Reference implementation: the checks and builders the compiled validators replaced
+
+def reference_validate_feedback(data):
+    errors = []
+
+    rating_fields = [
+        'visualDesign', 'easeOfNavigation', 'mobileResponsiveness',
+        'overallSatisfaction', 'easeOfTasks', 'qualityOfServices'
+    ]
+
+    for field in rating_fields:
+        if field in data and data[field]:
+            try:
+                rating = int(data[field])
+                if rating < 1 or rating > 5:
+                    errors.append(f'{field} must be between 1 and 5')
+            except (ValueError, TypeError):
+                errors.append(f'{field} must be a valid number')
+
+    conditional_mapping = {
+        'visualDesign': 'visualDesignIssue',
+        'easeOfNavigation': 'easeOfNavigationIssue',
+        'mobileResponsiveness': 'mobileResponsivenessIssue',
+        'overallSatisfaction': 'overallSatisfactionIssue',
+        'easeOfTasks': 'easeOfTasksIssue',
+        'qualityOfServices': 'qualityOfServicesIssue'
+    }
+
+    for rating_field, issue_field in conditional_mapping.items():
+        if rating_field in data and data[rating_field]:
+            try:
+                rating = int(data[rating_field])
+                if rating < 3 and (issue_field not in data or not data[issue_field].strip()):
+                    errors.append(f'Please explain what you didn\'t like for {rating_field} (rating below 3)')
+            except (ValueError, TypeError):
+                pass
+
+    if data.get('contactWilling') == 'yes':
+        email = data.get('contactEmail', '').strip()
+        if not email:
+            errors.append('Email is required when willing to be contacted')
+        elif '@' not in email or '.' not in email:
+            errors.append('Please provide a valid email address')
+
+    return errors
+
+
+def reference_build_feedback(data):
+    return dict(
+        visual_design=int(data.get('visualDesign')) if data.get('visualDesign') else None,
+        ease_of_navigation=int(data.get('easeOfNavigation')) if data.get('easeOfNavigation') else None,
+        mobile_responsiveness=int(data.get('mobileResponsiveness')) if data.get('mobileResponsiveness') else None,
+        overall_satisfaction=int(data.get('overallSatisfaction')) if data.get('overallSatisfaction') else None,
+        ease_of_tasks=int(data.get('easeOfTasks')) if data.get('easeOfTasks') else None,
+        quality_of_services=int(data.get('qualityOfServices')) if data.get('qualityOfServices') else None,
+
+        visual_design_issue=data.get('visualDesignIssue', '').strip() or None,
+        ease_of_navigation_issue=data.get('easeOfNavigationIssue', '').strip() or None,
+        mobile_responsiveness_issue=data.get('mobileResponsivenessIssue', '').strip() or None,
+        overall_satisfaction_issue=data.get('overallSatisfactionIssue', '').strip() or None,
+        ease_of_tasks_issue=data.get('easeOfTasksIssue', '').strip() or None,
+        quality_of_services_issue=data.get('qualityOfServicesIssue', '').strip() or None,
+
+        like_most=data.get('likeMost', '').strip() or None,
+        improvements=data.get('improvements', '').strip() or None,
+        features=data.get('features', '').strip() or None,
+        legal_challenges=data.get('legalChallenges', '').strip() or None,
+        additional_comments=data.get('additionalComments', '').strip() or None,
+
+        contact_willing=data.get('contactWilling', '').strip() or None,
+        contact_email=data.get('contactEmail', '').strip() or None,
+    )
+
+
+def reference_validate_registration(data):
+    required_fields = ['name', 'email', 'phone', 'userType']
+    for field in required_fields:
+        if not data.get(field):
+            return f'{field} is required'
+
+    email = data.get('email', '').strip()
+    if '@' not in email or '.' not in email:
+        return 'Please provide a valid email address'
+
+    if data.get('userType') not in ['USER', 'Creator']:
+        return 'User type must be USER or Creator'
+
+    return None
+
+
+def reference_build_registration(data, normalize_email):
+    return dict(
+        name=data.get('name', '').strip(),
+        email=data.get('email', '').strip(),
+        email_normalized=normalize_email(data.get('email', '')),
+        phone=data.get('phone', '').strip(),
+        gender=data.get('gender', '').strip() or None,
+        profession=data.get('profession', '').strip() or None,
+        user_type=data.get('userType'),
+    )
+
+
+RATING_KEYS = ['visualDesign', 'easeOfNavigation', 'mobileResponsiveness',
+               'overallSatisfaction', 'easeOfTasks', 'qualityOfServices']
+TEXT_KEYS = ['likeMost', 'improvements', 'features', 'legalChallenges', 'additionalComments']
+
+# Values a field occasionally gets instead of a well-formed one
+ODD_RATINGS = ['0', '6', -1, 4.7, True, '', None, ' 3 ', 'abc', '2.5', [], 0]
+ODD_TEXTS = ['  padded  ', '', '   ', None, 5]
+ODD_EMAILS = [' User.Name+tag@Gmail.com ', 'nodot@example', 'plain', '', None, 42]
+ODD_RATE = 0.03
+
+
+def pick(rng, value, odd_values):
+    return rng.choice(odd_values) if rng.random() < ODD_RATE else value
+
+
+def feedback_payload(rng):
+    payload = {}
+    for key in RATING_KEYS:
+        rating = rng.choice([1, 2, 3, 4, 4, 5, 5, 5])
+        payload[key] = pick(rng, str(rating), ODD_RATINGS)
+        if rating < 3 or rng.random() < 0.1:
+            payload[f'{key}Issue'] = pick(rng, 'Hard to find the filing calendar', ODD_TEXTS)
+    for key in TEXT_KEYS:
+        if rng.random() < 0.7:
+            payload[key] = pick(rng, 'Some free-text answer about the platform. ' * 3, ODD_TEXTS)
+    if rng.random() < 0.6:
+        payload['contactWilling'] = pick(rng, rng.choice(['yes', 'no']), ['maybe', '', None])
+        if payload['contactWilling'] == 'yes' or rng.random() < 0.1:
+            payload['contactEmail'] = pick(rng, f'user{rng.randint(1, 10 ** 6)}@example.com', ODD_EMAILS)
+    return payload
+
+
+def registration_payload(rng):
+    payload = {
+        'name': pick(rng, 'Asha Rao', [' Padded Name ', '', None, 7]),
+        'email': pick(rng, f'asha.rao+{rng.randint(1, 10 ** 6)}@gmail.com', ODD_EMAILS),
+        'phone': pick(rng, '9876543210', [' 9876543210 ', '', 9876543210]),
+        'userType': pick(rng, rng.choice(['USER', 'Creator']), ['user', '', ['USER']]),
+    }
+    for key, value in (('gender', 'Female'), ('profession', 'Advocate')):
+        if rng.random() < 0.7:
+            payload[key] = pick(rng, value, ['', ' Judge ', None])
+    for key in list(payload):
+        if rng.random() < 0.01:
+            del payload[key]
+    return payload
+
+
+def outcome(function, payload):
+    """Result of `function(payload)`, or the type of exception it raised"""
+    try:
+        return function(payload)
+    except Exception as e:
+        return type(e)
+
+
+def main():
+    global ODD_RATE
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--payloads', type=int, default=2000, help='payloads of each kind')
+    parser.add_argument('--runs', type=int, default=20)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--odd-rate', type=float, default=ODD_RATE,
+                        help='chance of each field getting a malformed value')
+    args = parser.parse_args()
+    ODD_RATE = args.odd_rate
+
+    os.environ.setdefault('DATABASE_URL', f'sqlite:///{os.path.join(tempfile.mkdtemp(), "bench_validation.db")}')
+    import logging
+    logging.disable(logging.INFO)
+    from app import normalize_email, parse_feedback, parse_registration
+
+    def reference_feedback(data):
+        errors = reference_validate_feedback(data)
+        if errors:
+            return {'error': 'Validation failed', 'details': errors}, None
+        return None, reference_build_feedback(data)
+
+    def reference_registration(data):
+        error = reference_validate_registration(data)
+        if error:
+            return {'error': error}, None
+        return None, reference_build_registration(data, normalize_email)
+
+    rng = random.Random(args.seed)
+    cases = [
+        ('registration', [registration_payload(rng) for _ in range(args.payloads)],
+         reference_registration, parse_registration),
+        ('feedback', [feedback_payload(rng) for _ in range(args.payloads)],
+         reference_feedback, parse_feedback),
+    ]
+
+    for name, payloads, reference, compiled in cases:
+        outcomes = [(payload, outcome(reference, payload), outcome(compiled, payload)) for payload in payloads]
+        mismatches = [case for case in outcomes if case[1] != case[2]]
+        if mismatches:
+            payload, expected, actual = mismatches[0]
+            print(f'❌ {name}: {len(mismatches)} payloads differ, e.g. {payload!r}')
+            print(f'   reference: {expected!r}')
+            print(f'   compiled:  {actual!r}')
+            sys.exit(1)
+        raised = sum(1 for _, expected, _ in outcomes if isinstance(expected, type))
+        rejected = sum(1 for _, expected, _ in outcomes if not isinstance(expected, type) and expected[0])
+        print(f'✅ {name}: {len(payloads)} payloads identical ({rejected} rejected, {raised} raised)')
+
+    print(f'\n{"payload":<14}{"reference us":>14}{"compiled us":>13}{"speedup":>9}')
+    for name, payloads, reference, compiled in cases:
+        timings = {}
+        for label, function in (('reference', reference), ('compiled', compiled)):
+            runs = []
+            for _ in range(args.runs):
+                started = time.perf_counter()
+                for payload in payloads:
+                    try:
+                        function(payload)
+                    except Exception:
+                        pass
+                runs.append((time.perf_counter() - started) / len(payloads))
+            timings[label] = statistics.median(runs)
+        print(f'{name:<14}{timings["reference"] * 1e6:>14.2f}{timings["compiled"] * 1e6:>13.2f}'
+              f'{timings["reference"] / timings["compiled"]:>8.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+Compare gunicorn worker profiles: the default single sync worker against the
+threaded (gthread) profile with a pool sized from workers x threads.
+
+Each profile is started with gunicorn.conf.py against the same seeded database
+and driven with identical submit and list traffic. The list response cache is
+turned off (RESPONSE_CACHE_TTL=0) so every GET runs its query and checks out a
+pool connection, rather than being a cache hit on the repeated URL. Uses a throwaway SQLite
+database unless --database-url points at MySQL; a networked database shows the
+larger gain because threads overlap the time spent waiting on it.
+
+Usage:
+    python benchmarks/bench_worker_profiles.py [--concurrency 16] [--requests 800]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.loadgen import ADMIN_HEADERS, run_load, seed_database, start_server, stop_server
+
+PROFILES = [
+    ('sync x1', {'WEB_CONCURRENCY': '1', 'GUNICORN_THREADS': '1'}),
+    ('gthread 1x8', {'WEB_CONCURRENCY': '1', 'GUNICORN_THREADS': '8'}),
+    ('gthread 2x8', {'WEB_CONCURRENCY': '2', 'GUNICORN_THREADS': '8'}),
+]
+
+FEEDBACK = {'visualDesign': '4', 'overallSatisfaction': '5', 'likeMost': 'Drafting tools'}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--database-url')
+    parser.add_argument('--seed-rows', type=int, default=5000)
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=800)
+    parser.add_argument('--port', type=int, default=5099)
+    args = parser.parse_args()
+
+    database_url = args.database_url
+    if not database_url:
+        database_url = f'sqlite:///{os.path.join(tempfile.mkdtemp(prefix="lawvriksh_bench_"), "bench.db")}'
+    seed_database(database_url, args.seed_rows, args.seed_rows)
+
+    scenarios = [
+        ('POST /api/feedback', 'POST', '/api/feedback', FEEDBACK, None),
+        ('GET /api/feedback', 'GET', '/api/feedback?after=&per_page=50', None, ADMIN_HEADERS),
+    ]
+
+    print(f'{"profile":<14}{"scenario":<22}{"req/s":>10}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}')
+    baseline = {}
+    for profile, env in PROFILES:
+        server = start_server(args.port, database_url, {**env, 'RESPONSE_CACHE_TTL': '0'})
+        try:
+            for name, method, path, body, headers in scenarios:
+                result = run_load(args.port, method, path, args.concurrency, args.requests, body, headers)
+                baseline.setdefault(name, result['throughput_rps'])
+                gain = result['throughput_rps'] / baseline[name]
+                print(
+                    f'{profile:<14}{name:<22}{result["throughput_rps"]:>10.0f}'
+                    f'{result["p50_ms"]:>10.1f}{result["p95_ms"]:>10.1f}{result["p99_ms"]:>10.1f}'
+                    f'   x{gain:.2f}'
+                )
+        finally:
+            stop_server(server)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,153 @@
+"""
+Shared helpers for the HTTP benchmarks: start the app under gunicorn against a
+local database, seed rows, and drive endpoints at a fixed concurrency while
+recording per-request latency.
+"""
+
+import http.client
+import json
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+import urllib.request
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ADMIN_HEADERS = {'X-API-Key': os.environ.get('ADMIN_API_KEY', 'admin-key-123')}
+
+
+def percentile(sorted_values, pct):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return None
+    rank = max(int(round(pct / 100 * len(sorted_values))) - 1, 0)
+    return sorted_values[min(rank, len(sorted_values) - 1)]
+
+
+def seed_database(database_url, registrations, feedback, start=0):
+    """Create the tables and bulk insert synthetic rows, spread over the last 90 days.
+
+    Rows are numbered from `start`, so a database can be grown in steps.
+    """
+    env = dict(os.environ, DATABASE_URL=database_url)
+    code = (
+        'import sys, logging; logging.disable(logging.INFO); '
+        'from benchmarks.seed import seed_tables; '
+        f'seed_tables({registrations}, {feedback}, {start})'
+    )
+    subprocess.run([sys.executable, '-c', code], cwd=SERVER_DIR, env=env, check=True)
+
+
+def start_server(port, database_url, env=None, timeout=30):
+    """Start gunicorn with gunicorn.conf.py and wait until /api/health answers"""
+    server_env = dict(os.environ, PORT=str(port), DATABASE_URL=database_url, FLASK_ENV='production')
+    # All load comes from one address; measure the app, not the rate limiter
+    server_env.setdefault('RATE_LIMIT_PER_MINUTE', '0')
+    server_env.update(env or {})
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'gunicorn', '-c', 'gunicorn.conf.py', 'app:app'],
+        cwd=SERVER_DIR,
+        env=server_env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError('gunicorn exited during startup')
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/api/health', timeout=1):
+                return process
+        except OSError:
+            time.sleep(0.2)
+
+    stop_server(process)
+    raise RuntimeError('gunicorn did not become healthy in time')
+
+
+def stop_server(process):
+    """Stop a server started by start_server()"""
+    if process.poll() is None:
+        process.send_signal(signal.SIGTERM)
+        try:
+            process.wait(timeout=15)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def run_load(port, method, path, concurrency, total_requests, body=None, headers=None):
+    """Send `total_requests` requests from `concurrency` threads and summarise latency.
+
+    `body` may be a dict (sent as JSON) or a callable taking the request number.
+    """
+    counter = iter(range(total_requests))
+    counter_lock = threading.Lock()
+    latencies = []
+    statuses = {}
+    response_bytes = [0]
+    results_lock = threading.Lock()
+
+    def worker():
+        conn = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+        local_latencies = []
+        local_statuses = {}
+        local_bytes = 0
+        while True:
+            with counter_lock:
+                n = next(counter, None)
+            if n is None:
+                break
+
+            payload = body(n) if callable(body) else body
+            request_headers = dict(headers or {})
+            data = None
+            if payload is not None:
+                data = json.dumps(payload).encode('utf-8')
+                request_headers['Content-Type'] = 'application/json'
+
+            started = time.perf_counter()
+            try:
+                conn.request(method, path, body=data, headers=request_headers)
+                response = conn.getresponse()
+                local_bytes += len(response.read())
+                status = response.status
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                conn = http.client.HTTPConnection('127.0.0.1', port, timeout=120)
+                status = 'error'
+            local_latencies.append(time.perf_counter() - started)
+            local_statuses[status] = local_statuses.get(status, 0) + 1
+
+        conn.close()
+        with results_lock:
+            latencies.extend(local_latencies)
+            response_bytes[0] += local_bytes
+            for status, count in local_statuses.items():
+                statuses[status] = statuses.get(status, 0) + count
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'method': method,
+        'path': path,
+        'concurrency': concurrency,
+        'requests': total_requests,
+        'seconds': elapsed,
+        'throughput_rps': total_requests / elapsed if elapsed else None,
+        'p50_ms': percentile(latencies, 50) * 1000 if latencies else None,
+        'p95_ms': percentile(latencies, 95) * 1000 if latencies else None,
+        'p99_ms': percentile(latencies, 99) * 1000 if latencies else None,
+        'max_ms': latencies[-1] * 1000 if latencies else None,
+        'response_bytes': response_bytes[0],
+        'statuses': {str(status): count for status, count in statuses.items()}
+    }
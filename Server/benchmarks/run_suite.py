@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+HTTP load-test suite for the feedback API.
+
+Starts the app under gunicorn against a local SQLite database, grows the
+tables through each requested size, and at every size drives the submit, list
+and export endpoints at each concurrency level. Reports throughput and
+p50/p95/p99 latency, and writes all results as JSON to benchmarks/results/
+so runs can be compared over time (see --compare).
+
+The list response cache is turned off (RESPONSE_CACHE_TTL=0): each scenario
+repeats one URL, so with it on every request after the first would time a
+cache hit rather than the list query.
+
+Usage:
+    python benchmarks/run_suite.py [--sizes 1000,10000,50000] [--concurrency 1,8,32]
+                                   [--requests 400] [--compare results/previous.json]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from benchmarks.loadgen import ADMIN_HEADERS, SERVER_DIR, run_load, seed_database, start_server, stop_server
+
+RESULTS_DIR = os.path.join(SERVER_DIR, 'benchmarks', 'results')
+
+
+def registration_body(n):
+    return {
+        'name': f'Load User {n}',
+        'email': f'load{n}-{time.time_ns()}@example.com',
+        'phone': '9999999999',
+        'userType': 'USER' if n % 2 else 'Creator'
+    }
+
+
+def feedback_body(n):
+    return {
+        'visualDesign': str(n % 3 + 3),
+        'overallSatisfaction': '4',
+        'likeMost': 'Drafting templates',
+        'contactWilling': 'no'
+    }
+
+
+# (name, method, path, body, headers, requests multiplier). Paths may use
+# {deep_page}, the page halfway through the feedback table. Read scenarios run
+# before submits so the cached export is not invalidated by new rows.
+SCENARIOS = [
+    ('list_feedback_page', 'GET', '/api/feedback?page=1&per_page=50', None, ADMIN_HEADERS, 1),
+    ('list_feedback_deep_page', 'GET', '/api/feedback?page={deep_page}&per_page=50', None, ADMIN_HEADERS, 1),
+    ('list_feedback_cursor', 'GET', '/api/feedback?after=&per_page=50', None, ADMIN_HEADERS, 1),
+    ('list_feedback_fields', 'GET', '/api/feedback?after=&per_page=50&fields=id,visual_design,overall_satisfaction,submitted_at', None, ADMIN_HEADERS, 1),
+    ('search_feedback', 'GET', '/api/feedback/search?q=limitation&per_page=20', None, ADMIN_HEADERS, 1),
+    ('list_registrations_page', 'GET', '/api/registrations?page=1&per_page=50', None, ADMIN_HEADERS, 1),
+    ('export_excel_cached', 'GET', '/api/download-excel', None, ADMIN_HEADERS, 0.1),
+    ('export_feedback_csv', 'GET', '/api/export/feedback?format=csv', None, ADMIN_HEADERS, 0.05),
+    ('submit_registration', 'POST', '/api/register', registration_body, None, 1),
+    ('submit_feedback', 'POST', '/api/feedback', feedback_body, None, 1),
+]
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=SERVER_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def parse_int_list(value):
+    return [int(part) for part in value.split(',') if part.strip()]
+
+
+def print_result(size, result, name):
+    print(
+        f'{size:>8} {name:<26}{result["concurrency"]:>5}{result["requests"]:>7}'
+        f'{result["throughput_rps"]:>10.1f}{result["p50_ms"]:>10.1f}{result["p95_ms"]:>10.1f}'
+        f'{result["p99_ms"]:>10.1f}  {result["statuses"]}'
+    )
+
+
+def compare(previous_path, results):
+    """Print throughput and p95 changes against an earlier results file"""
+    with open(previous_path) as f:
+        previous = {
+            (r['rows'], r['scenario'], r['concurrency']): r for r in json.load(f)['results']
+        }
+
+    print(f'\nCompared with {previous_path}:')
+    print(f'{"rows":>8} {"scenario":<26}{"conc":>5}{"rps":>12}{"p95":>12}')
+    for result in results:
+        before = previous.get((result['rows'], result['scenario'], result['concurrency']))
+        if not before:
+            continue
+        rps_change = result['throughput_rps'] / before['throughput_rps'] - 1
+        p95_change = result['p95_ms'] / before['p95_ms'] - 1
+        print(
+            f'{result["rows"]:>8} {result["scenario"]:<26}{result["concurrency"]:>5}'
+            f'{rps_change:>+11.0%} {p95_change:>+11.0%}'
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', default='1000,10000,50000', help='table sizes to grow through')
+    parser.add_argument('--concurrency', default='1,8,32', help='concurrency levels')
+    parser.add_argument('--requests', type=int, default=400, help='requests per scenario and level')
+    parser.add_argument('--scenarios', help='comma separated subset of scenario names')
+    parser.add_argument('--port', type=int, default=5099)
+    parser.add_argument('--output', help='results file (default: benchmarks/results/<timestamp>.json)')
+    parser.add_argument('--compare', help='earlier results file to compare against')
+    args = parser.parse_args()
+
+    sizes = sorted(parse_int_list(args.sizes))
+    levels = parse_int_list(args.concurrency)
+    scenarios = SCENARIOS
+    if args.scenarios:
+        wanted = set(args.scenarios.split(','))
+        scenarios = [scenario for scenario in SCENARIOS if scenario[0] in wanted]
+
+    work_dir = tempfile.mkdtemp(prefix='lawvriksh_suite_')
+    database_url = f'sqlite:///{os.path.join(work_dir, "suite.db")}'
+    server_env = {
+        'EXPORT_CACHE_DIR': os.path.join(work_dir, 'export_cache'),
+        'LOCAL_STORE_PATH': os.path.join(work_dir, 'local_store.sqlite3'),
+        # Measure the list queries, not response cache hits on a repeated URL
+        'RESPONSE_CACHE_TTL': '0',
+    }
+
+    started_at = datetime.utcnow()
+    results = []
+    seeded = 0
+    print(f'{"rows":>8} {"scenario":<26}{"conc":>5}{"reqs":>7}{"rps":>10}{"p50 ms":>10}{"p95 ms":>10}{"p99 ms":>10}')
+    for size in sizes:
+        seed_database(database_url, size - seeded, size - seeded, start=seeded)
+        seeded = size
+
+        server = start_server(args.port, database_url, server_env)
+        try:
+            # The first download after the data changed pays for the full build
+            cold = run_load(args.port, 'GET', '/api/download-excel', 1, 1, headers=ADMIN_HEADERS)
+            results.append({'rows': size, 'scenario': 'export_excel_cold', **cold})
+            print_result(size, cold, 'export_excel_cold')
+
+            for name, method, path, body, headers, multiplier in scenarios:
+                for level in levels:
+                    total = max(int(args.requests * multiplier), level)
+                    url = path.format(deep_page=max(size // 100, 1))
+                    result = run_load(args.port, method, url, level, total, body, headers)
+                    results.append({'rows': size, 'scenario': name, **result})
+                    print_result(size, result, name)
+        finally:
+            stop_server(server)
+
+    report = {
+        'started_at': started_at.isoformat(),
+        'git_revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'database': 'sqlite',
+        'parameters': {
+            'sizes': sizes,
+            'concurrency': levels,
+            'requests': args.requests,
+            'worker_env': {key: os.environ.get(key) for key in ('WEB_CONCURRENCY', 'GUNICORN_THREADS')},
+            'server_env': {key: server_env[key] for key in ('RESPONSE_CACHE_TTL',)},
+        },
+        'results': results,
+    }
+
+    output = args.output
+    if not output:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f'{started_at.strftime("%Y%m%dT%H%M%SZ")}.json')
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f'\nResults written to {output}')
+
+    if args.compare:
+        compare(args.compare, results)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""
+Synthetic registrations and feedback for the benchmarks and check_query_plans.py.
+
+Rows are spread over the last 90 days; about 1% of the feedback mentions
+limitation periods, for the full-text search scenario.
+"""
+
+from datetime import datetime, timedelta
+
+
+def seed_tables(registrations, feedback, start=0, chunk=5000):
+    """Create the tables and bulk insert synthetic rows into the configured database.
+
+    Rows are numbered from `start`, so a database can be grown in steps.
+    """
+    from app import app, db, create_tables, UserRegistration, Feedback
+
+    create_tables()
+    now = datetime.utcnow()
+    with app.app_context():
+        for model, total, make_row in [
+            (UserRegistration, registrations, registration_row),
+            (Feedback, feedback, feedback_row),
+        ]:
+            for offset in range(start, start + total, chunk):
+                rows = [make_row(i, now) for i in range(offset, min(offset + chunk, start + total))]
+                db.session.execute(db.insert(model), rows)
+                db.session.commit()
+
+
+def registration_row(i, now):
+    """Column values of synthetic registration `i`"""
+    return {
+        'name': f'Seed User {i}',
+        'email': f'seed{i}@example.com',
+        'email_normalized': f'seed{i}@example.com',
+        'phone': '9999999999',
+        'gender': 'female' if i % 2 else 'male',
+        'profession': ['Advocate', 'Student', 'Judge', 'Paralegal'][i % 4],
+        'user_type': 'USER' if i % 3 else 'Creator',
+        'submitted_at': now - timedelta(minutes=i % (90 * 24 * 60)),
+        'ip_address': '127.0.0.1',
+        'user_agent': 'benchmark-seed/1.0'
+    }
+
+
+def feedback_row(i, now):
+    """Column values of synthetic feedback row `i`"""
+    rating = i % 5 + 1
+    return {
+        'visual_design': rating,
+        'ease_of_navigation': (i + 1) % 5 + 1,
+        'mobile_responsiveness': (i + 2) % 5 + 1,
+        'overall_satisfaction': (i + 3) % 5 + 1,
+        'ease_of_tasks': (i + 4) % 5 + 1,
+        'quality_of_services': rating,
+        'visual_design_issue': 'Too much contrast' if rating < 3 else None,
+        'like_most': 'Drafting templates and court date reminders',
+        'improvements': 'Faster search across judgments',
+        # Matches about 1% of rows, for the full-text search scenario
+        'legal_challenges': 'Tracking limitation periods for appeals' if i % 100 == 0 else None,
+        'contact_willing': 'yes' if i % 2 else 'no',
+        'contact_email': f'seed{i}@example.com' if i % 2 else None,
+        'submitted_at': now - timedelta(minutes=i % (90 * 24 * 60)),
+        'ip_address': '127.0.0.1',
+        'user_agent': 'benchmark-seed/1.0'
+    }
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+Check that every list filter of the admin APIs is served by an index.
+
+Builds the query each filter produces on /api/feedback and /api/registrations
+(first page and a cursor page), asks the database for its plan (EXPLAIN on
+MySQL, EXPLAIN QUERY PLAN on SQLite) and fails if:
+
+- a table is read without an index, or rows are sorted instead of read in
+  index order;
+- a date or equality filter does not search (range/ref access) the index
+  built for it;
+- any index is read in full, except the newest-first walk of
+  (submitted_at, id) that unfiltered lists and rating thresholds rely on,
+  which the LIMIT stops after one page.
+
+Plans depend on table statistics, so run it against a database with
+realistic data; --seed fills a scratch database with synthetic rows first.
+
+Usage:
+    python check_query_plans.py [--seed 20000] [--verbose]
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import (
+    app, db, create_tables, Feedback, UserRegistration, RATING_DIMENSIONS,
+    feedback_filters, list_query, registration_filters
+)
+
+LAST_WEEK = (datetime.utcnow() - timedelta(days=7)).date().isoformat()
+YESTERDAY = (datetime.utcnow() - timedelta(days=1)).date().isoformat()
+
+# Indexes that walk a table newest-first
+ORDER_INDEXES = {
+    UserRegistration: 'ix_user_registrations_submitted_at_id',
+    Feedback: 'ix_feedback_submitted_at_id',
+}
+
+# (name, model, filter builder, query parameters, index the filter must search).
+# None means the query walks ORDER_INDEXES newest first: unfiltered lists and
+# rating thresholds, which are ranges that no (rating, submitted_at) index can
+# return in submitted_at order.
+CASES = [
+    ('registrations, no filter', UserRegistration, registration_filters, {}, None),
+    ('registrations by date', UserRegistration, registration_filters, {'start': LAST_WEEK, 'end': YESTERDAY},
+     'ix_user_registrations_submitted_at_id'),
+    ('registrations by user_type', UserRegistration, registration_filters, {'user_type': 'Creator'},
+     'ix_user_registrations_user_type_submitted_at'),
+    ('registrations by user_type and date', UserRegistration, registration_filters,
+     {'user_type': 'Creator', 'start': LAST_WEEK}, 'ix_user_registrations_user_type_submitted_at'),
+    ('registrations by profession', UserRegistration, registration_filters, {'profession': 'Judge'},
+     'ix_user_registrations_profession_submitted_at'),
+    ('feedback, no filter', Feedback, feedback_filters, {}, None),
+    ('feedback by date', Feedback, feedback_filters, {'start': LAST_WEEK, 'end': YESTERDAY},
+     'ix_feedback_submitted_at_id'),
+    ('feedback by contact_willing', Feedback, feedback_filters, {'contact_willing': 'yes'},
+     'ix_feedback_contact_willing_submitted_at'),
+] + [
+    (f'feedback by {bound}_{dimension}', Feedback, feedback_filters, {f'{bound}_{dimension}': value}, None)
+    for dimension in RATING_DIMENSIONS
+    for bound, value in (('max', '2'), ('min', '5'))
+]
+
+# MySQL access types that look rows up through an index rather than read it all
+MYSQL_SEARCH_TYPES = ('const', 'eq_ref', 'ref', 'ref_or_null', 'range', 'index_merge', 'fulltext')
+
+
+def explain(connection, query):
+    """Return (accesses, sorted, plan lines) for `query` on this connection.
+
+    Each access is (table, index or None, kind), kind being 'search' (range or
+    ref lookup), 'walk' (the whole index, in order) or 'scan' (the whole table).
+    """
+    sql = str(query.statement.compile(dialect=connection.dialect, compile_kwargs={'literal_binds': True}))
+    accesses = []
+    sorted_rows = False
+    lines = []
+    if connection.dialect.name == 'mysql':
+        for row in connection.exec_driver_sql(f'EXPLAIN {sql}').mappings():
+            lines.append(f"{row['table']}: type={row['type']} key={row['key']} rows={row['rows']} {row['Extra'] or ''}")
+            if row['type'] in MYSQL_SEARCH_TYPES:
+                kind = 'search'
+            elif row['type'] == 'index':
+                kind = 'walk'
+            else:
+                kind = 'scan'
+            accesses.append((row['table'], row['key'], kind))
+            sorted_rows |= 'Using filesort' in (row['Extra'] or '')
+    else:
+        for row in connection.exec_driver_sql(f'EXPLAIN QUERY PLAN {sql}'):
+            detail = row[-1]
+            lines.append(detail)
+            words = detail.split(' ')
+            if words[0] in ('SEARCH', 'SCAN'):
+                index = detail.split(' INDEX ', 1)[1].split(' ')[0] if ' INDEX ' in detail else None
+                if words[0] == 'SEARCH':
+                    kind = 'search'
+                else:
+                    kind = 'walk' if index else 'scan'
+                accesses.append((words[1], index, kind))
+            sorted_rows |= detail.startswith('USE TEMP B-TREE FOR ORDER BY')
+    return accesses, sorted_rows, lines
+
+
+def plan_problems(model, expected, accesses, sorted_rows):
+    """What is wrong with a plan for a case expecting `expected` (see CASES)"""
+    problems = []
+    if sorted_rows:
+        problems.append('rows are sorted, not read in index order')
+    for table, index, kind in accesses:
+        if kind == 'scan':
+            problems.append(f'full scan of {table}')
+        elif kind == 'walk' and (expected is not None or index != ORDER_INDEXES[model]):
+            problems.append(f'full scan of index {index}')
+    if expected is not None and not any(index == expected and kind == 'search' for _, index, kind in accesses):
+        used = ', '.join(f'{index or "no index"} ({kind})' for _, index, kind in accesses)
+        problems.append(f'expected a search of {expected}, used {used or "nothing"}')
+    if expected is None and not any(index == ORDER_INDEXES[model] for _, index, _ in accesses):
+        problems.append(f'expected {ORDER_INDEXES[model]}')
+    return problems
+
+
+def check_plans(verbose):
+    """Explain every case; returns the number of failures"""
+    failures = 0
+    with app.app_context(), db.engine.connect() as connection:
+        print(f"Checking list query plans on {connection.dialect.name}...")
+        for name, model, build_filters, args, expected in CASES:
+            filters = build_filters(args)
+            first_page = list_query(model, filters).limit(51)
+            cursor_page = list_query(model, filters).filter(
+                db.tuple_(model.submitted_at, model.id) < (datetime.utcnow(), 2 ** 31)
+            ).limit(51)
+
+            for page, query in (('first page', first_page), ('cursor page', cursor_page)):
+                accesses, sorted_rows, lines = explain(connection, query)
+                problems = plan_problems(model, expected, accesses, sorted_rows)
+
+                status = '❌' if problems else '✅'
+                used = ', '.join(f'{index} ({kind})' for _, index, kind in accesses)
+                print(f"{status} {name} ({page}): {'; '.join(problems) if problems else used}")
+                if problems or verbose:
+                    for line in lines:
+                        print(f"     {line}")
+                failures += bool(problems)
+    return failures
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--seed', type=int, default=0, help='insert this many synthetic rows per table first')
+    parser.add_argument('--verbose', action='store_true', help='print every plan')
+    args = parser.parse_args()
+
+    create_tables()
+    if args.seed:
+        from benchmarks.seed import seed_tables
+        seed_tables(args.seed, args.seed)
+        with app.app_context(), db.engine.begin() as connection:
+            connection.exec_driver_sql('ANALYZE' if connection.dialect.name == 'sqlite' else
+                                       'ANALYZE TABLE user_registrations, feedback')
+
+    failures = check_plans(args.verbose)
+    if failures:
+        print(f"\n{failures} plan(s) do not use the expected index")
+        sys.exit(1)
+    print("\nAll list filters are index-backed")
@@ -0,0 +1,55 @@
+"""
+Content-Encoding helpers for API and export responses.
+
+gzip is always available; brotli is offered when the `brotli` package is
+installed. `compress` handles whole bodies, `compress_stream` wraps a
+generator so each chunk reaches the client as soon as it is produced.
+"""
+
+import zlib
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+# Preferred first when the client accepts several with the same quality
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# File suffix of a precompressed artifact in each encoding
+SUFFIXES = {'br': '.br', 'gzip': '.gz'}
+
+
+def negotiate_encoding(accept_encodings):
+    """Pick the best encoding from a parsed Accept-Encoding header, or None.
+
+    Honours q-values, including "*" and explicit refusals such as gzip;q=0.
+    """
+    return accept_encodings.best_match(ENCODINGS)
+
+
+def _compressor(encoding, level):
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=level)
+        return compressor.process, compressor.flush, compressor.finish
+    # wbits=31 writes a gzip header and trailer around the deflate stream
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)
+    return compressor.compress, lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
+
+
+def compress(data, encoding, level):
+    """Compress a whole body"""
+    process, _, finish = _compressor(encoding, level)
+    return process(data) + finish()
+
+
+def compress_stream(chunks, encoding, level):
+    """Compress an iterable of str/bytes chunks, flushing after every chunk"""
+    process, flush, finish = _compressor(encoding, level)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        data = process(chunk) + flush()
+        if data:
+            yield data
+    yield finish()
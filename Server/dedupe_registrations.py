@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Fill user_registrations.email_normalized for rows that predate it and remove
+the duplicate registrations this uncovers.
+
+Rows are processed in id order, a chunk per transaction. The registration
+that already holds a normalized email keeps it (for older rows, that is the
+first one registered); later rows with the same key are written to a CSV
+backup and deleted. Run backfill_rollups.py afterwards so the analytics
+counts match.
+
+Usage:
+    python dedupe_registrations.py [--chunk-size 1000] [--dry-run] [--backup removed.csv]
+"""
+
+import argparse
+import csv
+import os
+import sys
+from datetime import datetime
+from dotenv import load_dotenv
+
+# Load environment variables
+load_dotenv()
+
+# Add the backend directory to Python path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from app import app, db, bump_generation, normalize_email, UserRegistration
+from migrate import MigrationError, check_migrated
+
+BACKUP_COLUMNS = [
+    'id', 'name', 'email', 'phone', 'gender', 'profession', 'user_type',
+    'submitted_at', 'ip_address', 'user_agent', 'duplicate_of'
+]
+
+
+def dedupe_registrations(chunk_size, dry_run, backup_path):
+    """Key every unkeyed registration, deleting those whose key is already taken"""
+    print(f"Deduplicating registrations{' (dry run)' if dry_run else ''}...")
+
+    keyed = 0
+    removed = 0
+    # A dry run writes nothing, so keys from earlier chunks are remembered here
+    seen = {}
+    last_id = 0
+
+    with app.app_context(), open(backup_path, 'w', newline='', encoding='utf-8') as backup:
+        writer = csv.writer(backup)
+        writer.writerow(BACKUP_COLUMNS)
+
+        while True:
+            rows = db.session.execute(
+                db.select(UserRegistration)
+                .options(db.undefer_group('text'))
+                .where(UserRegistration.id > last_id, UserRegistration.email_normalized.is_(None))
+                .order_by(UserRegistration.id)
+                .limit(chunk_size)
+            ).scalars().all()
+            if not rows:
+                break
+            last_id = rows[-1].id
+
+            keys = {normalize_email(row.email) for row in rows}
+            owners = dict(db.session.execute(
+                db.select(UserRegistration.email_normalized, UserRegistration.id)
+                .where(UserRegistration.email_normalized.in_(keys))
+            ).all())
+            owners.update({key: seen[key] for key in keys if key in seen})
+
+            for row in rows:
+                key = normalize_email(row.email)
+                if key in owners:
+                    writer.writerow([getattr(row, column) for column in BACKUP_COLUMNS[:-1]] + [owners[key]])
+                    removed += 1
+                    if not dry_run:
+                        db.session.delete(row)
+                else:
+                    owners[key] = row.id
+                    keyed += 1
+                    if dry_run:
+                        seen[key] = row.id
+                    else:
+                        row.email_normalized = key
+
+            if dry_run:
+                db.session.rollback()
+            else:
+                db.session.commit()
+            print(f"- up to id {last_id}: {keyed} keyed, {removed} duplicates")
+
+    if removed and not dry_run:
+        bump_generation('user_registrations')
+
+    print(f"✅ Done: {keyed} registrations keyed, {removed} duplicates {'found' if dry_run else 'removed'}")
+    if removed:
+        print(f"{'Duplicate' if dry_run else 'Removed'} rows were written to {backup_path}")
+        if not dry_run:
+            print("Run backfill_rollups.py to bring the analytics counts up to date.")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--chunk-size', type=int, default=1000, help='rows per transaction')
+    parser.add_argument('--dry-run', action='store_true', help='report duplicates without changing anything')
+    parser.add_argument(
+        '--backup', default=f'removed_registrations_{datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")}.csv',
+        help='CSV file that receives the removed rows'
+    )
+    args = parser.parse_args()
+
+    # The schema comes from migrate.py (or init_db.py locally); never change it here
+    try:
+        with app.app_context():
+            check_migrated(db.engine, db.metadata.sorted_tables)
+    except MigrationError as e:
+        print(f'❌ {e}')
+        sys.exit(1)
+
+    dedupe_registrations(args.chunk_size, args.dry_run, args.backup)
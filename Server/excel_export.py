@@ -0,0 +1,75 @@
+"""
+Excel workbook writer for the admin export.
+
+Kept out of app.py so openpyxl is imported only by workers that actually build
+a workbook, rather than by every worker at boot.
+"""
+
+import marshal
+import tempfile
+
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.utils import get_column_letter
+
+
+def write_streamed_sheet(wb, title, headers, rows):
+    """Append a write-only sheet, sizing columns from the rows as they stream past.
+
+    Write-only sheets need their column widths before the first row is written,
+    so rows are spooled to a temporary file while the widths are measured and
+    then replayed into the sheet. Memory use stays flat regardless of row count.
+    """
+    widths = [len(header) for header in headers]
+
+    with tempfile.TemporaryFile() as spool:
+        for row in rows:
+            for index, value in enumerate(row):
+                length = len(str(value))
+                if length > widths[index]:
+                    widths[index] = length
+            marshal.dump(tuple(row), spool)
+
+        ws = wb.create_sheet(title)
+        for index, width in enumerate(widths, start=1):
+            ws.column_dimensions[get_column_letter(index)].width = min(width + 2, 50)
+
+        # Style headers
+        header_font = Font(bold=True, color="FFFFFF")
+        header_fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
+        header_cells = []
+        for header in headers:
+            cell = WriteOnlyCell(ws, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = Alignment(horizontal="center")
+            header_cells.append(cell)
+        ws.append(header_cells)
+
+        spool.seek(0)
+        while True:
+            try:
+                ws.append(marshal.load(spool))
+            except EOFError:
+                break
+
+
+def build_workbook(sheets):
+    """Write (title, headers, rows) sheets to a workbook in a temporary file.
+
+    Returns the file positioned at its start; the caller closes it.
+    """
+    # Write-only workbooks stream rows to disk instead of holding cells in memory
+    wb = Workbook(write_only=True)
+    for title, headers, rows in sheets:
+        write_streamed_sheet(wb, title, headers, rows)
+
+    excel_file = tempfile.TemporaryFile()
+    try:
+        wb.save(excel_file)
+    except Exception:
+        excel_file.close()
+        raise
+    excel_file.seek(0)
+    return excel_file
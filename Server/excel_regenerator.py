@@ -0,0 +1,127 @@
+"""
+Background, debounced regeneration of the local Excel data file.
+
+Submissions call `request()`, which returns immediately. A daemon thread waits
+for a quiet period so a burst of inserts turns into a single rebuild, then
+writes the workbook to a temporary file and renames it over the target so
+readers never see a half-written file.
+"""
+
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+
+class ExcelRegenerator:
+    """Coalesces rebuild requests and writes the Excel file off the request path"""
+
+    def __init__(self, build, path, debounce=2.0, max_delay=30.0):
+        # `build` returns a readable file object with the workbook, or None on failure
+        self.build = build
+        self.path = path
+        self.debounce = debounce
+        self.max_delay = max_delay
+
+        self._cond = threading.Condition()
+        self._thread = None
+        self._pending = 0
+        self._first_pending_at = None
+        self._last_request_at = None
+        self._building = False
+        self._builds = 0
+        self._coalesced = 0
+        self._last_built_at = None
+        self._last_duration = None
+        self._last_error = None
+
+    def request(self):
+        """Ask for a rebuild; returns immediately"""
+        with self._cond:
+            now = time.monotonic()
+            if not self._pending:
+                self._first_pending_at = now
+            self._pending += 1
+            self._last_request_at = now
+            self._ensure_thread()
+            self._cond.notify()
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name='excel-regenerator', daemon=True)
+            self._thread.start()
+
+    def _wait_for_quiet(self):
+        # Rebuild after `debounce` seconds without new requests, but never later
+        # than `max_delay` after the first pending one
+        while True:
+            now = time.monotonic()
+            wake_at = min(self._last_request_at + self.debounce, self._first_pending_at + self.max_delay)
+            if now >= wake_at:
+                return
+            self._cond.wait(wake_at - now)
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                self._wait_for_quiet()
+                coalesced = self._pending
+                self._pending = 0
+                self._building = True
+
+            started = time.monotonic()
+            error = None
+            try:
+                self._write()
+            except PermissionError:
+                error = 'Could not update Excel file - file may be open in another program'
+                logger.warning(error)
+            except Exception as e:
+                error = str(e)
+                logger.error(f'Error saving Excel file: {error}')
+
+            with self._cond:
+                self._building = False
+                self._builds += 1
+                self._coalesced += coalesced
+                self._last_duration = time.monotonic() - started
+                self._last_error = error
+                if error is None:
+                    self._last_built_at = datetime.utcnow()
+
+    def _write(self):
+        excel_file = self.build()
+        if excel_file is None:
+            raise RuntimeError('Excel report generation failed')
+
+        target_dir = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=target_dir, prefix='.lawvriksh_data-', suffix='.tmp')
+        try:
+            with excel_file, os.fdopen(fd, 'wb') as out:
+                shutil.copyfileobj(excel_file, out)
+            os.replace(tmp_path, self.path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def state(self):
+        """Snapshot of the queue for status endpoints"""
+        with self._cond:
+            return {
+                'path': self.path,
+                'pending_requests': self._pending,
+                'building': self._building,
+                'builds_completed': self._builds,
+                'requests_coalesced': self._coalesced,
+                'last_built_at': self._last_built_at.isoformat() if self._last_built_at else None,
+                'last_duration_seconds': self._last_duration,
+                'last_error': self._last_error
+            }
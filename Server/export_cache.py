@@ -0,0 +1,107 @@
+"""
+On-disk snapshot cache for generated export files.
+
+Snapshots live in a local directory so every gunicorn worker on the host sees
+the same files. Each snapshot is keyed by an ETag derived from a cheap table
+watermark; a new file is only built when the watermark moves.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows development machines
+    fcntl = None
+
+
+def make_etag(name, watermark):
+    """Build a strong ETag for a snapshot from its name and table watermark"""
+    payload = json.dumps([name, watermark], sort_keys=True, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class SnapshotCache:
+    """Directory of export snapshots shared across worker processes"""
+
+    def __init__(self, directory):
+        self.directory = directory
+
+    def _ensure_directory(self):
+        os.makedirs(self.directory, exist_ok=True)
+
+    def path_for(self, name, etag, suffix=''):
+        """Return the file path a snapshot is stored under"""
+        return os.path.join(self.directory, f'{name}-{etag}{suffix}')
+
+    def get(self, name, etag, suffix=''):
+        """Return the path of a cached snapshot, or None if it has not been built"""
+        path = self.path_for(name, etag, suffix)
+        return path if os.path.exists(path) else None
+
+    def put(self, name, etag, fileobj, suffix=''):
+        """Store a snapshot atomically and drop older snapshots with the same name"""
+        self._ensure_directory()
+        path = self.path_for(name, etag, suffix)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f'.{name}-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                shutil.copyfileobj(fileobj, out)
+            os.replace(tmp_path, path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        self._prune(name, keep=path)
+        return path
+
+    def put_stream(self, name, etag, chunks, suffix=''):
+        """Yield `chunks` while writing them to a snapshot.
+
+        The snapshot is stored only once the stream has been consumed to the
+        end; a client that disconnects midway leaves nothing behind.
+        """
+        self._ensure_directory()
+        path = self.path_for(name, etag, suffix)
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=f'.{name}-', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as out:
+                for chunk in chunks:
+                    out.write(chunk)
+                    yield chunk
+            os.replace(tmp_path, path)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+        self._prune(name, keep=path)
+
+    def _prune(self, name, keep):
+        for entry in os.listdir(self.directory):
+            entry_path = os.path.join(self.directory, entry)
+            if entry.startswith(f'{name}-') and entry_path != keep:
+                try:
+                    os.remove(entry_path)
+                except OSError:
+                    # Another worker may still be streaming it or already removed it
+                    pass
+
+    @contextmanager
+    def lock(self, name):
+        """Serialize snapshot builds for `name` across processes on this host"""
+        self._ensure_directory()
+        with open(os.path.join(self.directory, f'.{name}.lock'), 'w') as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
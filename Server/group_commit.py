@@ -0,0 +1,163 @@
+"""
+Group commit for high-rate form submissions.
+
+Request threads hand a record factory to a per-process committer thread and
+block until their row is durable. The committer gathers everything that
+arrives within a short window into one transaction, so a burst of concurrent
+submissions pays for a single COMMIT round trip instead of one each.
+"""
+
+import logging
+import queue
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds of the batch size histogram buckets; the last bucket is open-ended
+BATCH_SIZE_BUCKETS = (1, 2, 4, 8, 16, 32, 64)
+
+
+class _PendingWrite:
+    __slots__ = ('factory', 'enqueued_at', 'done', 'result', 'error')
+
+    def __init__(self, factory):
+        self.factory = factory
+        self.enqueued_at = time.monotonic()
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class GroupCommitter:
+    """Batches inserts from concurrent requests into shared transactions"""
+
+    def __init__(self, commit_batch, window=0.005, max_batch=100, timeout=25.0, observer=None):
+        # `commit_batch(factories)` inserts one record per factory in a single
+        # transaction and returns a result for each, in order, e.g. (id, submitted_at).
+        # `observer(batch_size, waits)` is called after every batch, e.g. for metrics.
+        self.commit_batch = commit_batch
+        self.observer = observer
+        self.window = window
+        self.max_batch = max_batch
+        self.timeout = timeout
+
+        self._queue = queue.Queue()
+        self._thread = None
+        self._thread_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._batches = 0
+        self._items = 0
+        self._failures = 0
+        self._max_batch_seen = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+        self._batch_size_counts = [0] * (len(BATCH_SIZE_BUCKETS) + 1)
+
+    def submit(self, factory):
+        """Insert the record built by `factory()` and return its result once committed"""
+        self._ensure_thread()
+        pending = _PendingWrite(factory)
+        self._queue.put(pending)
+
+        if not pending.done.wait(self.timeout):
+            raise TimeoutError('Timed out waiting for group commit')
+        if pending.error is not None:
+            raise pending.error
+        return pending.result
+
+    def _ensure_thread(self):
+        # Started lazily so each forked worker process gets its own committer
+        if self._thread is None or not self._thread.is_alive():
+            with self._thread_lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name='group-committer', daemon=True)
+                    self._thread.start()
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = time.monotonic() + self.window
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            try:
+                self._commit(batch)
+            except Exception as e:
+                # Never let the committer thread die with callers still waiting
+                logger.error(f'Group commit failed: {str(e)}')
+                for pending in batch:
+                    if not pending.done.is_set():
+                        pending.error = e
+                        pending.done.set()
+
+    def _commit(self, batch):
+        try:
+            results = self.commit_batch([pending.factory for pending in batch])
+            for pending, result in zip(batch, results):
+                pending.result = result
+        except Exception as e:
+            if len(batch) == 1:
+                batch[0].error = e
+            else:
+                # Retry one by one so a single bad row does not fail its neighbours
+                logger.warning(f'Group commit of {len(batch)} rows failed, retrying individually: {str(e)}')
+                for pending in batch:
+                    try:
+                        pending.result = self.commit_batch([pending.factory])[0]
+                    except Exception as item_error:
+                        pending.error = item_error
+
+        self._record(batch)
+        for pending in batch:
+            pending.done.set()
+
+    def _record(self, batch):
+        now = time.monotonic()
+        size = len(batch)
+        bucket = next(
+            (i for i, bound in enumerate(BATCH_SIZE_BUCKETS) if size <= bound),
+            len(BATCH_SIZE_BUCKETS)
+        )
+        with self._stats_lock:
+            self._batches += 1
+            self._items += size
+            self._failures += sum(1 for pending in batch if pending.error is not None)
+            self._max_batch_seen = max(self._max_batch_seen, size)
+            self._batch_size_counts[bucket] += 1
+            waits = [now - pending.enqueued_at for pending in batch]
+            self._wait_total += sum(waits)
+            self._wait_max = max(self._wait_max, *waits)
+
+        if self.observer is not None:
+            try:
+                self.observer(size, waits)
+            except Exception as e:
+                logger.warning(f'Group commit observer failed: {str(e)}')
+
+    def stats(self):
+        """Commit batch sizes and caller wait times for this process"""
+        with self._stats_lock:
+            labels = [f'<={bound}' for bound in BATCH_SIZE_BUCKETS] + [f'>{BATCH_SIZE_BUCKETS[-1]}']
+            return {
+                'window_ms': self.window * 1000,
+                'max_batch': self.max_batch,
+                'queued': self._queue.qsize(),
+                'batches': self._batches,
+                'items': self._items,
+                'failures': self._failures,
+                'avg_batch_size': self._items / self._batches if self._batches else 0,
+                'max_batch_size': self._max_batch_seen,
+                'batch_size_histogram': dict(zip(labels, self._batch_size_counts)),
+                'avg_wait_ms': self._wait_total / self._items * 1000 if self._items else 0,
+                'max_wait_ms': self._wait_max * 1000
+            }
@@ -1,4 +1,5 @@
 import os
+import sys
 
 # Server socket
 bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
@@ -6,8 +7,14 @@ backlog = 2048
 
 # Worker processes
 workers = int(os.environ.get('WEB_CONCURRENCY', '1'))
-worker_class = 'sync'
-worker_connections = 1000
+
+# Threads per worker. With more than one thread the gthread worker is used, so
+# each process serves that many requests concurrently (Flask-SQLAlchemy scopes
+# sessions per app context, which is per thread). app.py sizes the database
+# pool from the same variables.
+threads = int(os.environ.get('GUNICORN_THREADS', '1'))
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gthread' if threads > 1 else 'sync')
+worker_connections = 1000  # only used by async worker classes
 timeout = 30
 keepalive = 2
 
@@ -34,3 +41,22 @@ tmp_upload_dir = None
 # SSL (if needed)
 keyfile = None
 certfile = None
+
+# Metrics: each worker publishes snapshots to the shared local store
+def on_starting(server):
+    # Counters restart with the server, as Prometheus expects
+    from local_store import LocalStore, default_store_path
+    import metrics
+    metrics.reset(LocalStore(default_store_path()))
+
+def worker_exit(server, worker):
+    # Publish the final numbers of the exiting worker
+    app_module = sys.modules.get('app')
+    if app_module is not None:
+        app_module.metrics.flush(force=True)
+
+def child_exit(server, worker):
+    # Fold the dead worker's counters into the retired totals so they stay monotonic
+    from local_store import LocalStore, default_store_path
+    import metrics
+    metrics.retire_process(LocalStore(default_store_path()), worker.pid)
@@ -0,0 +1,94 @@
+"""
+Startup import profiler.
+
+`install()` wraps the import machinery so each module imported afterwards is
+timed and its allocations traced; `log_report()` logs the most expensive
+modules by cumulative time and by memory. Enable with IMPORT_REPORT=1; it
+slows imports down, so leave it off in normal operation.
+"""
+
+import builtins
+import sys
+import time
+import tracemalloc
+
+_original_import = builtins.__import__
+_records = {}
+_stack = []
+_started_tracing = False
+
+
+class _ImportRecord:
+    __slots__ = ('name', 'cumulative', 'self_time', 'memory', 'self_memory')
+
+    def __init__(self, name):
+        self.name = name
+        self.cumulative = 0.0
+        self.self_time = 0.0
+        self.memory = 0
+        self.self_memory = 0
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    # Only absolute imports of modules not loaded yet are worth measuring
+    if level or name in sys.modules:
+        return _original_import(name, globals, locals, fromlist, level)
+
+    record = _ImportRecord(name)
+    child_time = [0.0, 0]
+    _stack.append(child_time)
+    memory_before = tracemalloc.get_traced_memory()[0]
+    started = time.perf_counter()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        elapsed = time.perf_counter() - started
+        allocated = max(tracemalloc.get_traced_memory()[0] - memory_before, 0)
+        _stack.pop()
+
+        record.cumulative = elapsed
+        record.memory = allocated
+        record.self_time = elapsed - child_time[0]
+        record.self_memory = max(allocated - child_time[1], 0)
+        if name in sys.modules and name not in _records:
+            _records[name] = record
+
+        if _stack:
+            _stack[-1][0] += elapsed
+            _stack[-1][1] += allocated
+
+
+def install():
+    """Start recording the cost of subsequent imports"""
+    global _started_tracing
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+        _started_tracing = True
+    builtins.__import__ = _timed_import
+
+
+def uninstall():
+    """Stop recording; collected results are kept for log_report()"""
+    builtins.__import__ = _original_import
+
+
+def log_report(logger, top=15):
+    """Log the top modules by cumulative import time and by memory, then stop recording"""
+    uninstall()
+    records = list(_records.values())
+    total_time = sum(record.self_time for record in records)
+    total_memory = sum(record.self_memory for record in records)
+
+    logger.info(
+        f'Import report: {len(records)} modules, {total_time * 1000:.0f} ms, '
+        f'{total_memory / 1024 / 1024:.1f} MiB allocated'
+    )
+    logger.info('Top imports by time (cumulative ms / self ms):')
+    for record in sorted(records, key=lambda r: r.cumulative, reverse=True)[:top]:
+        logger.info(f'  {record.name:<40} {record.cumulative * 1000:8.1f} {record.self_time * 1000:8.1f}')
+    logger.info('Top imports by memory (cumulative KiB / self KiB):')
+    for record in sorted(records, key=lambda r: r.memory, reverse=True)[:top]:
+        logger.info(f'  {record.name:<40} {record.memory / 1024:8.0f} {record.self_memory / 1024:8.0f}')
+
+    if _started_tracing:
+        tracemalloc.stop()
@@ -1,9 +1,14 @@
 #!/usr/bin/env python3
 """
 Database initialization script for LawVriksh Feedback System
-Run this script to create the database tables locally.
+Run this script to create the database tables locally. Existing tables and
+their data are kept unless --drop is given.
+
+Usage:
+    python init_db.py [--drop]
 """
 
+import argparse
 import os
 import sys
 from dotenv import load_dotenv
@@ -15,19 +20,23 @@ load_dotenv()
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from app import app, db, create_tables
+from migrate import schema_migrations
 
-def init_database():
+def init_database(drop=False):
     """Initialize the database with all tables"""
     print("Initializing LawVriksh Feedback Database...")
 
     with app.app_context():
         try:
-            # Drop all tables (use with caution in production!)
-            print("Dropping existing tables...")
-            db.drop_all()
+            if drop:
+                # Deletes every row; only on explicit request
+                print("Dropping existing tables...")
+                db.drop_all()
+                # The migration history described the dropped tables
+                schema_migrations.drop(db.engine, checkfirst=True)
 
-            # Create all tables
-            print("Creating new tables...")
+            # Create missing tables, columns and indexes
+            print("Creating tables...")
             create_tables()
 
             print("✅ Database initialized successfully!")
@@ -61,4 +70,8 @@ def init_database():
             sys.exit(1)
 
 if __name__ == '__main__':
-    init_database()
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--drop', action='store_true', help='drop all tables first (deletes all data)')
+    args = parser.parse_args()
+
+    init_database(drop=args.drop)
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 """
 MySQL Database Initialization Script for LawVriksh Feedback System
-This script reads the schema.sql file and executes it to create the database tables.
+This script applies the pending SQL migrations in migrations/ (see migrate.py)
+to create or update the database tables.
 """
 
 import os
 import sys
 import pymysql
 from dotenv import load_dotenv
+from sqlalchemy import create_engine
 from urllib.parse import urlparse
 
+from migrate import MigrationError, load_migrations, migrate
+
 # Load environment variables
 load_dotenv()
 
@@ -59,66 +63,6 @@ def get_connection_params():
             'database': os.environ.get('DB_NAME', 'lawvriksh_db')
         }
 
-def read_sql_file(file_path):
-    """Read and return SQL file content"""
-    try:
-        with open(file_path, 'r', encoding='utf-8') as file:
-            return file.read()
-    except FileNotFoundError:
-        print(f"❌ SQL file not found: {file_path}")
-        return None
-    except Exception as e:
-        print(f"❌ Error reading SQL file: {str(e)}")
-        return None
-
-def execute_sql_statements(connection, sql_content):
-    """Execute SQL statements from the schema file"""
-    try:
-        cursor = connection.cursor()
-        
-        # Split SQL content into individual statements
-        statements = []
-        current_statement = ""
-        
-        for line in sql_content.split('\n'):
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('--'):
-                continue
-            
-            # Skip multi-line comments
-            if line.startswith('/*') or line.endswith('*/'):
-                continue
-            
-            current_statement += line + " "
-            
-            # If line ends with semicolon, it's end of statement
-            if line.endswith(';'):
-                statements.append(current_statement.strip())
-                current_statement = ""
-        
-        # Execute each statement
-        executed_count = 0
-        for statement in statements:
-            if statement and not statement.startswith('--'):
-                try:
-                    cursor.execute(statement)
-                    executed_count += 1
-                except Exception as e:
-                    print(f"⚠️  Warning executing statement: {str(e)}")
-                    print(f"Statement: {statement[:100]}...")
-        
-        connection.commit()
-        cursor.close()
-        
-        print(f"✅ Successfully executed {executed_count} SQL statements")
-        return True
-        
-    except Exception as e:
-        print(f"❌ Error executing SQL statements: {str(e)}")
-        return False
-
 def verify_tables(connection):
     """Verify that tables were created successfully"""
     try:
@@ -128,7 +72,11 @@ def verify_tables(connection):
         cursor.execute("SHOW TABLES")
         tables = [table[0] for table in cursor.fetchall()]
         
-        expected_tables = ['user_registrations', 'feedback']
+        expected_tables = [
+            'user_registrations', 'feedback', 'feedback_rating_rollups',
+            'submission_daily_rollups', 'user_registrations_archive', 'feedback_archive',
+            'schema_migrations'
+        ]
         created_tables = [table for table in expected_tables if table in tables]
         
         print(f"\n📊 Database Verification:")
@@ -172,26 +120,27 @@ def main():
             log_params['password'] = '***'
         print(f"Connection: {log_params}")
         
-        # Read SQL schema file
-        print("\n📄 Reading schema.sql file...")
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        sql_file_path = os.path.join(script_dir, 'schema.sql')
-        
-        sql_content = read_sql_file(sql_file_path)
-        if not sql_content:
-            sys.exit(1)
-        
-        print(f"✅ SQL file loaded ({len(sql_content)} characters)")
+        # Load migrations
+        print("\n📄 Loading migrations...")
+        migrations = load_migrations()
+        print(f"✅ {len(migrations)} migration(s) found")
         
         # Connect to database
         print("\n🔌 Connecting to MySQL database...")
         connection = pymysql.connect(**conn_params)
         print("✅ Database connection successful!")
         
-        # Execute SQL statements
-        print("\n⚙️  Executing SQL statements...")
-        if not execute_sql_statements(connection, sql_content):
+        # Apply pending migrations
+        print("\n⚙️  Applying pending migrations...")
+        engine = create_engine('mysql+pymysql://', creator=lambda: pymysql.connect(**conn_params))
+        try:
+            applied = migrate(engine, log=lambda message: print(f"  {message}"))
+        except MigrationError as e:
+            print(f"❌ Migration failed: {str(e)}")
             sys.exit(1)
+        finally:
+            engine.dispose()
+        print(f"✅ {len(applied)} migration(s) applied" if applied else "✅ Schema already up to date")
         
         # Verify tables
         print("\n🔍 Verifying table creation...")
@@ -0,0 +1,47 @@
+"""
+Faster JSON encoding for API responses.
+
+`FastJSONProvider` uses orjson when it is installed and otherwise behaves
+exactly like Flask's default provider. Output keeps Flask's conventions:
+sorted keys, compact unless the app is in debug mode, a trailing newline,
+and dates rendered by Flask's own default() (HTTP date format). orjson writes
+non-ASCII characters as UTF-8 instead of \\u escapes.
+"""
+
+from flask.json.provider import DefaultJSONProvider
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, with a stdlib fallback"""
+
+    if orjson is not None:
+        _options = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+        def dumps(self, obj, **kwargs):
+            # Callers asking for specific json.dumps arguments get the stdlib encoder
+            if kwargs:
+                return super().dumps(obj, **kwargs)
+            return orjson.dumps(obj, default=self.default, option=self._options).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            if kwargs:
+                return super().loads(s, **kwargs)
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            option = self._options
+            if self.compact is False or (self.compact is None and self._app.debug):
+                option |= orjson.OPT_INDENT_2
+            body = orjson.dumps(obj, default=self.default, option=option) + b'\n'
+            return self._app.response_class(body, mimetype=self.mimetype)
+
+    @property
+    def backend(self):
+        """Name of the encoder in use"""
+        return 'orjson' if orjson is not None else 'json'
@@ -0,0 +1,119 @@
+"""
+Small key/value store shared by all worker processes on one host.
+
+Backed by a local SQLite file in WAL mode, so gunicorn workers can share
+caches and counters without running an extra service. Values are stored as
+given (str, bytes, int or float); callers encode anything richer themselves.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+
+def default_store_path():
+    """Store location from LOCAL_STORE_PATH, defaulting to the system temp directory"""
+    return os.environ.get(
+        'LOCAL_STORE_PATH', os.path.join(tempfile.gettempdir(), 'lawvriksh_local_store.sqlite3')
+    )
+
+
+class LocalStore:
+    """Cross-process key/value store with optional per-key expiry"""
+
+    def __init__(self, path, timeout=5.0, purge_interval=60.0):
+        self.path = path
+        self.timeout = timeout
+        # Expired entries are swept by whichever process writes after this many seconds
+        self.purge_interval = purge_interval
+        self._last_purge = time.monotonic()
+        self._local = threading.local()
+
+    def _connection(self):
+        # SQLite connections must not cross fork() or threads
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.pid != os.getpid():
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS kv ('
+                'key TEXT PRIMARY KEY, value BLOB, expires_at REAL)'
+            )
+            self._local.conn = conn
+            self._local.pid = os.getpid()
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Run a read-modify-write sequence atomically across processes"""
+        conn = self._connection()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            yield self
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        else:
+            conn.execute('COMMIT')
+
+    def get(self, key, default=None):
+        """Return the value stored under `key`, or `default` if missing or expired"""
+        row = self._connection().execute(
+            'SELECT value, expires_at FROM kv WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            return default
+        return row[0]
+
+    def get_prefix(self, prefix):
+        """Return a dict of the live entries whose key starts with `prefix`"""
+        rows = self._connection().execute(
+            'SELECT key, value, expires_at FROM kv WHERE substr(key, 1, ?) = ?',
+            (len(prefix), prefix)
+        ).fetchall()
+        now = time.time()
+        return {key: value for key, value, expires_at in rows if expires_at is None or expires_at > now}
+
+    def set(self, key, value, ttl=None):
+        """Store `value` under `key`, expiring after `ttl` seconds if given.
+
+        ttl=None keeps the entry until it is replaced or deleted; a ttl of 0
+        or less means "do not cache", so any existing entry is removed.
+        """
+        if ttl is not None and ttl <= 0:
+            self.delete(key)
+            return
+        expires_at = time.time() + ttl if ttl is not None else None
+        self._connection().execute(
+            'INSERT OR REPLACE INTO kv (key, value, expires_at) VALUES (?, ?, ?)',
+            (key, value, expires_at)
+        )
+        if ttl is not None and time.monotonic() - self._last_purge > self.purge_interval:
+            self._last_purge = time.monotonic()
+            self.purge_expired()
+
+    def incr(self, key, amount=1):
+        """Atomically add `amount` to an integer counter and return the new value"""
+        with self.transaction():
+            current = self.get(key, 0)
+            value = int(current) + amount
+            self.set(key, value)
+        return value
+
+    def delete(self, key):
+        """Remove `key` if present"""
+        self._connection().execute('DELETE FROM kv WHERE key = ?', (key,))
+
+    def purge_expired(self):
+        """Delete expired entries; returns the number removed"""
+        cursor = self._connection().execute(
+            'DELETE FROM kv WHERE expires_at IS NOT NULL AND expires_at <= ?', (time.time(),)
+        )
+        return cursor.rowcount
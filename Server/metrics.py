@@ -0,0 +1,215 @@
+"""
+Prometheus-style metrics aggregated across gunicorn workers.
+
+Each worker records counters and histograms in memory and periodically writes
+a snapshot to the shared LocalStore. The /metrics endpoint merges the
+snapshots of every worker, plus the totals of workers that have exited, and
+renders them in the Prometheus text exposition format.
+"""
+
+import json
+import os
+import threading
+import time
+
+# Seconds; suits request durations, query times and pool waits alike
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+SNAPSHOT_PREFIX = 'metrics:worker:'
+RETIRED_KEY = 'metrics:retired'
+
+
+def _label_key(labels):
+    return tuple(sorted((labels or {}).items()))
+
+
+def _format_labels(pairs):
+    if not pairs:
+        return ''
+    escaped = []
+    for name, value in pairs:
+        value = str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+        escaped.append(f'{name}="{value}"')
+    return '{' + ','.join(escaped) + '}'
+
+
+def _format_value(value):
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Metrics:
+    """Per-process metric registry that publishes snapshots to a shared store"""
+
+    def __init__(self, store, flush_interval=5.0):
+        self.store = store
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._definitions = {}
+        self._counters = {}
+        self._histograms = {}
+        self._gauge_callbacks = []
+        self._last_flush = 0.0
+
+    def counter(self, name, help_text):
+        """Declare a counter"""
+        self._definitions[name] = ('counter', help_text, None)
+
+    def histogram(self, name, help_text, buckets=DEFAULT_BUCKETS):
+        """Declare a histogram with the given upper bucket bounds"""
+        self._definitions[name] = ('histogram', help_text, tuple(buckets))
+
+    def gauge(self, name, help_text, callback):
+        """Declare a gauge whose values come from `callback()` at flush time.
+
+        The callback returns a list of (labels, value) pairs for this process.
+        Gauges are summed across live workers and dropped when a worker exits.
+        """
+        self._definitions[name] = ('gauge', help_text, None)
+        self._gauge_callbacks.append((name, callback))
+
+    def inc(self, name, labels=None, amount=1):
+        """Add `amount` to a counter"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + amount
+
+    def observe(self, name, value, labels=None):
+        """Record one observation in a histogram"""
+        buckets = self._definitions[name][2]
+        key = (name, _label_key(labels))
+        with self._lock:
+            state = self._histograms.get(key)
+            if state is None:
+                state = self._histograms[key] = [[0] * len(buckets), 0.0, 0]
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    state[0][index] += 1
+                    break
+            state[1] += value
+            state[2] += 1
+
+    def snapshot(self):
+        """JSON-serialisable state of this process"""
+        with self._lock:
+            counters = [[name, list(labels), value] for (name, labels), value in self._counters.items()]
+            histograms = [
+                [name, list(labels), list(state[0]), state[1], state[2]]
+                for (name, labels), state in self._histograms.items()
+            ]
+
+        gauges = []
+        for name, callback in self._gauge_callbacks:
+            try:
+                for labels, value in callback():
+                    gauges.append([name, list(_label_key(labels)), value])
+            except Exception:
+                # A broken gauge must not stop the rest of the snapshot
+                continue
+
+        return {'counters': counters, 'histograms': histograms, 'gauges': gauges}
+
+    def flush(self, force=False):
+        """Publish this process's snapshot, at most once per flush interval unless forced"""
+        now = time.monotonic()
+        if not force and now - self._last_flush < self.flush_interval:
+            return
+        self._last_flush = now
+        self.store.set(f'{SNAPSHOT_PREFIX}{os.getpid()}', json.dumps(self.snapshot()))
+
+    def render(self):
+        """Merge all worker snapshots and render them as Prometheus text"""
+        self.flush(force=True)
+        snapshots = [json.loads(value) for value in self.store.get_prefix(SNAPSHOT_PREFIX).values()]
+        retired = self.store.get(RETIRED_KEY)
+        if retired is not None:
+            snapshots.append(json.loads(retired))
+
+        merged = _merge(snapshots)
+        lines = []
+        for name, (kind, help_text, buckets) in sorted(self._definitions.items()):
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            if kind == 'histogram':
+                for labels, (counts, total, count) in sorted(merged['histograms'].get(name, {}).items()):
+                    cumulative = 0
+                    for bound, bucket_count in zip(buckets, counts):
+                        cumulative += bucket_count
+                        le = labels + (('le', _format_value(bound)),)
+                        lines.append(f'{name}_bucket{_format_labels(le)} {cumulative}')
+                    le = labels + (('le', '+Inf'),)
+                    lines.append(f'{name}_bucket{_format_labels(le)} {count}')
+                    lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(total)}')
+                    lines.append(f'{name}_count{_format_labels(labels)} {count}')
+            else:
+                section = 'counters' if kind == 'counter' else 'gauges'
+                for labels, value in sorted(merged[section].get(name, {}).items()):
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+        return '\n'.join(lines) + '\n'
+
+
+def _merge(snapshots, include_gauges=True):
+    merged = {'counters': {}, 'histograms': {}, 'gauges': {}}
+    for snapshot in snapshots:
+        for name, labels, value in snapshot.get('counters', []):
+            series = merged['counters'].setdefault(name, {})
+            key = tuple(map(tuple, labels))
+            series[key] = series.get(key, 0) + value
+        for name, labels, counts, total, count in snapshot.get('histograms', []):
+            series = merged['histograms'].setdefault(name, {})
+            key = tuple(map(tuple, labels))
+            if key in series:
+                previous_counts, previous_total, previous_count = series[key]
+                counts = [a + b for a, b in zip(previous_counts, counts)]
+                total += previous_total
+                count += previous_count
+            series[key] = (counts, total, count)
+        if include_gauges:
+            for name, labels, value in snapshot.get('gauges', []):
+                series = merged['gauges'].setdefault(name, {})
+                key = tuple(map(tuple, labels))
+                series[key] = series.get(key, 0) + value
+    return merged
+
+
+def _to_snapshot(merged):
+    return {
+        'counters': [
+            [name, [list(pair) for pair in labels], value]
+            for name, series in merged['counters'].items() for labels, value in series.items()
+        ],
+        'histograms': [
+            [name, [list(pair) for pair in labels], counts, total, count]
+            for name, series in merged['histograms'].items() for labels, (counts, total, count) in series.items()
+        ],
+        'gauges': []
+    }
+
+
+def retire_process(store, pid):
+    """Fold an exited worker's counters and histograms into the retired totals.
+
+    Keeps the merged counters monotonic when gunicorn recycles workers; the
+    worker's gauges are dropped.
+    """
+    key = f'{SNAPSHOT_PREFIX}{pid}'
+    with store.transaction():
+        snapshot = store.get(key)
+        if snapshot is None:
+            return
+        snapshots = [json.loads(snapshot)]
+        retired = store.get(RETIRED_KEY)
+        if retired is not None:
+            snapshots.append(json.loads(retired))
+        store.set(RETIRED_KEY, json.dumps(_to_snapshot(_merge(snapshots, include_gauges=False))))
+        store.delete(key)
+
+
+def reset(store):
+    """Drop all published metrics, e.g. when the server (re)starts"""
+    with store.transaction():
+        for key in store.get_prefix('metrics:'):
+            store.delete(key)
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Apply the SQL migrations in migrations/ to the database.
+
+Migrations are `<number>_<name>.sql` files, applied in number order. Each
+applied migration is recorded in schema_migrations with the SHA-256 checksum
+of its file, and only pending ones run, so repeated deploys cost one query.
+A recorded migration whose file has since been edited stops the run; write
+a new migration instead.
+
+The migrations are MySQL scripts, so other databases are refused; local
+SQLite databases are built by create_tables() instead. MySQL commits each
+DDL statement implicitly, so each migration is recorded as soon as its
+statements succeed, and a failed run resumes at the failed migration. A
+named lock keeps two deploys from migrating at once, and lock_wait_timeout
+makes a DDL statement that cannot get its table lock fail instead of
+stalling the queries queued behind it.
+
+Usage:
+    python migrate.py [--dry-run]
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, inspect, select
+
+from sql_script import split_statements
+
+MIGRATIONS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'migrations')
+MIGRATION_FILE = re.compile(r'^(\d+)_\w+\.sql$')
+
+# Seconds a MySQL DDL statement may wait for its table lock
+LOCK_WAIT_TIMEOUT = int(os.environ.get('MIGRATION_LOCK_WAIT_TIMEOUT', '10'))
+
+schema_migrations = Table(
+    'schema_migrations', MetaData(),
+    Column('version', String(255), primary_key=True),
+    Column('checksum', String(64), nullable=False),
+    Column('applied_at', DateTime, nullable=False),
+    Column('duration_ms', Integer, nullable=False)
+)
+
+
+class MigrationError(Exception):
+    """A migration could not be loaded or applied"""
+
+
+class Migration:
+    """One migration file"""
+
+    def __init__(self, path):
+        self.path = path
+        self.version = os.path.basename(path)[:-len('.sql')]
+        with open(path, encoding='utf-8') as file:
+            self.sql = file.read()
+        # Line endings are normalized so a checkout with CRLF matches
+        self.checksum = hashlib.sha256(self.sql.replace('\r\n', '\n').encode('utf-8')).hexdigest()
+
+    @property
+    def statements(self):
+        return split_statements(self.sql)
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    """Migrations in `directory`, in the order they are applied"""
+    migrations = {}
+    for name in os.listdir(directory):
+        match = MIGRATION_FILE.match(name)
+        if not match:
+            continue
+        number = int(match.group(1))
+        if number in migrations:
+            raise MigrationError(f'Two migrations are numbered {number}: {migrations[number].version}, {name}')
+        migrations[number] = Migration(os.path.join(directory, name))
+    return [migrations[number] for number in sorted(migrations)]
+
+
+@contextmanager
+def migration_lock(connection):
+    """Hold the migration lock for the duration of a run"""
+    acquired = connection.exec_driver_sql(
+        "SELECT GET_LOCK('schema_migrations', %s)", (LOCK_WAIT_TIMEOUT,)
+    ).scalar()
+    if acquired != 1:
+        raise MigrationError('Another migration run holds the schema_migrations lock')
+    try:
+        connection.exec_driver_sql('SET SESSION lock_wait_timeout = %s', (LOCK_WAIT_TIMEOUT,))
+        yield
+    finally:
+        connection.exec_driver_sql("SELECT RELEASE_LOCK('schema_migrations')")
+
+
+def pending_migrations(connection, migrations, log):
+    """Check recorded checksums and return the migrations not applied yet"""
+    applied = dict(connection.execute(select(schema_migrations.c.version, schema_migrations.c.checksum)).all())
+
+    changed = [m.version for m in migrations if m.version in applied and applied[m.version] != m.checksum]
+    if changed:
+        raise MigrationError(f"Applied migrations were modified since: {', '.join(changed)}")
+
+    known = {m.version for m in migrations}
+    for version in sorted(set(applied) - known):
+        log(f'⚠️  {version} is recorded as applied but its file is missing')
+
+    return [m for m in migrations if m.version not in applied]
+
+
+def check_migrated(engine, tables, directory=MIGRATIONS_DIR):
+    """Raise MigrationError unless the schema is up to date; runs no DDL.
+
+    For scripts that must not change the schema themselves. On MySQL every
+    migration must be recorded with its current checksum. Other databases are
+    built by create_tables() rather than migrated, so there the `tables`
+    (SQLAlchemy Table objects) must exist with all their columns.
+    """
+    with engine.connect() as connection:
+        inspector = inspect(connection)
+        if engine.dialect.name == 'mysql':
+            if not inspector.has_table(schema_migrations.name):
+                raise MigrationError('No migrations have been applied; run python migrate.py first')
+            pending = pending_migrations(connection, load_migrations(directory), log=lambda message: None)
+            if pending:
+                raise MigrationError(
+                    f"Pending migrations: {', '.join(m.version for m in pending)}; run python migrate.py first"
+                )
+            return
+
+        missing = []
+        for table in tables:
+            if not inspector.has_table(table.name):
+                missing.append(table.name)
+                continue
+            existing = {column['name'] for column in inspector.get_columns(table.name)}
+            missing += [f'{table.name}.{column.name}' for column in table.columns if column.name not in existing]
+        if missing:
+            raise MigrationError(f"Missing from the database: {', '.join(missing)}; run python init_db.py first")
+
+
+def migrate(engine, directory=MIGRATIONS_DIR, dry_run=False, log=print):
+    """Apply pending migrations; returns the versions applied (or pending, for a dry run)"""
+    if engine.dialect.name != 'mysql':
+        raise MigrationError(
+            f'Migrations are written for MySQL, not {engine.dialect.name}; '
+            'use create_tables() (python init_db.py) for a local database'
+        )
+    migrations = load_migrations(directory)
+
+    with engine.connect() as connection, migration_lock(connection):
+        schema_migrations.create(connection, checkfirst=True)
+        connection.commit()
+
+        pending = pending_migrations(connection, migrations, log)
+        if dry_run or not pending:
+            connection.rollback()
+            for migration in pending:
+                log(f'Pending: {migration.version} ({len(migration.statements)} statements)')
+            return [migration.version for migration in pending]
+
+        for migration in pending:
+            started = time.perf_counter()
+            statements = migration.statements
+            for number, statement in enumerate(statements, 1):
+                try:
+                    connection.exec_driver_sql(statement, execution_options={'no_parameters': True})
+                except Exception as e:
+                    connection.rollback()
+                    raise MigrationError(
+                        f'{migration.version}: statement #{number} failed (statements before it '
+                        f'may already be committed): {e}'
+                    ) from e
+
+            duration_ms = int((time.perf_counter() - started) * 1000)
+            connection.execute(schema_migrations.insert().values(
+                version=migration.version, checksum=migration.checksum,
+                applied_at=datetime.utcnow(), duration_ms=duration_ms
+            ))
+            connection.commit()
+            log(f'Applied {migration.version} ({len(statements)} statements, {duration_ms} ms)')
+
+        return [migration.version for migration in pending]
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dry-run', action='store_true', help='list pending migrations without applying them')
+    args = parser.parse_args()
+
+    from dotenv import load_dotenv
+    load_dotenv()
+    from app import app, db
+
+    try:
+        with app.app_context():
+            applied = migrate(db.engine, dry_run=args.dry_run)
+    except MigrationError as e:
+        print(f'❌ {e}')
+        sys.exit(1)
+
+    if args.dry_run:
+        print(f'{len(applied)} pending migration(s)')
+    else:
+        print(f"✅ Schema up to date{f' ({len(applied)} applied)' if applied else ''}")
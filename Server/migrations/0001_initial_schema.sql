@@ -0,0 +1,58 @@
+-- Initial LawVriksh schema (MySQL): the two tables as the first release
+-- created them. Later migrations bring them up to the models in app.py.
+--
+-- Tables are created only if missing, so databases set up by that release
+-- pass through unchanged and get the later changes from 0003 onwards.
+
+CREATE TABLE IF NOT EXISTS user_registrations (
+    id INTEGER NOT NULL AUTO_INCREMENT,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    phone VARCHAR(20) NOT NULL,
+    gender VARCHAR(50),
+    profession VARCHAR(255),
+    user_type VARCHAR(20) NOT NULL,  -- 'USER' or 'Creator'
+    submitted_at DATETIME NOT NULL,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    PRIMARY KEY (id),
+    KEY ix_user_registrations_name (name),
+    KEY ix_user_registrations_email (email),
+    KEY ix_user_registrations_user_type (user_type),
+    KEY ix_user_registrations_submitted_at (submitted_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS feedback (
+    id INTEGER NOT NULL AUTO_INCREMENT,
+
+    /* Ratings, 1-5; NULL when the question was skipped */
+    visual_design INTEGER,
+    ease_of_navigation INTEGER,
+    mobile_responsiveness INTEGER,
+    overall_satisfaction INTEGER,
+    ease_of_tasks INTEGER,
+    quality_of_services INTEGER,
+
+    /* Explanations, required for ratings below 3 */
+    visual_design_issue TEXT,
+    ease_of_navigation_issue TEXT,
+    mobile_responsiveness_issue TEXT,
+    overall_satisfaction_issue TEXT,
+    ease_of_tasks_issue TEXT,
+    quality_of_services_issue TEXT,
+
+    like_most TEXT,
+    improvements TEXT,
+    features TEXT,
+    legal_challenges TEXT,
+    additional_comments TEXT,
+
+    contact_willing VARCHAR(10),  -- 'yes' or 'no'
+    contact_email VARCHAR(255),
+
+    submitted_at DATETIME NOT NULL,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    PRIMARY KEY (id),
+    KEY ix_feedback_submitted_at (submitted_at)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,52 @@
+-- Archive tables for archive_submissions.py (MySQL), matching archive_table()
+-- in app.py: the live columns plus archived_at, with ids kept as they were.
+--
+-- Only the primary key and (submitted_at, id) are indexed and nothing is
+-- unique. Rows are compressed on disk; they are written once and read only
+-- by exports with ?include_archived=1.
+
+CREATE TABLE IF NOT EXISTS user_registrations_archive (
+    id INTEGER NOT NULL,
+    name VARCHAR(255) NOT NULL,
+    email VARCHAR(255) NOT NULL,
+    email_normalized VARCHAR(255),
+    phone VARCHAR(20) NOT NULL,
+    gender VARCHAR(50),
+    profession VARCHAR(255),
+    user_type VARCHAR(20) NOT NULL,
+    submitted_at DATETIME NOT NULL,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    archived_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    KEY ix_user_registrations_archive_submitted_at_id (submitted_at, id)
+) ENGINE=InnoDB ROW_FORMAT=COMPRESSED DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS feedback_archive (
+    id INTEGER NOT NULL,
+    visual_design INTEGER,
+    ease_of_navigation INTEGER,
+    mobile_responsiveness INTEGER,
+    overall_satisfaction INTEGER,
+    ease_of_tasks INTEGER,
+    quality_of_services INTEGER,
+    visual_design_issue TEXT,
+    ease_of_navigation_issue TEXT,
+    mobile_responsiveness_issue TEXT,
+    overall_satisfaction_issue TEXT,
+    ease_of_tasks_issue TEXT,
+    quality_of_services_issue TEXT,
+    like_most TEXT,
+    improvements TEXT,
+    features TEXT,
+    legal_challenges TEXT,
+    additional_comments TEXT,
+    contact_willing VARCHAR(10),
+    contact_email VARCHAR(255),
+    submitted_at DATETIME NOT NULL,
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    archived_at DATETIME NOT NULL,
+    PRIMARY KEY (id),
+    KEY ix_feedback_archive_submitted_at_id (submitted_at, id)
+) ENGINE=InnoDB ROW_FORMAT=COMPRESSED DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
@@ -0,0 +1,48 @@
+-- (submitted_at, id) indexes behind keyset pagination of the list endpoints
+-- and the export/archive scans. They replace the single-column submitted_at
+-- indexes, which are a prefix of them and only cost writes.
+--
+-- Each change is skipped when it has already been made (databases built by
+-- create_tables() from newer models): MySQL has no ADD INDEX IF NOT EXISTS,
+-- so the statement is chosen from information_schema and run as a prepared
+-- statement.
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'user_registrations' AND index_name = 'ix_user_registrations_submitted_at_id') = 0,
+    'ALTER TABLE user_registrations ADD INDEX ix_user_registrations_submitted_at_id (submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_submitted_at_id') = 0,
+    'ALTER TABLE feedback ADD INDEX ix_feedback_submitted_at_id (submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'user_registrations' AND index_name = 'ix_user_registrations_submitted_at') > 0,
+    'ALTER TABLE user_registrations DROP INDEX ix_user_registrations_submitted_at',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_submitted_at') > 0,
+    'ALTER TABLE feedback DROP INDEX ix_feedback_submitted_at',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
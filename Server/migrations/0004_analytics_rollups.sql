@@ -0,0 +1,23 @@
+-- Daily aggregates behind GET /api/analytics, kept current on every insert.
+-- Run backfill_rollups.py once afterwards to count the existing rows.
+
+CREATE TABLE IF NOT EXISTS feedback_rating_rollups (
+    day DATE NOT NULL,
+    dimension VARCHAR(32) NOT NULL,
+    responses INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_1 INTEGER NOT NULL DEFAULT 0,
+    rating_2 INTEGER NOT NULL DEFAULT 0,
+    rating_3 INTEGER NOT NULL DEFAULT 0,
+    rating_4 INTEGER NOT NULL DEFAULT 0,
+    rating_5 INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, dimension)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
+
+CREATE TABLE IF NOT EXISTS submission_daily_rollups (
+    day DATE NOT NULL,
+    source VARCHAR(20) NOT NULL,   -- 'feedback' or 'registrations'
+    segment VARCHAR(20) NOT NULL,  -- user_type for registrations, '' for feedback
+    submissions INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, source, segment)
+) ENGINE=InnoDB DEFAULT CHARSET=utf8mb4 COLLATE=utf8mb4_unicode_ci;
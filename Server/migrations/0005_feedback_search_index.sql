@@ -0,0 +1,18 @@
+-- FULLTEXT index behind GET /api/feedback/search (SEARCH_COLUMNS in app.py).
+-- The first FULLTEXT index on a table rebuilds it, so apply this outside
+-- peak hours on a large feedback table.
+--
+-- Each change is skipped when it is already there (databases built by
+-- create_tables() from newer models): MySQL has no ADD INDEX IF NOT EXISTS,
+-- so the statement is chosen from information_schema and run as a prepared
+-- statement.
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ft_feedback_text') = 0,
+    'ALTER TABLE feedback ADD FULLTEXT INDEX ft_feedback_text (like_most, improvements, features, legal_challenges, additional_comments, visual_design_issue, ease_of_navigation_issue, mobile_responsiveness_issue, overall_satisfaction_issue, ease_of_tasks_issue, quality_of_services_issue)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
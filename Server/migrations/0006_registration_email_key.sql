@@ -0,0 +1,29 @@
+-- Normalized email key for registrations (see normalize_email() in app.py).
+-- Existing rows keep NULL, which the unique key allows more than once; run
+-- dedupe_registrations.py right after this to fill them and remove the
+-- duplicates it finds.
+--
+-- Each change is skipped when it is already there (databases built by
+-- create_tables() from newer models): MySQL has no ADD INDEX IF NOT EXISTS,
+-- so the statement is chosen from information_schema and run as a prepared
+-- statement.
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.columns
+     WHERE table_schema = DATABASE() AND table_name = 'user_registrations' AND column_name = 'email_normalized') = 0,
+    'ALTER TABLE user_registrations ADD COLUMN email_normalized VARCHAR(255) NULL AFTER email',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'user_registrations' AND index_name = 'uq_user_registrations_email_normalized') = 0,
+    'ALTER TABLE user_registrations ADD UNIQUE INDEX uq_user_registrations_email_normalized (email_normalized)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
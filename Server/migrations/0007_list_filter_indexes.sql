@@ -0,0 +1,98 @@
+-- (column, submitted_at, id) indexes behind the list filters
+-- (registration_filters and feedback_filters in app.py); check_query_plans.py
+-- verifies that each filter uses one.
+--
+-- Each change is skipped when it is already there (databases built by
+-- create_tables() from newer models): MySQL has no ADD INDEX IF NOT EXISTS,
+-- so the statement is chosen from information_schema and run as a prepared
+-- statement.
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'user_registrations' AND index_name = 'ix_user_registrations_user_type_submitted_at') = 0,
+    'ALTER TABLE user_registrations ADD INDEX ix_user_registrations_user_type_submitted_at (user_type, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'user_registrations' AND index_name = 'ix_user_registrations_profession_submitted_at') = 0,
+    'ALTER TABLE user_registrations ADD INDEX ix_user_registrations_profession_submitted_at (profession, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_visual_design_submitted_at') = 0,
+    'ALTER TABLE feedback ADD INDEX ix_feedback_visual_design_submitted_at (visual_design, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_ease_of_navigation_submitted_at') = 0,
+    'ALTER TABLE feedback ADD INDEX ix_feedback_ease_of_navigation_submitted_at (ease_of_navigation, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_mobile_responsiveness_submitted_at') = 0,
+    'ALTER TABLE feedback ADD INDEX ix_feedback_mobile_responsiveness_submitted_at (mobile_responsiveness, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_overall_satisfaction_submitted_at') = 0,
+    'ALTER TABLE feedback ADD INDEX ix_feedback_overall_satisfaction_submitted_at (overall_satisfaction, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_ease_of_tasks_submitted_at') = 0,
+    'ALTER TABLE feedback ADD INDEX ix_feedback_ease_of_tasks_submitted_at (ease_of_tasks, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_quality_of_services_submitted_at') = 0,
+    'ALTER TABLE feedback ADD INDEX ix_feedback_quality_of_services_submitted_at (quality_of_services, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_contact_willing_submitted_at') = 0,
+    'ALTER TABLE feedback ADD INDEX ix_feedback_contact_willing_submitted_at (contact_willing, submitted_at, id)',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
@@ -0,0 +1,68 @@
+-- Drop the (rating, submitted_at, id) indexes added by 0007. Rating filters
+-- are ranges (min_/max_), so these indexes cannot return rows in submitted_at
+-- order; the planner walks ix_feedback_submitted_at_id instead, and every
+-- feedback insert paid to maintain six unused indexes.
+--
+-- Each drop is skipped when the index is already gone; MySQL has no DROP
+-- INDEX IF EXISTS, so the statement is chosen from information_schema and
+-- run as a prepared statement.
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_visual_design_submitted_at') > 0,
+    'ALTER TABLE feedback DROP INDEX ix_feedback_visual_design_submitted_at',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_ease_of_navigation_submitted_at') > 0,
+    'ALTER TABLE feedback DROP INDEX ix_feedback_ease_of_navigation_submitted_at',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_mobile_responsiveness_submitted_at') > 0,
+    'ALTER TABLE feedback DROP INDEX ix_feedback_mobile_responsiveness_submitted_at',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_overall_satisfaction_submitted_at') > 0,
+    'ALTER TABLE feedback DROP INDEX ix_feedback_overall_satisfaction_submitted_at',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_ease_of_tasks_submitted_at') > 0,
+    'ALTER TABLE feedback DROP INDEX ix_feedback_ease_of_tasks_submitted_at',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
+
+SET @ddl = IF(
+    (SELECT COUNT(*) FROM information_schema.statistics
+     WHERE table_schema = DATABASE() AND table_name = 'feedback' AND index_name = 'ix_feedback_quality_of_services_submitted_at') > 0,
+    'ALTER TABLE feedback DROP INDEX ix_feedback_quality_of_services_submitted_at',
+    'DO 0'
+);
+PREPARE ddl FROM @ddl;
+EXECUTE ddl;
+DEALLOCATE PREPARE ddl;
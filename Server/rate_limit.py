@@ -0,0 +1,43 @@
+"""
+Token-bucket rate limiting shared by all worker processes.
+
+Each client key has a bucket of up to `burst` tokens that refills at `rate`
+tokens per second. Buckets live in the LocalStore and are updated inside a
+BEGIN IMMEDIATE transaction, so concurrent requests from different gunicorn
+workers cannot both spend the last token.
+"""
+
+import time
+
+
+class TokenBucketLimiter:
+    """Per-key token buckets kept in a LocalStore"""
+
+    def __init__(self, store, rate, burst, prefix='ratelimit:'):
+        self.store = store
+        self.rate = rate
+        self.burst = burst
+        self.prefix = prefix
+
+    def consume(self, key, tokens=1):
+        """Take `tokens` from the bucket for `key`.
+
+        Returns 0 when the request is allowed, otherwise the number of seconds
+        until the bucket holds enough tokens. A rejected request spends nothing.
+        """
+        store_key = f'{self.prefix}{key}'
+        with self.store.transaction():
+            now = time.time()
+            state = self.store.get(store_key)
+            if state is None:
+                available, updated_at = self.burst, now
+            else:
+                available, updated_at = (float(part) for part in state.split(':'))
+
+            available = min(self.burst, available + max(now - updated_at, 0) * self.rate)
+            if available < tokens:
+                return (tokens - available) / self.rate
+
+            # Once the bucket would be full again the entry can simply expire
+            self.store.set(store_key, f'{available - tokens}:{now}', ttl=self.burst / self.rate)
+            return 0
@@ -0,0 +1,99 @@
+"""
+Split SQL scripts into statements.
+
+A small tokenizer for the MySQL script syntax used in migrations/: statements
+end at the current delimiter (`;` unless changed by a `DELIMITER` line, as
+for stored procedures), but not inside '...', "..." or `...` quotes or
+comments. `--`, `#` and `/* */` comments are dropped; `/*! */` version
+comments and `/*+ */` optimizer hints are kept, since MySQL executes them.
+"""
+
+import re
+
+# Client-side command: "DELIMITER //" on a line of its own
+DELIMITER_LINE = re.compile(r'[ \t]*DELIMITER[ \t]+(\S+)[ \t]*(?:\r?\n|$)', re.IGNORECASE)
+
+
+class SQLScriptError(ValueError):
+    """Raised for a script that cannot be split, e.g. an unterminated string"""
+
+
+def _line_number(sql, position):
+    return sql.count('\n', 0, position) + 1
+
+
+def _quoted_end(sql, start):
+    """Index just past the quoted string or identifier that starts at `start`"""
+    quote = sql[start]
+    i = start + 1
+    while i < len(sql):
+        char = sql[i]
+        if char == '\\' and quote != '`':
+            i += 2
+        elif char == quote:
+            # A doubled quote stands for the quote character itself
+            if sql.startswith(quote, i + 1):
+                i += 2
+            else:
+                return i + 1
+        else:
+            i += 1
+    raise SQLScriptError(f'Unterminated {quote} quote starting on line {_line_number(sql, start)}')
+
+
+def split_statements(sql, delimiter=';'):
+    """Return the statements of `sql`, without delimiters and comments"""
+    statements = []
+    current = []
+    blank = True  # nothing but whitespace and comments since the last delimiter
+
+    def finish():
+        statement = ''.join(current).strip()
+        if statement:
+            statements.append(statement)
+        current.clear()
+
+    i = 0
+    line_start = True
+    while i < len(sql):
+        if line_start and blank:
+            match = DELIMITER_LINE.match(sql, i)
+            if match:
+                delimiter = match.group(1)
+                current.clear()
+                i = match.end()
+                continue
+
+        char = sql[i]
+        line_start = char == '\n'
+
+        if sql.startswith(delimiter, i):
+            finish()
+            blank = True
+            i += len(delimiter)
+        elif char in '\'"`':
+            end = _quoted_end(sql, i)
+            current.append(sql[i:end])
+            blank = False
+            i = end
+        elif char == '#' or (sql.startswith('--', i) and sql[i + 2:i + 3] in ('', ' ', '\t', '\r', '\n')):
+            # Line comment; the newline itself is kept
+            end = sql.find('\n', i)
+            i = len(sql) if end == -1 else end
+        elif sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            if end == -1:
+                raise SQLScriptError(f'Unterminated comment starting on line {_line_number(sql, i)}')
+            if sql.startswith(('/*!', '/*+'), i):
+                current.append(sql[i:end + 2])
+                blank = False
+            else:
+                current.append(' ')
+            i = end + 2
+        else:
+            current.append(char)
+            blank = blank and char.isspace()
+            i += 1
+
+    finish()
+    return statements
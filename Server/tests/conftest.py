@@ -0,0 +1,41 @@
+import os
+import sys
+import tempfile
+
+import pytest
+
+# app.py reads its configuration at import time
+TEST_DIR = tempfile.mkdtemp(prefix='lawvriksh-tests-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(TEST_DIR, 'test.db')}"
+os.environ['LOCAL_STORE_PATH'] = os.path.join(TEST_DIR, 'local_store.sqlite3')
+os.environ['RATE_LIMIT_PER_MINUTE'] = '0'
+os.environ['RESPONSE_CACHE_TTL'] = '0'
+os.environ['STATS_CACHE_TTL'] = '0'
+os.environ['EXPORT_COMMIT_LAG'] = '0'
+os.environ.pop('GROUP_COMMIT', None)
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+@pytest.fixture(scope='session')
+def app():
+    app_module.app.config['TESTING'] = True
+    app_module.create_tables()
+    return app_module.app
+
+
+@pytest.fixture
+def client(app):
+    yield app.test_client()
+    with app.app_context():
+        for table in reversed(app_module.db.metadata.sorted_tables):
+            app_module.db.session.execute(table.delete())
+        app_module.db.session.commit()
+
+
+def registration(i, **overrides):
+    item = {'name': f'User {i}', 'email': f'user{i}@example.com', 'phone': '9999999999', 'userType': 'USER'}
+    item.update(overrides)
+    return item
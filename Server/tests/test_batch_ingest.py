@@ -0,0 +1,31 @@
+from app import INSERT_CHUNK_SIZE, Feedback, UserRegistration
+from conftest import registration
+
+
+def test_batch_ids_match_stored_rows(app, client):
+    items = [registration(i) for i in range(INSERT_CHUNK_SIZE * 2 + 7)]
+    response = client.post('/api/register/batch', json=items)
+    assert response.status_code == 201
+    results = response.get_json()['results']
+    assert [result['index'] for result in results] == list(range(len(items)))
+
+    with app.app_context():
+        stored = {row.id: row.email for row in UserRegistration.query}
+    assert len(stored) == len(items)
+    assert {result['id'] for result in results} == set(stored)
+    for result in results:
+        assert stored[result['id']] == items[result['index']]['email']
+
+
+def test_feedback_batch_ids_match_stored_rows(app, client):
+    items = [
+        {'visualDesign': str(i % 5 + 1), 'visualDesignIssue': f'issue {i}'}
+        for i in range(INSERT_CHUNK_SIZE + 1)
+    ]
+    response = client.post('/api/feedback/batch', json=items)
+    assert response.status_code == 201
+
+    with app.app_context():
+        stored = {row.id: row.visual_design_issue for row in Feedback.query}
+    for result in response.get_json()['results']:
+        assert stored[result['id']] == items[result['index']]['visualDesignIssue']
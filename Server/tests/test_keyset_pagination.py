@@ -0,0 +1,108 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from app import UserRegistration, db, decode_cursor, encode_cursor, keyset_page
+
+ADMIN_HEADERS = {'X-API-Key': 'admin-key-123'}
+SAME_TIME = datetime(2024, 1, 15, 10, 30)
+
+
+def add_registrations(app, times):
+    with app.app_context():
+        db.session.add_all([
+            UserRegistration(name=f'User {i}', email=f'user{i}@example.com', email_normalized=f'user{i}@example.com',
+                             phone='1', user_type='USER', submitted_at=submitted_at)
+            for i, submitted_at in enumerate(times)
+        ])
+        db.session.commit()
+        return [(row.submitted_at, row.id) for row in UserRegistration.query]
+
+
+def token(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def walk(client, url, key, per_page):
+    """Follow next_after from the first page; returns the pages of ids"""
+    pages = []
+    after = ''
+    while after is not None:
+        response = client.get(url, query_string={'after': after, 'per_page': per_page}, headers=ADMIN_HEADERS)
+        assert response.status_code == 200
+        body = response.get_json()
+        pages.append([row['id'] for row in body[key]])
+        after = body['next_after']
+    return pages
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor(SAME_TIME, 42)) == (SAME_TIME, 42)
+
+
+def test_ties_on_submitted_at_are_broken_by_id(app, client):
+    times = [SAME_TIME] * 5 + [SAME_TIME - timedelta(seconds=1)] * 2 + [SAME_TIME + timedelta(seconds=1)]
+    rows = add_registrations(app, times)
+    expected = [row_id for _, row_id in sorted(rows, reverse=True)]
+
+    pages = walk(client, '/api/registrations', 'registrations', per_page=2)
+    assert [len(page) for page in pages] == [2, 2, 2, 2]
+    assert [row_id for page in pages for row_id in page] == expected
+
+
+def test_page_boundary_inside_a_tie(app, client):
+    rows = add_registrations(app, [SAME_TIME] * 3)
+    ids = sorted((row_id for _, row_id in rows), reverse=True)
+
+    with app.app_context():
+        first, after = keyset_page(UserRegistration, '', 2)
+        assert [row.id for row in first] == ids[:2]
+        assert decode_cursor(after) == (SAME_TIME, ids[1])
+        second, after = keyset_page(UserRegistration, after, 2)
+        assert [row.id for row in second] == ids[2:]
+        assert after is None
+
+
+@pytest.mark.parametrize('count, per_page', [(0, 5), (3, 5), (5, 5), (6, 5)])
+def test_last_page_has_no_cursor(app, client, count, per_page):
+    add_registrations(app, [SAME_TIME + timedelta(minutes=i) for i in range(count)])
+    pages = walk(client, '/api/registrations', 'registrations', per_page)
+    assert sum(len(page) for page in pages) == count
+    assert len(pages) == max(1, -(-count // per_page))
+
+
+def test_feedback_cursor_pages(app, client):
+    response = client.post('/api/feedback/batch', json=[{'likeMost': f'answer {i}'} for i in range(7)])
+    assert response.status_code == 201
+    pages = walk(client, '/api/feedback', 'feedback', per_page=3)
+    ids = [row_id for page in pages for row_id in page]
+    assert [len(page) for page in pages] == [3, 3, 1]
+    assert sorted(ids) == sorted(result['id'] for result in response.get_json()['results'])
+
+
+@pytest.mark.parametrize('after', [
+    'not-a-cursor!',
+    'é',
+    'a' * 1000,
+    token(None),
+    token('2024-01-15T10:30:00'),
+    token([1, 2]),
+    token(['2024-01-15T10:30:00']),
+    token(['2024-01-15T10:30:00', 1, 2]),
+    token({'submitted_at': '2024-01-15T10:30:00', 'id': 1}),
+    token(['yesterday', 1]),
+    token(['2024-01-15T10:30:00', 'one']),
+    token(['2024-01-15T10:30:00', None]),
+    token(['2024-01-15T10:30:00', 10 ** 30]),
+    token(['2024-01-15T10:30:00', -1]),
+    token(['2024-01-15T10:30:00+05:30', 1]),
+    encode_cursor(SAME_TIME, 1)[:-3],
+])
+@pytest.mark.parametrize('url', ['/api/registrations', '/api/feedback'])
+def test_bad_cursor_is_rejected(app, client, url, after):
+    add_registrations(app, [SAME_TIME])
+    response = client.get(url, query_string={'after': after}, headers=ADMIN_HEADERS)
+    assert response.status_code == 400
+    assert response.get_json() == {'error': 'Invalid after cursor'}
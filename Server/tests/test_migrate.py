@@ -0,0 +1,86 @@
+from datetime import datetime
+
+import pytest
+from sqlalchemy import Column, Integer, MetaData, Table, create_engine
+
+from migrate import MigrationError, check_migrated, load_migrations, pending_migrations, schema_migrations
+
+
+@pytest.fixture
+def migrations_dir(tmp_path):
+    (tmp_path / '0001_first.sql').write_text('CREATE TABLE a (id INT);\n', encoding='utf-8')
+    (tmp_path / '0002_second.sql').write_text('CREATE TABLE b (id INT);\n', encoding='utf-8')
+    (tmp_path / 'README.txt').write_text('not a migration', encoding='utf-8')
+    return tmp_path
+
+
+@pytest.fixture
+def connection():
+    engine = create_engine('sqlite://')
+    with engine.connect() as connection:
+        schema_migrations.create(connection)
+        yield connection
+
+
+def record(connection, migration, checksum=None):
+    connection.execute(schema_migrations.insert().values(
+        version=migration.version, checksum=checksum or migration.checksum,
+        applied_at=datetime.utcnow(), duration_ms=1
+    ))
+
+
+def test_load_migrations_in_number_order(migrations_dir):
+    assert [m.version for m in load_migrations(migrations_dir)] == ['0001_first', '0002_second']
+
+
+def test_duplicate_numbers_are_refused(migrations_dir):
+    (migrations_dir / '1_again.sql').write_text('SELECT 1;', encoding='utf-8')
+    with pytest.raises(MigrationError, match='Two migrations are numbered 1'):
+        load_migrations(migrations_dir)
+
+
+def test_checksum_ignores_line_endings(migrations_dir):
+    (migrations_dir / '0003_crlf.sql').write_bytes(b'CREATE TABLE a (id INT);\r\n')
+    migrations = {m.version: m for m in load_migrations(migrations_dir)}
+    assert migrations['0003_crlf'].checksum == migrations['0001_first'].checksum
+
+
+def test_pending_migrations_skip_applied(migrations_dir, connection):
+    migrations = load_migrations(migrations_dir)
+    record(connection, migrations[0])
+    assert [m.version for m in pending_migrations(connection, migrations, log=print)] == ['0002_second']
+
+
+def test_modified_applied_migration_raises(migrations_dir, connection):
+    migrations = load_migrations(migrations_dir)
+    record(connection, migrations[0])
+    (migrations_dir / '0001_first.sql').write_text('CREATE TABLE a (id BIGINT);\n', encoding='utf-8')
+
+    with pytest.raises(MigrationError, match='Applied migrations were modified since: 0001_first'):
+        pending_migrations(connection, load_migrations(migrations_dir), log=print)
+
+
+def test_missing_migration_file_is_logged(migrations_dir, connection):
+    migrations = load_migrations(migrations_dir)
+    record(connection, migrations[0])
+    (migrations_dir / '0001_first.sql').unlink()
+    messages = []
+
+    pending = pending_migrations(connection, load_migrations(migrations_dir), log=messages.append)
+    assert [m.version for m in pending] == ['0002_second']
+    assert messages == ['⚠️  0001_first is recorded as applied but its file is missing']
+
+
+def test_check_migrated_reports_missing_tables_and_columns(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'check.db'}")
+    metadata = MetaData()
+    items = Table('items', metadata, Column('id', Integer, primary_key=True), Column('size', Integer))
+    with engine.begin() as connection:
+        connection.exec_driver_sql('CREATE TABLE items (id INTEGER PRIMARY KEY)')
+
+    with pytest.raises(MigrationError, match='Missing from the database: items.size'):
+        check_migrated(engine, [items])
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql('ALTER TABLE items ADD COLUMN size INTEGER')
+    check_migrated(engine, [items])
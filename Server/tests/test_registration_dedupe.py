@@ -0,0 +1,96 @@
+from datetime import datetime
+
+import pytest
+
+import app as app_module
+from app import UserRegistration, db, normalize_email
+from conftest import registration
+
+ADMIN_HEADERS = {'X-API-Key': 'admin-key-123'}
+
+
+@pytest.mark.parametrize('email, expected', [
+    ('Asha.Rao@Example.com', 'asha.rao@example.com'),
+    ('  asha@example.com\t', 'asha@example.com'),
+    (' ASHA@EXAMPLE.COM ', 'asha@example.com'),
+    ('asha+news@example.com', 'asha@example.com'),
+    ('A.S.H.A+tag@Gmail.com', 'asha@gmail.com'),
+    ('asha.rao@googlemail.com', 'asharao@gmail.com'),
+    ('asha.rao@example.com', 'asha.rao@example.com'),
+    ('+only@example.com', '+only@example.com'),
+    ('no-at-sign ', 'no-at-sign'),
+])
+def test_normalize_email(email, expected):
+    assert normalize_email(email) == expected
+
+
+def registration_count(client):
+    return client.get('/api/stats', headers=ADMIN_HEADERS).get_json()['registrations']['total']
+
+
+def test_existing_email_returns_duplicate(app, client):
+    first = client.post('/api/register', json=registration(1, email='Asha.Rao@Example.com'))
+    assert first.status_code == 201
+
+    again = client.post('/api/register', json=registration(2, email='  asha.rao+later@EXAMPLE.com '))
+    assert again.status_code == 200
+    body = again.get_json()
+    assert body['duplicate'] is True
+    assert body['id'] == first.get_json()['id']
+
+    with app.app_context():
+        assert UserRegistration.query.count() == 1
+    assert registration_count(client) == 1
+
+
+def test_duplicates_within_a_batch(app, client):
+    existing = client.post('/api/register', json=registration(0, email='old@example.com')).get_json()['id']
+    items = [
+        registration(1, email='new@example.com'),
+        registration(2, email='NEW@example.com '),
+        registration(3, email='old+again@example.com'),
+        registration(4, email='other@example.com'),
+    ]
+    response = client.post('/api/register/batch', json=items)
+    assert response.status_code == 201
+    body = response.get_json()
+    assert (body['created'], body['duplicates'], body['failed']) == (2, 2, 0)
+
+    results = body['results']
+    assert 'duplicate' not in results[0]
+    assert results[1]['duplicate'] is True and results[1]['id'] == results[0]['id']
+    assert results[2]['duplicate'] is True and results[2]['id'] == existing
+    assert 'duplicate' not in results[3]
+
+    with app.app_context():
+        assert UserRegistration.query.count() == 3
+    assert registration_count(client) == 3
+
+
+def test_concurrent_registration_is_retried(app, client, monkeypatch):
+    """A row committed between the lookup and the insert makes the retry return it"""
+    stage_records = app_module.stage_records
+    calls = []
+
+    def stage_then_race(records):
+        staged = stage_records(records)
+        if not calls:
+            # Another worker commits the same mailbox after our lookup
+            with db.engine.begin() as connection:
+                connection.execute(UserRegistration.__table__.insert().values(
+                    name='Other worker', email='race@example.com', email_normalized='race@example.com',
+                    phone='1', user_type='USER', submitted_at=datetime.utcnow()
+                ))
+        calls.append(records)
+        return staged
+
+    monkeypatch.setattr(app_module, 'stage_records', stage_then_race)
+    response = client.post('/api/register', json=registration(1, email='Race@Example.com'))
+
+    assert len(calls) == 2
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['duplicate'] is True
+    with app.app_context():
+        rows = UserRegistration.query.all()
+    assert [(row.id, row.name) for row in rows] == [(body['id'], 'Other worker')]
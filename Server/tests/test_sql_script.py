@@ -0,0 +1,90 @@
+import pytest
+
+from migrate import load_migrations
+from sql_script import SQLScriptError, split_statements
+
+
+def test_splits_on_semicolons():
+    assert split_statements('SELECT 1;\nSELECT 2;\n\nSELECT 3') == ['SELECT 1', 'SELECT 2', 'SELECT 3']
+
+
+@pytest.mark.parametrize('statement', [
+    "INSERT INTO t VALUES ('a;b')",
+    'INSERT INTO t VALUES ("a;b")',
+    'SELECT `odd;name` FROM t',
+    "INSERT INTO t VALUES ('it''s; fine')",
+    r"INSERT INTO t VALUES ('back\'slash; still quoted')",
+])
+def test_quoted_semicolons_do_not_split(statement):
+    assert split_statements(f'{statement};\nSELECT 2;') == [statement, 'SELECT 2']
+
+
+def test_line_comments_are_dropped():
+    sql = (
+        '-- leading comment; with a semicolon\n'
+        'SELECT 1; # trailing comment; also with one\n'
+        'SELECT 2 -- and another;\n'
+        ';\n'
+    )
+    assert split_statements(sql) == ['SELECT 1', 'SELECT 2']
+
+
+def test_double_dash_needs_whitespace_to_start_a_comment():
+    assert split_statements('SELECT 1--1;') == ['SELECT 1--1']
+
+
+def test_block_comments_are_dropped():
+    assert split_statements('SELECT /* a; b */ 1;\n/* only a comment; */\nSELECT 2;') == ['SELECT   1', 'SELECT 2']
+
+
+def test_version_comments_and_hints_are_kept():
+    sql = '/*!50503 SET NAMES utf8mb4 */;\nSELECT /*+ MAX_EXECUTION_TIME(1000) */ 1;'
+    assert split_statements(sql) == [
+        '/*!50503 SET NAMES utf8mb4 */',
+        'SELECT /*+ MAX_EXECUTION_TIME(1000) */ 1',
+    ]
+
+
+def test_comment_markers_inside_quotes_are_text():
+    sql = "INSERT INTO t VALUES ('-- not a comment', '# nor this', '/* nor this */');"
+    assert split_statements(sql) == [sql[:-1]]
+
+
+def test_delimiter_switching():
+    sql = (
+        'DROP PROCEDURE IF EXISTS p;\n'
+        'DELIMITER //\n'
+        'CREATE PROCEDURE p()\n'
+        'BEGIN\n'
+        '  SELECT 1;\n'
+        '  SELECT 2;\n'
+        'END //\n'
+        'DELIMITER ;\n'
+        'CALL p();\n'
+    )
+    assert split_statements(sql) == [
+        'DROP PROCEDURE IF EXISTS p',
+        'CREATE PROCEDURE p()\nBEGIN\n  SELECT 1;\n  SELECT 2;\nEND',
+        'CALL p()',
+    ]
+
+
+def test_delimiter_only_counts_at_the_start_of_a_statement():
+    sql = "SELECT 'x'\nDELIMITER //\n;"
+    assert split_statements(sql) == ["SELECT 'x'\nDELIMITER //"]
+
+
+@pytest.mark.parametrize('sql, message', [
+    ("SELECT 'unterminated;\nSELECT 2;", "Unterminated ' quote starting on line 1"),
+    ('SELECT 1;\n/* never closed', 'Unterminated comment starting on line 2'),
+])
+def test_unterminated_input_raises(sql, message):
+    with pytest.raises(SQLScriptError, match=message):
+        split_statements(sql)
+
+
+def test_shipped_migrations_split():
+    for migration in load_migrations():
+        statements = migration.statements
+        assert statements, migration.version
+        assert all(statement.strip() for statement in statements), migration.version
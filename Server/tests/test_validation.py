@@ -0,0 +1,111 @@
+import os
+import random
+import sys
+
+import pytest
+
+from app import normalize_email, parse_feedback, parse_registration, validate_feedback
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from bench_validation import (  # noqa: E402
+    feedback_payload, outcome, reference_build_feedback, reference_build_registration,
+    reference_validate_feedback, reference_validate_registration, registration_payload,
+)
+
+
+def reference_registration(data):
+    error = reference_validate_registration(data)
+    if error:
+        return {'error': error}, None
+    return None, reference_build_registration(data, normalize_email)
+
+
+def reference_feedback(data):
+    errors = reference_validate_feedback(data)
+    if errors:
+        return {'error': 'Validation failed', 'details': errors}, None
+    return None, reference_build_feedback(data)
+
+
+VALID_REGISTRATION = {
+    'name': 'Asha Rao', 'email': 'Asha.Rao@Example.com', 'phone': '9876543210',
+    'userType': 'USER', 'gender': 'Female', 'profession': 'Advocate',
+}
+
+REGISTRATION_CASES = {
+    'valid': VALID_REGISTRATION,
+    'valid padded': {**VALID_REGISTRATION, 'name': '  Asha  ', 'phone': ' 98 ', 'gender': ' ', 'profession': ''},
+    'missing name': {key: value for key, value in VALID_REGISTRATION.items() if key != 'name'},
+    'missing everything': {},
+    'empty email': {**VALID_REGISTRATION, 'email': ''},
+    'email without dot': {**VALID_REGISTRATION, 'email': 'asha@example'},
+    'bad user type': {**VALID_REGISTRATION, 'userType': 'admin'},
+    'user type wrong type': {**VALID_REGISTRATION, 'userType': ['USER']},
+    'name wrong type': {**VALID_REGISTRATION, 'name': 7},
+    'phone wrong type': {**VALID_REGISTRATION, 'phone': 9876543210},
+    'email wrong type': {**VALID_REGISTRATION, 'email': 42},
+    'over-length name': {**VALID_REGISTRATION, 'name': 'A' * 10000},
+    'over-length email': {**VALID_REGISTRATION, 'email': 'a' * 5000 + '@example.com'},
+}
+
+VALID_FEEDBACK = {
+    'visualDesign': '4', 'easeOfNavigation': '2', 'easeOfNavigationIssue': 'Menus are hidden',
+    'mobileResponsiveness': '5', 'overallSatisfaction': '3', 'easeOfTasks': '5', 'qualityOfServices': '4',
+    'likeMost': 'Search', 'contactWilling': 'yes', 'contactEmail': ' asha@example.com ',
+}
+
+FEEDBACK_CASES = {
+    'valid': VALID_FEEDBACK,
+    'empty': {},
+    'missing explanation': {key: value for key, value in VALID_FEEDBACK.items() if key != 'easeOfNavigationIssue'},
+    'blank explanation': {**VALID_FEEDBACK, 'easeOfNavigationIssue': '   '},
+    'missing contact email': {key: value for key, value in VALID_FEEDBACK.items() if key != 'contactEmail'},
+    'invalid contact email': {**VALID_FEEDBACK, 'contactEmail': 'asha'},
+    'contact email not required': {**VALID_FEEDBACK, 'contactWilling': 'no', 'contactEmail': ''},
+    'rating below range': {**VALID_FEEDBACK, 'visualDesign': '0'},
+    'rating above range': {**VALID_FEEDBACK, 'visualDesign': '6'},
+    'negative rating': {**VALID_FEEDBACK, 'easeOfTasks': -1},
+    'rating not a number': {**VALID_FEEDBACK, 'visualDesign': 'abc'},
+    'rating decimal string': {**VALID_FEEDBACK, 'visualDesign': '2.5'},
+    'rating float': {**VALID_FEEDBACK, 'visualDesign': 4.7},
+    'rating list': {**VALID_FEEDBACK, 'visualDesign': [5]},
+    'rating bool': {**VALID_FEEDBACK, 'visualDesign': True},
+    'rating padded': {**VALID_FEEDBACK, 'visualDesign': ' 3 '},
+    'several errors': {'visualDesign': '9', 'easeOfTasks': '1', 'qualityOfServices': 'x', 'contactWilling': 'yes'},
+    'text wrong type': {**VALID_FEEDBACK, 'likeMost': 5},
+    'explanation wrong type': {**VALID_FEEDBACK, 'easeOfNavigationIssue': 5},
+    'over-length text': {**VALID_FEEDBACK, 'additionalComments': 'x' * 100000},
+    'over-length rating': {**VALID_FEEDBACK, 'visualDesign': '5' * 400},
+}
+
+
+@pytest.mark.parametrize('payload', REGISTRATION_CASES.values(), ids=REGISTRATION_CASES.keys())
+def test_registration_matches_reference(payload):
+    assert outcome(parse_registration, payload) == outcome(reference_registration, payload)
+
+
+@pytest.mark.parametrize('payload', FEEDBACK_CASES.values(), ids=FEEDBACK_CASES.keys())
+def test_feedback_matches_reference(payload):
+    assert outcome(parse_feedback, payload) == outcome(reference_feedback, payload)
+
+
+def test_feedback_reports_errors_in_reference_order():
+    errors, values = validate_feedback(FEEDBACK_CASES['several errors'])
+    assert values is None
+    assert errors == [
+        'visualDesign must be between 1 and 5',
+        'qualityOfServices must be a valid number',
+        "Please explain what you didn't like for easeOfTasks (rating below 3)",
+        'Email is required when willing to be contacted',
+    ]
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_generated_payloads_match_reference(seed):
+    rng = random.Random(seed)
+    for _ in range(200):
+        payload = registration_payload(rng)
+        assert outcome(parse_registration, payload) == outcome(reference_registration, payload), payload
+        payload = feedback_payload(rng)
+        assert outcome(parse_feedback, payload) == outcome(reference_feedback, payload), payload
@@ -0,0 +1,193 @@
+"""
+Declarative payload schemas compiled into single-pass validators.
+
+A schema is a list of field specs (Text, Rating, Email, Choice, Derived).
+`compile_validator` turns it into one generated Python function that reads
+each key once, checks it, and returns the column values for the model:
+
+    validate = compile_validator([Text('name', 'name', required=True), ...])
+    errors, values = validate(payload)
+
+Checks run in a fixed order: required fields, ratings, explanations for low
+ratings, email formats, then choices; within each step fields are checked in
+schema order. With first_error_only the validator stops at the first error.
+Values are only built when there are no errors, so a value of the wrong type
+in a field that is only stripped (e.g. a number for a free-text answer)
+raises AttributeError rather than producing an error message.
+"""
+
+
+class Text:
+    """Free-text field, stored stripped; empty optional values become None"""
+
+    def __init__(self, key, column, required=False):
+        self.key = key
+        self.column = column
+        self.required = required
+
+
+class Rating:
+    """Integer rating; a low rating can require an explanation in another field"""
+
+    def __init__(self, key, column, minimum=1, maximum=5, explain=None, explain_below=3):
+        self.key = key
+        self.column = column
+        self.required = False
+        self.minimum = minimum
+        self.maximum = maximum
+        # Key of the Text field that must explain a rating below explain_below
+        self.explain = explain
+        self.explain_below = explain_below
+
+
+class Email:
+    """Email address, required always or only when another field has a given value"""
+
+    def __init__(self, key, column, required=False, required_when=None,
+                 required_error='Email is required when willing to be contacted'):
+        self.key = key
+        self.column = column
+        self.required = required
+        # (key, value) that makes the address mandatory
+        self.required_when = required_when
+        self.required_error = required_error
+
+
+class Choice:
+    """Value that must be one of `choices`, stored as sent"""
+
+    def __init__(self, key, column, choices, error, required=True):
+        self.key = key
+        self.column = column
+        self.choices = tuple(choices)
+        self.error = error
+        self.required = required
+
+
+class Derived:
+    """Column computed by `function` from the raw value of another key"""
+
+    def __init__(self, column, source, function):
+        self.column = column
+        self.source = source
+        self.function = function
+        self.required = False
+
+
+def compile_validator(fields, first_error_only=False, name='validate'):
+    """Compile a schema into `name(data) -> (errors, values)`.
+
+    `errors` is a list of messages (at most one with first_error_only);
+    `values` maps column names to normalized values, or is None on errors.
+    The generated source is kept on the function as `.source`.
+    """
+    keys = {field.key for field in fields if not isinstance(field, Derived)}
+    unlisted = {field.explain for field in fields if isinstance(field, Rating) and field.explain} - keys
+    if unlisted:
+        raise ValueError(f"Explanation fields missing from the schema: {', '.join(sorted(unlisted))}")
+
+    lines = [f'def {name}(data):', '    errors = []']
+    namespace = {}
+    raw = {}
+
+    def emit(line, depth=1):
+        lines.append('    ' * depth + line)
+
+    def error(message, depth):
+        if first_error_only:
+            emit(f'return [{message!r}], None', depth)
+        else:
+            emit(f'errors.append({message!r})', depth)
+
+    def raw_value(key):
+        # Read each key at most once; later steps reuse the local
+        if key not in raw:
+            raw[key] = f'raw_{len(raw)}'
+            emit(f'{raw[key]} = data.get({key!r})')
+        return raw[key]
+
+    for field in fields:
+        if field.required:
+            emit(f'if not {raw_value(field.key)}:')
+            error(f'{field.key} is required', 2)
+
+    ratings = {}
+    for field in fields:
+        if isinstance(field, Rating):
+            value = ratings[field.key] = f'rating_{len(ratings)}'
+            emit(f'{value} = None')
+            emit(f'if {raw_value(field.key)}:')
+            emit('try:', 2)
+            emit(f'{value} = int({raw[field.key]})', 3)
+            emit('except (ValueError, TypeError):', 2)
+            error(f'{field.key} must be a valid number', 3)
+            emit('else:', 2)
+            emit(f'if {value} < {field.minimum} or {value} > {field.maximum}:', 3)
+            error(f'{field.key} must be between {field.minimum} and {field.maximum}', 4)
+
+    explanations = {}
+    for field in fields:
+        if isinstance(field, Rating) and field.explain:
+            explain_key = field.explain
+            value = explanations[explain_key] = f'explanation_{len(explanations)}'
+            emit(f'{value} = None')
+            emit(f'if {ratings[field.key]} is not None and {ratings[field.key]} < {field.explain_below}:')
+            emit(f"{value} = data.get({explain_key!r}, '').strip()", 2)
+            emit(f'if not {value}:', 2)
+            error(f"Please explain what you didn't like for {field.key} (rating below {field.explain_below})", 3)
+
+    emails = {}
+    for field in fields:
+        if isinstance(field, Email):
+            value = emails[field.key] = f'email_{len(emails)}'
+            if field.required_when:
+                when_key, when_value = field.required_when
+                emit(f'{value} = None')
+                emit(f'if {raw_value(when_key)} == {when_value!r}:')
+                emit(f"{value} = data.get({field.key!r}, '').strip()", 2)
+                emit(f'if not {value}:', 2)
+                error(field.required_error, 3)
+                emit(f"elif '@' not in {value} or '.' not in {value}:", 2)
+                error('Please provide a valid email address', 3)
+            else:
+                emit(f"{value} = data.get({field.key!r}, '').strip()")
+                emit(f"if '@' not in {value} or '.' not in {value}:")
+                error('Please provide a valid email address', 2)
+
+    for field in fields:
+        if isinstance(field, Choice):
+            emit(f'if {raw_value(field.key)} not in {field.choices!r}:')
+            error(field.error, 2)
+
+    emit('if errors:')
+    emit('return errors, None', 2)
+
+    emit('return errors, {')
+    for field in fields:
+        if isinstance(field, Rating):
+            emit(f'{field.column!r}: {ratings[field.key]},', 2)
+        elif isinstance(field, Choice):
+            emit(f'{field.column!r}: {raw[field.key]},', 2)
+        elif isinstance(field, Derived):
+            function = f'derive_{len(namespace)}'
+            namespace[function] = field.function
+            emit(f"{field.column!r}: {function}(data.get({field.source!r}, '')),", 2)
+        elif isinstance(field, Email) and field.required_when:
+            value = emails[field.key]
+            emit(f"{field.column!r}: ({value} if {value} is not None else data.get({field.key!r}, '').strip()) or None,", 2)
+        elif isinstance(field, Email):
+            emit(f'{field.column!r}: {emails[field.key]},', 2)
+        elif field.required:
+            emit(f'{field.column!r}: {raw[field.key]}.strip(),', 2)
+        elif field.key in explanations:
+            value = explanations[field.key]
+            emit(f"{field.column!r}: ({value} if {value} is not None else data.get({field.key!r}, '').strip()) or None,", 2)
+        else:
+            emit(f"{field.column!r}: data.get({field.key!r}, '').strip() or None,", 2)
+    emit('}')
+
+    source = '\n'.join(lines) + '\n'
+    exec(compile(source, f'<validator {name}>', 'exec'), namespace)
+    function = namespace[name]
+    function.source = source
+    return function